@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Benchmark Suite
+Repeatable benchmarks for flask_server.py's endpoints, run in-process against
+a temporary database: check-in insert throughput, list latency as the table
+grows (10k, 100k and 1M rows by default) and health probe cost. Results can
+be saved as a JSON baseline and later runs compared against it.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Dict, Any, List
+
+from daycare_stats import summarize_latencies
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+PRELOAD_CHUNK = 50_000
+
+
+@dataclass
+class Metric:
+    """One benchmark result; `value` is the median across trials."""
+    name: str
+    unit: str
+    value: float
+    higher_is_better: bool = False
+    trials: List[float] = field(default_factory=list)
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+
+
+def measure(call: Callable[[], Any], iterations: int, trials: int = 5,
+            warmup: int = 1) -> Dict[str, Any]:
+    """
+    Time `call` in repeated trials with perf_counter_ns.
+
+    Args:
+        call (Callable): One operation; it should raise on failure
+        iterations (int): Calls per trial
+        trials (int): Measured trials
+        warmup (int): Unmeasured trials run first (caches, JIT-free warm paths)
+
+    Returns:
+        Dict[str, Any]: per-trial mean ms/call, per-trial ops/s and the
+        distribution of every individual call in ms
+    """
+    for _ in range(warmup * iterations):
+        call()
+    trial_ms, trial_ops, samples = [], [], []
+    for _ in range(trials):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            t0 = time.perf_counter_ns()
+            call()
+            samples.append((time.perf_counter_ns() - t0) / 1e6)
+        elapsed_ns = time.perf_counter_ns() - start
+        trial_ms.append(elapsed_ns / 1e6 / iterations)
+        trial_ops.append(iterations / (elapsed_ns / 1e9))
+    return {'trial_ms': trial_ms, 'trial_ops': trial_ops,
+            'latency_ms': summarize_latencies(samples)}
+
+
+def latency_metric(name: str, result: Dict[str, Any]) -> Metric:
+    return Metric(name, 'ms', statistics.median(result['trial_ms']),
+                  trials=result['trial_ms'], latency_ms=result['latency_ms'])
+
+
+def throughput_metric(name: str, result: Dict[str, Any]) -> Metric:
+    return Metric(name, 'ops/s', statistics.median(result['trial_ops']), higher_is_better=True,
+                  trials=result['trial_ops'], latency_ms=result['latency_ms'])
+
+
+def preload_rows(db_path: str, target: int) -> int:
+    """
+    Grow the checkins table to `target` rows with bulk inserts.
+
+    Returns:
+        int: Number of rows added
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        existing = conn.execute('SELECT COUNT(*) FROM checkins').fetchone()[0]
+        base = datetime(2024, 1, 1, 7, 0)
+        added = 0
+        while existing + added < target:
+            chunk = min(PRELOAD_CHUNK, target - existing - added)
+            first = existing + added
+            conn.executemany(
+                'INSERT INTO checkins (client_name, check_in_time) VALUES (?, ?)',
+                ((f"Child {i:07d}", (base + timedelta(seconds=i * 7)).isoformat())
+                 for i in range(first, first + chunk))
+            )
+            conn.commit()
+            added += chunk
+        return added
+    finally:
+        conn.close()
+
+
+def run_suite(sizes=DEFAULT_SIZES, trials: int = 5, warmup: int = 1,
+              insert_ops: int = 500, list_ops: int = 50, full_list_max: int = 100_000,
+              db_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run every benchmark on a fresh temporary database.
+
+    Args:
+        sizes: Table sizes at which list latency is measured
+        trials (int): Measured trials per benchmark
+        warmup (int): Warmup trials per benchmark
+        insert_ops (int): Check-ins posted per insert trial
+        list_ops (int): Requests per list trial
+        full_list_max (int): Largest table size at which the unpaged list is timed
+        db_dir (Optional[str]): Directory for the temporary database
+
+    Returns:
+        Dict[str, Any]: Run metadata and metrics keyed by name
+    """
+    import flask_server
+
+    workdir = tempfile.mkdtemp(prefix='tothub_bench_', dir=db_dir)
+    flask_server.DATABASE_PATH = os.path.join(workdir, 'daycare_checkins.db')
+    flask_server.init_database()
+    client = flask_server.app.test_client()
+    metrics: List[Metric] = []
+
+    def expect(response, status: int = 200):
+        if response.status_code != status:
+            raise RuntimeError(f"{response.request.path}: HTTP {response.status_code}")
+        return response
+
+    try:
+        print("⏱  health probe")
+        metrics.append(latency_metric('health_ms', measure(
+            lambda: expect(client.get('/health')), list_ops * 4, trials, warmup)))
+
+        print("⏱  check-in insert")
+        counter = iter(range(10 ** 9))
+        metrics.append(throughput_metric('insert_ops_per_s', measure(
+            lambda: expect(client.post('/checkin', json={'client_name': f"Bench {next(counter)}"}), 201),
+            insert_ops, trials, warmup)))
+
+        for size in sorted(sizes):
+            start = time.perf_counter()
+            added = preload_rows(flask_server.DATABASE_PATH, size)
+            print(f"⏱  list at {size:,} rows (preloaded {added:,} in {time.perf_counter() - start:.1f}s)")
+            metrics.append(latency_metric(f"list_page_100_{size}_ms", measure(
+                lambda: expect(client.get('/checkins', query_string={'limit': 100})),
+                list_ops, trials, warmup)))
+            metrics.append(latency_metric(f"list_since_id_{size}_ms", measure(
+                lambda: expect(client.get('/checkins', query_string={
+                    'since_id': size - 100, 'limit': 100})),
+                list_ops, trials, warmup)))
+            if size <= full_list_max:
+                # The unpaged list grows with the table, so fewer iterations
+                metrics.append(latency_metric(f"list_all_{size}_ms", measure(
+                    lambda: expect(client.get('/checkins')),
+                    max(1, list_ops * 1000 // size), trials, warmup)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sqlite': sqlite3.sqlite_version,
+        'params': {'sizes': list(sizes), 'trials': trials, 'warmup': warmup,
+                   'insert_ops': insert_ops, 'list_ops': list_ops},
+        'metrics': {m.name: asdict(m) for m in metrics},
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compare a run against a baseline.
+
+    A metric regresses when it is worse than the baseline by more than
+    `tolerance` (a fraction: 0.10 = 10%). Metrics missing from either side
+    are skipped.
+
+    Returns:
+        List[Dict[str, Any]]: One row per shared metric with the relative change
+    """
+    rows = []
+    for name, metric in current['metrics'].items():
+        base = baseline.get('metrics', {}).get(name)
+        if not base or not base['value']:
+            continue
+        change = (metric['value'] - base['value']) / base['value']
+        worse = -change if metric['higher_is_better'] else change
+        rows.append({
+            'name': name,
+            'unit': metric['unit'],
+            'baseline': base['value'],
+            'current': metric['value'],
+            'change': change,
+            'regressed': worse > tolerance,
+        })
+    return rows
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    print("\n" + "=" * 78)
+    print(f"{'Metric':<32} {'Median':>12} {'Unit':<6} {'p95 ms':>10} {'Trial spread':>14}")
+    print("=" * 78)
+    for metric in results['metrics'].values():
+        trials = metric['trials']
+        spread = (max(trials) - min(trials)) / metric['value'] if metric['value'] else 0.0
+        print(f"{metric['name']:<32} {metric['value']:>12.3f} {metric['unit']:<6} "
+              f"{metric['latency_ms']['p95']:>10.3f} {spread:>13.1%}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], tolerance: float) -> None:
+    print("\n" + "=" * 78)
+    print(f"Comparison against baseline (tolerance {tolerance:.0%})")
+    print("=" * 78)
+    for row in rows:
+        mark = '✗ REGRESSION' if row['regressed'] else '✓'
+        print(f"{row['name']:<32} {row['baseline']:>11.3f} → {row['current']:>11.3f} "
+              f"{row['unit']:<6} {row['change']:>+8.1%}  {mark}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the check-in server endpoints')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated table sizes for list benchmarks')
+    parser.add_argument('--trials', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--insert-ops', type=int, default=500)
+    parser.add_argument('--list-ops', type=int, default=50)
+    parser.add_argument('--full-list-max', type=int, default=100_000,
+                        help='Largest table size at which to time the unpaged list')
+    parser.add_argument('--save', metavar='PATH', help='Write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='Compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed regression as a fraction (default: 0.10)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = run_suite(sizes, args.trials, args.warmup, args.insert_ops,
+                        args.list_ops, args.full_list_max)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.tolerance)
+        print_comparison(rows, args.tolerance)
+        regressions = [row['name'] for row in rows if row['regressed']]
+        if regressions:
+            print(f"\n❌ {len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Bulk Async Client
+Asyncio client for high-concurrency check-ins and roster imports.
+
+Requests are issued from a bounded worker pool so a roster of any size can be
+replayed against the server at a controlled concurrency and target rate.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from daycare_resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, call_with_retry
+from daycare_stats import summarize_latencies
+
+
+@dataclass
+class CheckinResult:
+    """Outcome of a single check-in request."""
+    client_name: str
+    ok: bool
+    status_code: Optional[int]
+    latency_ms: float
+    checkin_id: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int = 1
+
+
+@dataclass
+class BulkCheckinReport:
+    """Aggregated results of a bulk check-in run."""
+    results: List[CheckinResult]
+    elapsed_s: float
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the whole run."""
+        return len(self.results) / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def attempts(self) -> int:
+        return sum(r.attempts for r in self.results)
+
+    def error_counts(self) -> Dict[str, int]:
+        """Count failures by error message (or HTTP status)."""
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            if result.ok:
+                continue
+            key = result.error or f"HTTP {result.status_code}"
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary of the run."""
+        return {
+            'total': len(self.results),
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed_s': round(self.elapsed_s, 3),
+            'throughput_rps': round(self.throughput, 1),
+            'attempts': self.attempts,
+            'retry_amplification': round(self.attempts / len(self.results), 3)
+                                   if self.results else 0.0,
+            'latency_ms': summarize_latencies(r.latency_ms for r in self.results),
+            'errors': self.error_counts(),
+        }
+
+
+class _RatePacer:
+    """Spaces request start times evenly to hold a target requests/second."""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncCheckinClient:
+    """
+    Asyncio check-in client with bounded concurrency.
+
+    HTTP calls run on a dedicated thread pool (one pooled session per thread),
+    so the event loop only schedules work and never blocks on the network.
+
+    Example:
+        async with AsyncCheckinClient('http://localhost:5001', concurrency=50) as client:
+            report = await client.checkin_many(names)
+    """
+
+    def __init__(self, server_url: str, concurrency: int = 32,
+                 timeout: float = 10.0, rate: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            server_url (str): The base URL of the server
+            concurrency (int): Maximum number of requests in flight
+            timeout (float): Per-request connect/read timeout in seconds
+            rate (Optional[float]): Target requests per second (None = unlimited)
+            retry_policy (Optional[RetryPolicy]): Retry/backoff settings (None = no retries)
+            breaker (Optional[CircuitBreaker]): Breaker shared by all requests
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.checkin_url = f"{server_url.rstrip('/')}/checkin"
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.rate = rate
+        self.retry_policy = retry_policy
+        self.breaker = breaker
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            thread_name_prefix='checkin')
+        self._local = threading.local()
+        self._pacer: Optional[_RatePacer] = None
+
+    async def __aenter__(self) -> 'AsyncCheckinClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+
+    def _post_checkin(self, client_name: str) -> CheckinResult:
+        start = time.perf_counter()
+        # One key and arrival time for every attempt, so a retry after a
+        # gateway error that hid a committed insert comes back as a duplicate
+        payload = {
+            'client_name': client_name,
+            'check_in_time': datetime.now().isoformat(),
+            'idempotency_key': str(uuid.uuid4())
+        }
+        try:
+            outcome = call_with_retry(
+                lambda: self._session().post(
+                    self.checkin_url,
+                    json=payload,
+                    timeout=self.timeout
+                ),
+                self.retry_policy, self.breaker
+            )
+            response = outcome.response
+            latency_ms = outcome.latency_ms
+            checkin_id = None
+            error = None
+            try:
+                data = response.json()
+                checkin_id = data.get('checkin_id')
+                error = data.get('error')
+            except ValueError:
+                pass
+            # 200 is a retry the server had already recorded
+            ok = response.status_code in (200, 201)
+            return CheckinResult(client_name, ok, response.status_code, latency_ms, checkin_id,
+                                 None if ok else error, outcome.attempts)
+        except CircuitOpenError as e:
+            error, attempts = 'circuit open', e.attempts
+        except requests.exceptions.ConnectionError as e:
+            error, attempts = 'connection error', getattr(e, 'attempts', 1)
+        except requests.exceptions.Timeout as e:
+            error, attempts = 'timeout', getattr(e, 'attempts', 1)
+        except requests.exceptions.RequestException as e:
+            error, attempts = f"request failed: {e}", getattr(e, 'attempts', 1)
+        return CheckinResult(client_name, False, None,
+                             (time.perf_counter() - start) * 1000, error=error,
+                             attempts=attempts)
+
+    async def checkin(self, client_name: str) -> CheckinResult:
+        """Check in a single client without blocking the event loop."""
+        if self._pacer is None:
+            self._pacer = _RatePacer(self.rate)
+        await self._pacer.wait()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._post_checkin, client_name)
+
+    async def checkin_many(self, client_names: Iterable[str]) -> BulkCheckinReport:
+        """
+        Check in every name from an iterable.
+
+        Names are pulled lazily by `concurrency` workers, so arbitrarily
+        large rosters are streamed rather than materialized as tasks.
+
+        Args:
+            client_names (Iterable[str]): Names to check in
+
+        Returns:
+            BulkCheckinReport: Per-request results and aggregate timings
+        """
+        names: Iterator[str] = iter(client_names)
+        results: List[CheckinResult] = []
+
+        async def worker() -> None:
+            for name in names:
+                results.append(await self.checkin(name))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return BulkCheckinReport(results, time.perf_counter() - start)
+
+
+def bulk_checkin(server_url: str, client_names: Iterable[str], concurrency: int = 32,
+                 timeout: float = 10.0, rate: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None) -> BulkCheckinReport:
+    """
+    Synchronous wrapper that runs a bulk check-in to completion.
+
+    Args:
+        server_url (str): The base URL of the server
+        client_names (Iterable[str]): Names to check in
+        concurrency (int): Maximum number of requests in flight
+        timeout (float): Per-request timeout in seconds
+        rate (Optional[float]): Target requests per second (None = unlimited)
+        retry_policy (Optional[RetryPolicy]): Retry/backoff settings (None = no retries)
+        breaker (Optional[CircuitBreaker]): Breaker shared by all requests
+
+    Returns:
+        BulkCheckinReport: Per-request results and aggregate timings
+    """
+    async def run() -> BulkCheckinReport:
+        async with AsyncCheckinClient(server_url, concurrency, timeout, rate,
+                                      retry_policy, breaker) as client:
+            return await client.checkin_many(client_names)
+
+    return asyncio.run(run())
+
+
+def read_roster(csv_path: str, column: str = 'client_name') -> Iterator[str]:
+    """
+    Stream client names from a CSV file.
+
+    If the first row contains `column` it is treated as a header and that
+    column is used; otherwise every row's first field is a name.
+    """
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            return
+        if column in first:
+            index = first.index(column)
+        else:
+            index = 0
+            if first and first[0].strip():
+                yield first[0].strip()
+        for row in reader:
+            if len(row) > index and row[index].strip():
+                yield row[index].strip()
+
+
+def print_report(report: BulkCheckinReport) -> None:
+    """Print a human-readable summary of a bulk run."""
+    summary = report.summary()
+    latency = summary['latency_ms']
+    print("\n" + "=" * 60)
+    print(f"Check-ins: {summary['total']}  "
+          f"succeeded: {summary['succeeded']}  failed: {summary['failed']}")
+    print(f"Elapsed: {summary['elapsed_s']:.2f}s  "
+          f"Throughput: {summary['throughput_rps']:.1f} req/s  "
+          f"Attempts/request: {summary['retry_amplification']:.2f}")
+    print(f"Latency ms  p50: {latency['p50']:.1f}  p95: {latency['p95']:.1f}  "
+          f"p99: {latency['p99']:.1f}  max: {latency['max']:.1f}")
+    for error, count in summary['errors'].items():
+        print(f"  ✗ {error}: {count}")
+    print("=" * 60)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Bulk-import check-ins from a CSV roster')
+    parser.add_argument('csv_path', help='CSV file with one client name per row')
+    parser.add_argument('--server', default='http://localhost:5001', help='Server base URL')
+    parser.add_argument('--column', default='client_name', help='Header of the name column')
+    parser.add_argument('--concurrency', type=int, default=32, help='Requests in flight')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Target requests/second (0 = as fast as possible)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout (s)')
+    parser.add_argument('--retries', type=int, default=0,
+                        help='Retries per request with jittered exponential backoff')
+    parser.add_argument('--breaker', action='store_true',
+                        help='Fail fast through a circuit breaker while the server is down')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    retry_policy = RetryPolicy(max_attempts=args.retries + 1) if args.retries else None
+    report = bulk_checkin(args.server, read_roster(args.csv_path, args.column),
+                          concurrency=args.concurrency, timeout=args.timeout,
+                          rate=args.rate or None, retry_policy=retry_policy,
+                          breaker=CircuitBreaker() if args.breaker else None)
+
+    if args.json:
+        print(json.dumps(report.summary(), indent=2))
+    else:
+        print_report(report)
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
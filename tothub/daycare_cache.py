@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Client-side Check-in Cache
+Local SQLite cache of check-in rows per server, synced incrementally using
+the server's id watermark, epoch and ETag.
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+
+def default_cache_path() -> str:
+    """Cache location: $TOTHUB_CACHE_DIR or ~/.cache/tothub."""
+    cache_dir = os.environ.get('TOTHUB_CACHE_DIR') or Path.home() / '.cache' / 'tothub'
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    return str(Path(cache_dir) / 'checkins_cache.db')
+
+
+@dataclass
+class SyncState:
+    """What the cache knows about one server."""
+    epoch: Optional[str] = None
+    high_water: int = 0
+    etag: Optional[str] = None
+
+
+class CheckinCache:
+    """
+    Cache of check-in rows keyed by server URL.
+
+    Rows are immutable on the server, so the cache only ever needs rows with
+    an id above its high-water mark. A change of server epoch (a recreated
+    database) invalidates everything cached for that server.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_cache_path()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS cached_checkins (
+                server_url TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                client_name TEXT NOT NULL,
+                check_in_time TEXT NOT NULL,
+                PRIMARY KEY (server_url, id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_cached_checkins_time
+                ON cached_checkins (server_url, check_in_time DESC, id DESC);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                server_url TEXT PRIMARY KEY,
+                epoch TEXT,
+                high_water INTEGER NOT NULL DEFAULT 0,
+                etag TEXT
+            );
+        ''')
+        self._conn.commit()
+
+    @staticmethod
+    def _key(server_url: str) -> str:
+        return server_url.rstrip('/')
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def state(self, server_url: str) -> SyncState:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT epoch, high_water, etag FROM sync_state WHERE server_url = ?',
+                (self._key(server_url),)
+            ).fetchone()
+        return SyncState(*row) if row else SyncState()
+
+    def reset(self, server_url: str) -> None:
+        """Forget everything cached for a server."""
+        key = self._key(server_url)
+        with self._lock:
+            self._conn.execute('DELETE FROM cached_checkins WHERE server_url = ?', (key,))
+            self._conn.execute('DELETE FROM sync_state WHERE server_url = ?', (key,))
+            self._conn.commit()
+
+    def merge(self, server_url: str, rows: Iterable[Dict[str, Any]],
+              epoch: Optional[str], high_water: int, etag: Optional[str]) -> int:
+        """
+        Add newly fetched rows and advance the watermark in one transaction.
+
+        Returns:
+            int: Number of rows written
+        """
+        key = self._key(server_url)
+        params = [(key, r['id'], r['client_name'], r['check_in_time']) for r in rows]
+        with self._lock:
+            self._conn.executemany('''
+                INSERT OR REPLACE INTO cached_checkins (server_url, id, client_name, check_in_time)
+                VALUES (?, ?, ?, ?)
+            ''', params)
+            self._conn.execute('''
+                INSERT INTO sync_state (server_url, epoch, high_water, etag) VALUES (?, ?, ?, ?)
+                ON CONFLICT (server_url) DO UPDATE SET
+                    epoch = excluded.epoch, high_water = excluded.high_water, etag = excluded.etag
+            ''', (key, epoch, high_water, etag))
+            self._conn.commit()
+        return len(params)
+
+    def rows(self, server_url: str) -> List[Dict[str, Any]]:
+        """Cached rows in the server's order (newest check-in first)."""
+        with self._lock:
+            cursor = self._conn.execute('''
+                SELECT id, client_name, check_in_time FROM cached_checkins
+                WHERE server_url = ? ORDER BY check_in_time DESC, id DESC
+            ''', (self._key(server_url),))
+            return [{'id': r[0], 'client_name': r[1], 'check_in_time': r[2]}
+                    for r in cursor.fetchall()]
+
+    def count(self, server_url: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM cached_checkins WHERE server_url = ?',
+                (self._key(server_url),)
+            ).fetchone()[0]
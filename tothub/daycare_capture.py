@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Request Capture
+Compact binary access log kept in a fixed-size ring file: one 128-byte record
+per request (timestamp, latency, status, method, body size, path), written
+through mmap so capturing costs a struct pack rather than a log line.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, List, Iterator
+
+MAGIC = b'TOTCAP1\x00'
+# magic, record size, capacity, total records ever written
+HEADER = struct.Struct('<8sIIQ')
+HEADER_SIZE = 64
+# Bytes of UTF-8 path (with query) kept per record; longer paths are truncated
+PATH_SIZE = 108
+# timestamp, latency_ms, status, method code, body size, path
+RECORD = struct.Struct(f'<dfHBxI{PATH_SIZE}s')
+
+METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS']
+
+
+@dataclass
+class CapturedRequest:
+    """One captured request."""
+    timestamp: float
+    latency_ms: float
+    status: int
+    method: str
+    body_size: int
+    path: str
+
+    @property
+    def route(self) -> str:
+        """Method and path without the query string, e.g. 'GET /checkins'."""
+        return f"{self.method} {self.path.split('?', 1)[0]}"
+
+
+class CaptureRing:
+    """
+    Ring file of captured requests.
+
+    The file is preallocated for `capacity` records; once full, the oldest
+    records are overwritten. Reopening an existing capture with the same
+    capacity continues where it left off.
+    """
+
+    def __init__(self, path: str, capacity: int = 100_000):
+        """
+        Args:
+            path (str): Capture file
+            capacity (int): Number of records kept
+        """
+        self.path = path
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        size = HEADER_SIZE + capacity * RECORD.size
+        self._seq = 0
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == size:
+                magic, record_size, existing, seq = HEADER.unpack(os.pread(fd, HEADER.size, 0))
+                if magic == MAGIC and record_size == RECORD.size and existing == capacity:
+                    self._seq = seq
+            os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        HEADER.pack_into(self._map, 0, MAGIC, RECORD.size, capacity, self._seq)
+
+    def record(self, method: str, path: str, status: int, latency_ms: float,
+               body_size: int = 0, timestamp: Optional[float] = None) -> None:
+        """
+        Append one request, overwriting the oldest record once the ring is full.
+
+        `timestamp` should be when the request arrived (wall clock); it
+        defaults to now.
+        """
+        method_code = METHODS.index(method) if method in METHODS else 255
+        # Cut to the field width without splitting a multi-byte character
+        encoded = path.encode('utf-8')[:PATH_SIZE].decode('utf-8', 'ignore').encode('utf-8')
+        with self._lock:
+            offset = HEADER_SIZE + (self._seq % self.capacity) * RECORD.size
+            RECORD.pack_into(self._map, offset, time.time() if timestamp is None else timestamp, latency_ms,
+                             min(status, 0xFFFF), method_code, min(body_size, 0xFFFFFFFF), encoded)
+            self._seq += 1
+            HEADER.pack_into(self._map, 0, MAGIC, RECORD.size, self.capacity, self._seq)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._map.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._map.flush()
+            self._map.close()
+
+
+def read_capture(path: str) -> List[CapturedRequest]:
+    """
+    Read every record still in a capture file, oldest first.
+
+    Raises:
+        ValueError: If the file is not a capture ring
+    """
+    return list(iter_capture(path))
+
+
+def iter_capture(path: str) -> Iterator[CapturedRequest]:
+    with open(path, 'rb') as f:
+        magic, record_size, capacity, seq = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a request capture file")
+        count = min(seq, capacity)
+        first = seq - count
+        for n in range(first, seq):
+            f.seek(HEADER_SIZE + (n % capacity) * RECORD.size)
+            timestamp, latency_ms, status, method_code, body_size, raw_path = \
+                RECORD.unpack(f.read(RECORD.size))
+            method = METHODS[method_code] if method_code < len(METHODS) else 'OTHER'
+            yield CapturedRequest(timestamp, latency_ms, status, method, body_size,
+                                  raw_path.rstrip(b'\x00').decode('utf-8', 'replace'))
@@ -4,39 +4,83 @@ Daycare Check-in System - Client Functions
 Client-side functions for interacting with the Flask server.
 """
 
+import argparse
+import itertools
 import requests
 import json
+import subprocess
+import sys
+import time
+import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Callable, TextIO
 
-def perform_checkin(server_url: str, client_name: str) -> None:
+from daycare_resilience import (RetryPolicy, CircuitBreaker, CallStats,
+                                CircuitOpenError, call_with_retry)
+from daycare_journal import CheckinJournal, JournalFullError
+from daycare_cache import CheckinCache
+
+def perform_checkin(server_url: str, client_name: str,
+                    retry_policy: Optional[RetryPolicy] = None,
+                    breaker: Optional[CircuitBreaker] = None,
+                    stats: Optional[CallStats] = None,
+                    journal: Optional[CheckinJournal] = None) -> bool:
     """
     Perform a check-in by sending a POST request to the server.
     
+    Every request carries an idempotency key and the original check-in time.
+    If a journal is given and the server cannot be reached, the check-in is
+    saved to the journal (with the same key) for later replay instead of
+    being lost.
+    
     Args:
         server_url (str): The base URL of the server (e.g., 'http://localhost:5000')
         client_name (str): The name of the client checking in
+        retry_policy (Optional[RetryPolicy]): Retry/backoff settings (None = no retries)
+        breaker (Optional[CircuitBreaker]): Breaker shared by calls to this server
+        stats (Optional[CallStats]): Counters for attempts and latency
+        journal (Optional[CheckinJournal]): Offline journal used when the server is unreachable
+        
+    Returns:
+        bool: True if the check-in was recorded (on the server or in the journal)
     """
+    # Prepare the JSON payload
+    payload = {
+        'client_name': client_name,
+        'check_in_time': datetime.now().isoformat(),
+        'idempotency_key': str(uuid.uuid4())
+    }
+    
+    def save_offline() -> bool:
+        if journal is None:
+            return False
+        try:
+            journal.append(client_name, payload['check_in_time'], payload['idempotency_key'])
+        except JournalFullError as e:
+            print(f"✗ Error: {e}")
+            return False
+        print("⚠️  Check-in saved to offline journal and will be sent when the server is back")
+        return True
+    
     try:
         # Prepare the endpoint URL
         checkin_url = f"{server_url.rstrip('/')}/checkin"
         
-        # Prepare the JSON payload
-        payload = {
-            'client_name': client_name
-        }
-        
         # Send POST request
         print(f"Sending check-in request for: {client_name}")
-        response = requests.post(
-            checkin_url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=10
+        outcome = call_with_retry(
+            lambda: requests.post(
+                checkin_url,
+                json=payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            ),
+            retry_policy, breaker, stats
         )
+        response = outcome.response
         
         # Print the server's response
-        print(f"Server Response (Status: {response.status_code}):")
+        print(f"Server Response (Status: {response.status_code}, attempts: {outcome.attempts}):")
         
         try:
             response_data = response.json()
@@ -45,27 +89,44 @@ def perform_checkin(server_url: str, client_name: str) -> None:
             print(f"Raw response: {response.text}")
         
         # Check if request was successful
-        if response.status_code == 201:
+        if response.status_code in (200, 201):
             print("✓ Check-in successful!")
+            return True
+        elif response.status_code >= 500:
+            print("✗ Check-in failed!")
+            return save_offline()
         else:
             print("✗ Check-in failed!")
+            return False
             
+    except CircuitOpenError:
+        print(f"✗ Error: Server at {server_url} is marked unavailable, not retrying yet")
+        return save_offline()
     except requests.exceptions.ConnectionError:
         print(f"✗ Error: Could not connect to server at {server_url}")
         print("Make sure the server is running on the specified URL")
+        return save_offline()
     except requests.exceptions.Timeout:
         print("✗ Error: Request timed out")
+        return save_offline()
     except requests.exceptions.RequestException as e:
         print(f"✗ Error: Request failed - {e}")
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
+    return False
 
-def get_all_checkins(server_url: str) -> Optional[Dict[str, Any]]:
+def get_all_checkins(server_url: str, cache: Optional[CheckinCache] = None) -> Optional[Dict[str, Any]]:
     """
     Retrieve all check-in records from the server.
     
+    With a cache, only rows newer than the cached high-water mark are
+    downloaded (and nothing at all when the server answers 304 Not Modified),
+    then merged into the local copy. A full download happens only when the
+    server reports that the cache belongs to a different database.
+    
     Args:
         server_url (str): The base URL of the server
+        cache (Optional[CheckinCache]): Local cache to sync incrementally
         
     Returns:
         Optional[Dict[str, Any]]: Server response data or None if failed
@@ -74,6 +135,9 @@ def get_all_checkins(server_url: str) -> Optional[Dict[str, Any]]:
         # Prepare the endpoint URL
         checkins_url = f"{server_url.rstrip('/')}/checkins"
         
+        if cache is not None:
+            return sync_checkins(checkins_url, server_url, cache)
+        
         # Send GET request
         print("Retrieving all check-in records...")
         response = requests.get(checkins_url, timeout=10)
@@ -101,6 +165,164 @@ def get_all_checkins(server_url: str) -> Optional[Dict[str, Any]]:
         print(f"✗ Unexpected error: {e}")
         return None
 
+def sync_checkins(checkins_url: str, server_url: str, cache: CheckinCache) -> Optional[Dict[str, Any]]:
+    """Bring the cache up to date and return its contents in get_all_checkins' shape."""
+    state = cache.state(server_url)
+    params = {'since_id': state.high_water}
+    if state.epoch:
+        params['epoch'] = state.epoch
+    headers = {'If-None-Match': state.etag} if state.etag else {}
+    
+    print("Syncing check-in records...")
+    response = requests.get(checkins_url, params=params, headers=headers, timeout=10)
+    
+    if response.status_code == 304:
+        new_rows = 0
+    elif response.status_code == 200:
+        data = response.json()
+        if data.get('resync_required'):
+            print("Server data changed, performing full resync...")
+            cache.reset(server_url)
+            response = requests.get(checkins_url, params={'since_id': 0}, timeout=10)
+            if response.status_code != 200:
+                print(f"✗ Failed to retrieve records (Status: {response.status_code})")
+                return None
+            data = response.json()
+        new_rows = cache.merge(server_url, data['checkins'], data.get('epoch'),
+                               data.get('max_id', state.high_water), response.headers.get('ETag'))
+    else:
+        print(f"✗ Failed to retrieve records (Status: {response.status_code})")
+        print(response.text)
+        return None
+    
+    checkins = cache.rows(server_url)
+    print(f"✓ Retrieved {len(checkins)} check-in records ({new_rows} new)")
+    return {
+        'success': True,
+        'count': len(checkins),
+        'new': new_rows,
+        'checkins': checkins
+    }
+
+def iter_checkins(server_url: str, page_size: int = 1000, since: Optional[str] = None,
+                  limit: Optional[int] = None, ndjson: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Stream check-in records from the server in id order.
+    
+    Rows are fetched page by page (keyset paging on id) or, with ndjson=True,
+    read line by line from a single streamed response, so memory use does
+    not grow with the size of the history.
+    
+    Args:
+        server_url (str): The base URL of the server
+        page_size (int): Rows per request when paging
+        since (Optional[str]): Only check-ins at or after this ISO timestamp
+        limit (Optional[int]): Stop after this many rows
+        ndjson (bool): Use one streamed NDJSON response instead of pages
+        
+    Yields:
+        Dict[str, Any]: One check-in record at a time
+    """
+    checkins_url = f"{server_url.rstrip('/')}/checkins"
+    params: Dict[str, Any] = {'since_id': 0}
+    if since:
+        params['since'] = since
+    
+    if ndjson:
+        params['format'] = 'ndjson'
+        if limit is not None:
+            params['limit'] = limit
+        with requests.get(checkins_url, params=params, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(chunk_size=65536):
+                if line:
+                    yield json.loads(line)
+        return
+    
+    if page_size < 1:
+        raise ValueError('page_size must be at least 1')
+    
+    remaining = limit
+    with requests.Session() as session:
+        while remaining is None or remaining > 0:
+            params['limit'] = page_size if remaining is None else min(page_size, remaining)
+            response = session.get(checkins_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            yield from data['checkins']
+            if remaining is not None:
+                remaining -= len(data['checkins'])
+            # An empty page can't advance next_since_id, so stop rather than loop
+            if not data['checkins'] or not data.get('has_more'):
+                break
+            params['since_id'] = data['next_since_id']
+
+def render_checkins(checkins: Iterable[Dict[str, Any]], out: Optional[TextIO] = None,
+                    limit: Optional[int] = None, page_size: Optional[int] = None,
+                    sample_size: int = 200, flush_every: int = 1000,
+                    pager: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Render check-in records as a table from any iterable, in constant memory.
+    
+    Column widths come from the first `sample_size` rows (longer values in
+    later rows are truncated), output lines are buffered and written in
+    chunks, and with `page_size` the pager is asked to continue after every
+    page.
+    
+    Args:
+        checkins (Iterable[Dict[str, Any]]): Records, e.g. from iter_checkins
+        out (Optional[TextIO]): Output stream (default: sys.stdout)
+        limit (Optional[int]): Maximum number of rows to render
+        page_size (Optional[int]): Rows per page before calling the pager
+        sample_size (int): Rows used to size the columns
+        flush_every (int): Lines buffered before each write
+        pager (Optional[Callable[[], bool]]): Returns False to stop (default: prompt on a TTY)
+        
+    Returns:
+        int: Number of rows rendered
+    """
+    out = out or sys.stdout
+    rows = iter(checkins)
+    if limit is not None:
+        rows = itertools.islice(rows, limit)
+    sample = list(itertools.islice(rows, sample_size))
+    if not sample:
+        out.write("No check-in records found\n")
+        return 0
+    
+    id_width = max(5, max(len(str(r['id'])) for r in sample))
+    name_width = min(60, max(25, max(len(r['client_name']) for r in sample)))
+    time_width = max(25, max(len(r['check_in_time']) for r in sample))
+    rule = "=" * max(60, id_width + name_width + time_width + 2)
+    
+    def fit(value: str, width: int) -> str:
+        return value if len(value) <= width else value[:width - 1] + "…"
+    
+    if pager is None and page_size and out.isatty() and sys.stdin.isatty():
+        def pager() -> bool:
+            return input("-- more (Enter to continue, q to quit) --").strip().lower() != 'q'
+    
+    buffer = ["\n" + rule, f"{'ID':<{id_width}} {'Client Name':<{name_width}} {'Check-in Time':<{time_width}}", rule]
+    count = 0
+    for checkin in itertools.chain(sample, rows):
+        buffer.append(f"{checkin['id']:<{id_width}} "
+                      f"{fit(checkin['client_name'], name_width):<{name_width}} "
+                      f"{fit(checkin['check_in_time'], time_width):<{time_width}}")
+        count += 1
+        at_page_end = page_size and count % page_size == 0
+        if len(buffer) >= flush_every or at_page_end:
+            out.write("\n".join(buffer) + "\n")
+            buffer.clear()
+        if at_page_end and pager is not None:
+            out.flush()
+            if not pager():
+                break
+    
+    buffer += [rule, f"Total records: {count}\n"]
+    out.write("\n".join(buffer) + "\n")
+    out.flush()
+    return count
+
 def display_checkins(checkins_data: Dict[str, Any]) -> None:
     """
     Display check-in records in a formatted table.
@@ -112,37 +334,24 @@ def display_checkins(checkins_data: Dict[str, Any]) -> None:
         print("No check-in data to display")
         return
     
-    checkins = checkins_data['checkins']
-    
-    if not checkins:
-        print("No check-in records found")
-        return
-    
-    # Print header
-    print("\n" + "="*60)
-    print(f"{'ID':<5} {'Client Name':<25} {'Check-in Time':<25}")
-    print("="*60)
-    
-    # Print each record
-    for checkin in checkins:
-        print(f"{checkin['id']:<5} {checkin['client_name']:<25} {checkin['check_in_time']:<25}")
-    
-    print("="*60)
-    print(f"Total records: {len(checkins)}\n")
+    render_checkins(checkins_data['checkins'])
 
-def check_server_health(server_url: str) -> bool:
+def check_server_health(server_url: str, timeout: float = 5) -> bool:
     """
     Check if the server is running and healthy.
     
+    To probe many servers at once, use daycare_fleet.FleetHealthChecker.
+    
     Args:
         server_url (str): The base URL of the server
+        timeout (float): Request timeout in seconds
         
     Returns:
         bool: True if server is healthy, False otherwise
     """
     try:
         health_url = f"{server_url.rstrip('/')}/health"
-        response = requests.get(health_url, timeout=5)
+        response = requests.get(health_url, timeout=timeout)
         
         if response.status_code == 200:
             data = response.json()
@@ -159,6 +368,42 @@ def check_server_health(server_url: str) -> bool:
         print(f"✗ Health check error: {e}")
         return False
 
+def wait_for_server(server_url: str, timeout: float = 30.0, initial_delay: float = 0.05,
+                    max_delay: float = 1.0, process: Optional[subprocess.Popen] = None) -> Optional[float]:
+    """
+    Poll /health until the server answers, backing off between attempts.
+    
+    Args:
+        server_url (str): The base URL of the server
+        timeout (float): Give up after this many seconds
+        initial_delay (float): First pause between polls in seconds (doubles each time)
+        max_delay (float): Longest pause between polls in seconds
+        process (Optional[subprocess.Popen]): Server process; stop early if it exits
+        
+    Returns:
+        Optional[float]: Seconds until the server was ready, or None on timeout/exit
+    """
+    health_url = f"{server_url.rstrip('/')}/health"
+    start = time.perf_counter()
+    delay = initial_delay
+    with requests.Session() as session:
+        while True:
+            if process is not None and process.poll() is not None:
+                print(f"✗ Server process exited with code {process.returncode}")
+                return None
+            try:
+                probe_timeout = max(0.1, min(1.0, timeout - (time.perf_counter() - start)))
+                if session.get(health_url, timeout=probe_timeout).status_code == 200:
+                    return time.perf_counter() - start
+            except requests.exceptions.RequestException:
+                pass
+            remaining = timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                print(f"✗ Server at {server_url} not ready after {timeout:.1f}s")
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
 # Example usage and testing functions
 def demo_client_usage():
     """Demonstrate the client functions with example usage."""
@@ -192,6 +437,39 @@ def demo_client_usage():
     if checkins_data:
         display_checkins(checkins_data)
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def main() -> None:
+    """Command-line entry point: run the demo, or stream records with 'list'."""
+    parser = argparse.ArgumentParser(description='Daycare check-in client')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('demo', help='Run the client demo (default)')
+    list_parser = subparsers.add_parser('list', help='Stream check-in records as a table')
+    list_parser.add_argument('--server', default='http://localhost:5001', help='Server base URL')
+    list_parser.add_argument('--limit', type=positive_int, help='Maximum number of records to show')
+    list_parser.add_argument('--since', help='Only check-ins at or after this ISO timestamp')
+    list_parser.add_argument('--page', type=int, help='Pause after this many rows (on a terminal)')
+    list_parser.add_argument('--fetch-size', type=positive_int, default=1000, help='Rows per request')
+    list_parser.add_argument('--ndjson', action='store_true', help='Stream one NDJSON response')
+    args = parser.parse_args()
+    
+    if args.command == 'list':
+        try:
+            render_checkins(
+                iter_checkins(args.server, args.fetch_size, args.since, args.limit, args.ndjson),
+                page_size=args.page
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"✗ Error: Request failed - {e}")
+            sys.exit(1)
+    else:
+        demo_client_usage()
+
 if __name__ == '__main__':
     # Run the demo when script is executed directly
-    demo_client_usage()
\ No newline at end of file
+    main()
\ No newline at end of file
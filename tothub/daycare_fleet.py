@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Fleet Health Checker
+Probes the /health endpoint of every site's check-in server concurrently, so
+checking the whole fleet takes about one timeout rather than one per site.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Deque, Iterable
+
+import requests
+
+from daycare_stats import summarize_latencies
+
+
+@dataclass
+class ProbeResult:
+    """Result of one /health probe against one server."""
+    server_url: str
+    ok: bool
+    latency_ms: Optional[float]
+    status_code: Optional[int] = None
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class FleetHealthChecker:
+    """
+    Concurrent /health prober for a list of servers.
+
+    Every probe runs on its own worker thread with tight connect/read
+    timeouts, and a round is cut off at `deadline` seconds no matter how many
+    servers are slow; stragglers are reported as 'deadline exceeded'.
+    """
+
+    def __init__(self, server_urls: Iterable[str], timeout: float = 1.0,
+                 deadline: Optional[float] = None, max_workers: int = 256,
+                 window: int = 60):
+        """
+        Args:
+            server_urls (Iterable[str]): Base URLs of the servers to probe
+            timeout (float): Per-probe connect/read timeout in seconds
+            deadline (Optional[float]): Wall-clock limit for a round (default: timeout + 0.5s)
+            max_workers (int): Maximum probes in flight
+            window (int): Probes kept per server for rolling statistics
+        """
+        self.server_urls = [url.rstrip('/') for url in server_urls]
+        self.timeout = timeout
+        self.deadline = deadline if deadline is not None else timeout + 0.5
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(self.server_urls))),
+            thread_name_prefix='probe'
+        )
+        self._local = threading.local()
+        self.history: Dict[str, Deque[ProbeResult]] = {
+            url: deque(maxlen=window) for url in self.server_urls
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _probe(self, server_url: str) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            response = self._session().get(f"{server_url}/health", timeout=self.timeout)
+            latency_ms = (time.perf_counter() - start) * 1000
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+            return ProbeResult(server_url, response.status_code == 200, latency_ms,
+                               response.status_code, payload,
+                               None if response.status_code == 200 else f"HTTP {response.status_code}")
+        except requests.exceptions.ConnectionError:
+            error = 'unreachable'
+        except requests.exceptions.Timeout:
+            error = 'timeout'
+        except requests.exceptions.RequestException as e:
+            error = str(e)
+        return ProbeResult(server_url, False, (time.perf_counter() - start) * 1000, error=error)
+
+    def probe_all(self) -> List[ProbeResult]:
+        """Probe every server once, concurrently, within the round deadline."""
+        futures = {self._executor.submit(self._probe, url): url for url in self.server_urls}
+        done, _ = wait(futures, timeout=self.deadline)
+        results = []
+        for future, url in futures.items():
+            if future in done:
+                result = future.result()
+            else:
+                future.cancel()
+                result = ProbeResult(url, False, None, error='deadline exceeded')
+            self.history[url].append(result)
+            results.append(result)
+        return results
+
+    def rolling_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Availability and latency percentiles over each server's rolling window."""
+        stats = {}
+        for url, probes in self.history.items():
+            latencies = [p.latency_ms for p in probes if p.ok and p.latency_ms is not None]
+            stats[url] = {
+                'probes': len(probes),
+                'availability': (sum(1 for p in probes if p.ok) / len(probes)) if probes else 0.0,
+                'latency_ms': summarize_latencies(latencies),
+                'last_error': next((p.error for p in reversed(probes) if p.error), None),
+            }
+        return stats
+
+
+def summarize_round(results: List[ProbeResult], elapsed_s: float) -> Dict[str, Any]:
+    """Fleet-wide summary of one probe round."""
+    return {
+        'servers': len(results),
+        'healthy': sum(1 for r in results if r.ok),
+        'failed': [{'server_url': r.server_url, 'error': r.error} for r in results if not r.ok],
+        'elapsed_s': round(elapsed_s, 3),
+        'latency_ms': summarize_latencies(r.latency_ms for r in results if r.ok),
+    }
+
+
+def print_round(results: List[ProbeResult], summary: Dict[str, Any]) -> None:
+    """Print per-server results and the fleet summary as a table."""
+    width = max([len('Server')] + [len(r.server_url) for r in results])
+    print("\n" + "=" * (width + 55))
+    print(f"{'Server':<{width}} {'Status':<20} {'Latency':>10}  {'Database':<15}")
+    print("=" * (width + 55))
+    for r in sorted(results, key=lambda r: (r.ok, r.server_url)):
+        latency = f"{r.latency_ms:.1f}ms" if r.latency_ms is not None else '-'
+        status = '✓ healthy' if r.ok else f"✗ {r.error}"
+        database = (r.payload or {}).get('database', '-')
+        print(f"{r.server_url:<{width}} {status:<20} {latency:>10}  {database:<15}")
+    latency = summary['latency_ms']
+    print("=" * (width + 55))
+    print(f"Healthy: {summary['healthy']}/{summary['servers']} in {summary['elapsed_s']:.2f}s  "
+          f"p50: {latency['p50']:.1f}ms  p95: {latency['p95']:.1f}ms  p99: {latency['p99']:.1f}ms")
+
+
+def read_server_list(path: str) -> List[str]:
+    """Read server URLs from a file, one per line ('#' starts a comment)."""
+    with open(path, encoding='utf-8') as f:
+        return [line.split('#', 1)[0].strip() for line in f
+                if line.split('#', 1)[0].strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Probe /health on a fleet of check-in servers')
+    parser.add_argument('servers', nargs='*', help='Server base URLs')
+    parser.add_argument('--file', help='File with one server URL per line')
+    parser.add_argument('--timeout', type=float, default=1.0, help='Per-probe timeout (s)')
+    parser.add_argument('--deadline', type=float, help='Wall-clock limit per round (s)')
+    parser.add_argument('--watch', type=float, metavar='INTERVAL',
+                        help='Probe continuously every INTERVAL seconds')
+    parser.add_argument('--window', type=int, default=60, help='Probes kept per server in watch mode')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    server_urls = list(args.servers)
+    if args.file:
+        server_urls += read_server_list(args.file)
+    if not server_urls:
+        parser.error('no servers given')
+
+    checker = FleetHealthChecker(server_urls, args.timeout, args.deadline, window=args.window)
+    try:
+        while True:
+            start = time.perf_counter()
+            results = checker.probe_all()
+            summary = summarize_round(results, time.perf_counter() - start)
+            if args.json:
+                output = {'summary': summary, 'results': [asdict(r) for r in results]}
+                if args.watch:
+                    output['rolling'] = checker.rolling_stats()
+                print(json.dumps(output, indent=2))
+            else:
+                print_round(results, summary)
+            if not args.watch:
+                return 0 if summary['healthy'] == summary['servers'] else 1
+            time.sleep(max(0.0, args.watch - (time.perf_counter() - start)))
+    except KeyboardInterrupt:
+        if not args.json:
+            print("\nRolling availability:")
+            for url, stats in checker.rolling_stats().items():
+                print(f"  {url}: {stats['availability']:.1%} over {stats['probes']} probes, "
+                      f"p95 {stats['latency_ms']['p95']:.1f}ms")
+        return 0
+    finally:
+        checker.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Offline Kiosk Journal
+Durable local journal for check-ins taken while the server is unreachable,
+with a background flusher that replays them in batches once it recovers.
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable
+
+import requests
+
+from daycare_resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, call_with_retry
+
+
+class JournalFullError(Exception):
+    """Raised when the journal backlog has reached its configured limit."""
+
+
+@dataclass
+class JournalEntry:
+    """A check-in waiting to be delivered to the server."""
+    id: int
+    idempotency_key: str
+    client_name: str
+    check_in_time: str
+    attempts: int
+    last_error: Optional[str]
+
+    def to_payload(self) -> Dict[str, str]:
+        return {
+            'client_name': self.client_name,
+            'check_in_time': self.check_in_time,
+            'idempotency_key': self.idempotency_key,
+        }
+
+
+class CheckinJournal:
+    """
+    Append-only SQLite journal of pending check-ins.
+
+    Each entry keeps the original check-in time and a unique idempotency key,
+    so replaying an entry that already reached the server is harmless. The
+    journal runs in WAL mode with synchronous=FULL so an acknowledged append
+    survives a kiosk crash or power loss.
+    """
+
+    def __init__(self, path: str = 'kiosk_journal.db', max_backlog: int = 10000):
+        """
+        Args:
+            path (str): SQLite file for the journal
+            max_backlog (int): Maximum number of undelivered entries kept
+        """
+        self.path = path
+        self.max_backlog = max_backlog
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS pending_checkins (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                client_name TEXT NOT NULL,
+                check_in_time TEXT NOT NULL,
+                queued_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT
+            );
+            CREATE TABLE IF NOT EXISTS journal_counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+        ''')
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        self._conn.execute('''
+            INSERT INTO journal_counters (name, value) VALUES (?, ?)
+            ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+        ''', (name, amount))
+
+    def append(self, client_name: str, check_in_time: Optional[str] = None,
+               idempotency_key: Optional[str] = None) -> JournalEntry:
+        """
+        Durably record a check-in for later delivery.
+
+        Args:
+            client_name (str): The name of the client checking in
+            check_in_time (Optional[str]): Original ISO timestamp (default: now)
+            idempotency_key (Optional[str]): Key already sent to the server, if any
+
+        Returns:
+            JournalEntry: The stored entry
+
+        Raises:
+            JournalFullError: If `max_backlog` undelivered entries are queued
+        """
+        check_in_time = check_in_time or datetime.now().isoformat()
+        idempotency_key = idempotency_key or str(uuid.uuid4())
+        with self._lock:
+            backlog = self._conn.execute('SELECT COUNT(*) FROM pending_checkins').fetchone()[0]
+            if backlog >= self.max_backlog:
+                self._bump('rejected')
+                self._conn.commit()
+                raise JournalFullError(f"offline journal is full ({backlog} check-ins pending)")
+            cursor = self._conn.execute('''
+                INSERT INTO pending_checkins (idempotency_key, client_name, check_in_time, queued_at)
+                VALUES (?, ?, ?, ?)
+            ''', (idempotency_key, client_name, check_in_time, time.time()))
+            self._bump('appended')
+            self._conn.commit()
+            return JournalEntry(cursor.lastrowid, idempotency_key, client_name,
+                                check_in_time, 0, None)
+
+    def pending(self, limit: int = 100) -> List[JournalEntry]:
+        """Return up to `limit` undelivered entries, oldest first."""
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT id, idempotency_key, client_name, check_in_time, attempts, last_error
+                FROM pending_checkins ORDER BY id LIMIT ?
+            ''', (limit,)).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+    def mark_delivered(self, keys: Iterable[str], duplicates: int = 0) -> None:
+        """Remove entries the server has acknowledged (created or duplicate)."""
+        keys = list(keys)
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany('DELETE FROM pending_checkins WHERE idempotency_key = ?',
+                                   [(key,) for key in keys])
+            self._bump('replayed', len(keys))
+            if duplicates:
+                self._bump('duplicates', duplicates)
+            self._conn.commit()
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Drop entries the server rejected as invalid; replaying them cannot succeed."""
+        keys = list(keys)
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany('DELETE FROM pending_checkins WHERE idempotency_key = ?',
+                                   [(key,) for key in keys])
+            self._bump('discarded', len(keys))
+            self._conn.commit()
+
+    def mark_failed(self, keys: Iterable[str], error: str) -> None:
+        """Record a failed delivery attempt; the entries stay queued."""
+        with self._lock:
+            self._conn.executemany('''
+                UPDATE pending_checkins SET attempts = attempts + 1, last_error = ?
+                WHERE idempotency_key = ?
+            ''', [(error, key) for key in keys])
+            self._bump('flush_failures')
+            self._conn.commit()
+
+    def backlog(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM pending_checkins').fetchone()[0]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return backlog size, age of the oldest entry and lifetime counters."""
+        with self._lock:
+            backlog, oldest = self._conn.execute(
+                'SELECT COUNT(*), MIN(queued_at) FROM pending_checkins'
+            ).fetchone()
+            counters = dict(self._conn.execute('SELECT name, value FROM journal_counters'))
+        return {
+            'backlog': backlog,
+            'max_backlog': self.max_backlog,
+            'oldest_age_s': round(time.time() - oldest, 1) if oldest else 0.0,
+            'appended': counters.get('appended', 0),
+            'replayed': counters.get('replayed', 0),
+            'duplicates': counters.get('duplicates', 0),
+            'rejected': counters.get('rejected', 0),
+            'discarded': counters.get('discarded', 0),
+            'flush_failures': counters.get('flush_failures', 0),
+        }
+
+
+class JournalFlusher(threading.Thread):
+    """
+    Background thread that replays journal entries to POST /checkins/batch.
+
+    Entries are sent oldest first in batches of `batch_size`. While the server
+    is unreachable the flusher backs off using the retry policy's jittered
+    delays, and a shared circuit breaker keeps it from hammering a server
+    that is still down.
+    """
+
+    def __init__(self, journal: CheckinJournal, server_url: str, batch_size: int = 100,
+                 interval: float = 2.0, timeout: float = 10.0,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        super().__init__(name='journal-flusher', daemon=True)
+        self.journal = journal
+        self.batch_url = f"{server_url.rstrip('/')}/checkins/batch"
+        self.batch_size = batch_size
+        self.interval = interval
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1, max_delay=30.0)
+        self.breaker = breaker
+        self._session = requests.Session()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._consecutive_failures = 0
+
+    def notify(self) -> None:
+        """Wake the flusher early, e.g. right after a new append."""
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        self._wake.set()
+        self.join(timeout)
+
+    def flush_once(self) -> int:
+        """
+        Send one batch of pending entries.
+
+        Returns:
+            int: Number of entries acknowledged by the server
+
+        Raises:
+            requests.exceptions.RequestException, CircuitOpenError: On delivery failure
+        """
+        entries = self.journal.pending(self.batch_size)
+        if not entries:
+            return 0
+        keys = [entry.idempotency_key for entry in entries]
+        try:
+            outcome = call_with_retry(
+                lambda: self._session.post(
+                    self.batch_url,
+                    json={'checkins': [entry.to_payload() for entry in entries]},
+                    timeout=self.timeout
+                ),
+                # Entries are idempotent, so even read timeouts can be retried
+                replace(self.retry_policy, retry_read_timeouts=True),
+                self.breaker
+            )
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
+            self.journal.mark_failed(keys, str(e))
+            raise
+
+        response = outcome.response
+        if response.status_code != 200:
+            self.journal.mark_failed(keys, f"HTTP {response.status_code}")
+            raise requests.exceptions.HTTPError(f"batch replay failed: HTTP {response.status_code}",
+                                                response=response)
+
+        data = response.json()
+        delivered = [r['idempotency_key'] for r in data.get('results', [])
+                     if r.get('status') in ('created', 'duplicate')]
+        rejected = [r['idempotency_key'] for r in data.get('results', [])
+                    if r.get('status') == 'rejected' and r.get('idempotency_key')]
+        self.journal.mark_delivered(delivered, duplicates=data.get('duplicates', 0))
+        self.journal.discard(rejected)
+        return len(delivered)
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                sent = self.flush_once()
+                self._consecutive_failures = 0
+            except (requests.exceptions.RequestException, CircuitOpenError, ValueError):
+                self._consecutive_failures += 1
+                sent = 0
+            if sent >= self.batch_size:
+                continue  # more backlog waiting, keep draining
+            if self._consecutive_failures:
+                # New appends must not cut the backoff short while the server is down
+                delay = max(self.retry_policy.backoff(self._consecutive_failures), self.interval)
+                self._stopping.wait(delay)
+            else:
+                self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+class OfflineKiosk:
+    """
+    Offline-first kiosk: every check-in is journaled locally and acknowledged
+    immediately, then delivered by the background flusher. A parent never
+    waits on network latency or a server outage.
+
+    Example:
+        kiosk = OfflineKiosk('http://localhost:5001')
+        kiosk.checkin('Emma Johnson')
+        print(kiosk.metrics())
+        kiosk.close()
+    """
+
+    def __init__(self, server_url: str, journal_path: str = 'kiosk_journal.db',
+                 max_backlog: int = 10000, batch_size: int = 100, interval: float = 2.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.journal = CheckinJournal(journal_path, max_backlog)
+        self.flusher = JournalFlusher(self.journal, server_url, batch_size, interval,
+                                      breaker=breaker or CircuitBreaker())
+        self.flusher.start()
+
+    def checkin(self, client_name: str) -> JournalEntry:
+        """Journal a check-in and return without touching the network."""
+        entry = self.journal.append(client_name)
+        self.flusher.notify()
+        return entry
+
+    def metrics(self) -> Dict[str, Any]:
+        return self.journal.metrics()
+
+    def close(self, drain_timeout: float = 5.0) -> None:
+        """Stop the flusher (after a final best-effort flush) and close the journal."""
+        self.flusher.stop(drain_timeout)
+        try:
+            while self.flusher.flush_once():
+                pass
+        except (requests.exceptions.RequestException, CircuitOpenError, ValueError):
+            pass
+        self.journal.close()
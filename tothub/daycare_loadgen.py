@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Load Generator
+Scenario-driven load: kiosks post check-ins following realistic arrival
+curves (a bimodal morning drop-off and an evening pickup peak) while
+dashboards poll /checkins, against a live server or in-process through
+Flask's test client. Reports throughput, latency percentiles and error rate
+per route, to size how many centers one server can handle.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Optional, Dict, Any, List, Tuple
+
+import requests
+
+from daycare_stats import summarize_latencies
+
+
+@dataclass
+class ArrivalPeak:
+    """One Gaussian component of the arrival mixture (times in hours of day)."""
+    mean_hour: float
+    std_hours: float
+    weight: float
+
+
+@dataclass
+class Scenario:
+    """
+    A simulated day compressed into `duration_s` seconds of real time.
+
+    Each child produces one check-in per listed peak group: a drop-off drawn
+    from `dropoff_peaks` and, if `pickup_peaks` is non-empty, a pickup.
+    """
+    name: str
+    day_start_hour: float = 6.5
+    day_end_hour: float = 9.5
+    duration_s: float = 60.0
+    centers: int = 1
+    children_per_center: int = 120
+    kiosks_per_center: int = 2
+    dashboards_per_center: int = 2
+    dashboard_interval_s: float = 5.0
+    dashboard_mode: str = 'full'  # 'full' list or 'incremental' since_id sync
+    dropoff_peaks: List[ArrivalPeak] = field(default_factory=list)
+    pickup_peaks: List[ArrivalPeak] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Scenario':
+        data = dict(data)
+        data['dropoff_peaks'] = [ArrivalPeak(**p) for p in data.get('dropoff_peaks', [])]
+        data['pickup_peaks'] = [ArrivalPeak(**p) for p in data.get('pickup_peaks', [])]
+        return cls(**data)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    # Early drop-off before work starts, second wave around school start
+    'morning_rush': Scenario(
+        name='morning_rush',
+        day_start_hour=6.5, day_end_hour=9.5,
+        dropoff_peaks=[ArrivalPeak(7.6, 0.35, 0.55), ArrivalPeak(8.5, 0.3, 0.45)],
+    ),
+    'full_day': Scenario(
+        name='full_day',
+        day_start_hour=6.5, day_end_hour=18.5, duration_s=120.0,
+        dropoff_peaks=[ArrivalPeak(7.6, 0.35, 0.55), ArrivalPeak(8.5, 0.3, 0.45)],
+        pickup_peaks=[ArrivalPeak(17.2, 0.45, 1.0)],
+    ),
+}
+
+
+def sample_arrival(rng: random.Random, peaks: List[ArrivalPeak],
+                   start_hour: float, end_hour: float) -> float:
+    """Draw an arrival hour from the peak mixture, clamped to the simulated day."""
+    peak = rng.choices(peaks, weights=[p.weight for p in peaks])[0]
+    return min(max(rng.gauss(peak.mean_hour, peak.std_hours), start_hour), end_hour)
+
+
+def build_schedule(scenario: Scenario, seed: int = 42) -> List[Tuple[float, str]]:
+    """
+    Generate (offset_seconds, client_name) check-in events for the whole run.
+
+    Offsets are in compressed real time, 0 .. scenario.duration_s.
+    """
+    rng = random.Random(seed)
+    span = scenario.day_end_hour - scenario.day_start_hour
+    events = []
+    for center in range(scenario.centers):
+        for child in range(scenario.children_per_center):
+            name = f"Center {center + 1:03d} Child {child + 1:04d}"
+            for label, peaks in (('drop-off', scenario.dropoff_peaks),
+                                 ('pickup', scenario.pickup_peaks)):
+                if not peaks:
+                    continue
+                hour = sample_arrival(rng, peaks, scenario.day_start_hour, scenario.day_end_hour)
+                offset = (hour - scenario.day_start_hour) / span * scenario.duration_s
+                events.append((offset, f"{name} ({label})"))
+    events.sort()
+    return events
+
+
+class HttpTransport:
+    """Sends requests to a running server; one pooled session per thread."""
+
+    def __init__(self, server_url: str, timeout: float = 10.0):
+        self.server_url = server_url.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, **kwargs) -> Tuple[int, Any]:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        response = session.request(method, f"{self.server_url}{path}",
+                                   timeout=self.timeout, **kwargs)
+        return response.status_code, response.json() if response.content else None
+
+
+class InProcessTransport:
+    """Calls the Flask app directly through test clients (no sockets)."""
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, **kwargs) -> Tuple[int, Any]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, query_string=kwargs.get('params'),
+                               json=kwargs.get('json'))
+        return response.status_code, response.get_json(silent=True)
+
+
+class Recorder:
+    """Thread-safe latency/error collection per route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.lag_ms: List[float] = []
+
+    def record(self, route: str, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.samples.setdefault(route, []).append(latency_ms)
+            if not ok:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+    def record_lag(self, lag_ms: float) -> None:
+        with self._lock:
+            self.lag_ms.append(lag_ms)
+
+    def report(self, elapsed_s: float) -> Dict[str, Any]:
+        routes = {}
+        for route, latencies in self.samples.items():
+            errors = self.errors.get(route, 0)
+            routes[route] = {
+                'requests': len(latencies),
+                'throughput_rps': round(len(latencies) / elapsed_s, 1) if elapsed_s else 0.0,
+                'error_rate': round(errors / len(latencies), 4) if latencies else 0.0,
+                'latency_ms': summarize_latencies(latencies),
+            }
+        return {
+            'elapsed_s': round(elapsed_s, 2),
+            'routes': routes,
+            'kiosk_schedule_lag_ms': summarize_latencies(self.lag_ms),
+        }
+
+
+def timed_call(transport, recorder: Recorder, route: str, method: str, path: str,
+               ok_statuses=(200, 201), **kwargs) -> Optional[Any]:
+    start = time.perf_counter()
+    try:
+        status, body = transport.request(method, path, **kwargs)
+        ok = status in ok_statuses
+    except (requests.exceptions.RequestException, ValueError):
+        status, body, ok = None, None, False
+    recorder.record(route, (time.perf_counter() - start) * 1000, ok)
+    return body if ok else None
+
+
+def run_scenario(scenario: Scenario, transport, seed: int = 42) -> Dict[str, Any]:
+    """
+    Drive one scenario to completion and return the per-route report.
+
+    Kiosks are open-loop: each sends its events at their scheduled offsets
+    and, when the server falls behind, the delay shows up as schedule lag
+    rather than as fewer requests.
+    """
+    schedule = build_schedule(scenario, seed)
+    kiosk_count = max(1, scenario.centers * scenario.kiosks_per_center)
+    dashboard_count = scenario.centers * scenario.dashboards_per_center
+    queues: List[List[Tuple[float, str]]] = [schedule[i::kiosk_count] for i in range(kiosk_count)]
+    recorder = Recorder()
+    stop = threading.Event()
+    start = time.perf_counter()
+
+    def kiosk(events: List[Tuple[float, str]]) -> None:
+        for offset, name in events:
+            delay = offset - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                recorder.record_lag(-delay * 1000)
+            timed_call(transport, recorder, 'POST /checkin', 'POST', '/checkin',
+                       json={'client_name': name})
+
+    def dashboard(index: int) -> None:
+        # Stagger the first poll so dashboards do not fire in lockstep
+        since_id = 0
+        if stop.wait(scenario.dashboard_interval_s * index / max(1, dashboard_count)):
+            return
+        while not stop.is_set():
+            if scenario.dashboard_mode == 'incremental':
+                body = timed_call(transport, recorder, 'GET /checkins?since_id', 'GET', '/checkins',
+                                  params={'since_id': since_id})
+                if body:
+                    since_id = body.get('max_id', since_id)
+            else:
+                timed_call(transport, recorder, 'GET /checkins', 'GET', '/checkins')
+            stop.wait(scenario.dashboard_interval_s)
+
+    kiosks = [threading.Thread(target=kiosk, args=(q,), daemon=True) for q in queues]
+    dashboards = [threading.Thread(target=dashboard, args=(i,), daemon=True)
+                  for i in range(dashboard_count)]
+    for thread in kiosks + dashboards:
+        thread.start()
+    for thread in kiosks:
+        thread.join()
+    stop.set()
+    for thread in dashboards:
+        thread.join()
+
+    report = recorder.report(time.perf_counter() - start)
+    report['scenario'] = asdict(scenario)
+    report['kiosks'] = kiosk_count
+    report['dashboards'] = dashboard_count
+    report['checkins_scheduled'] = len(schedule)
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the per-route load report as a table."""
+    scenario = report['scenario']
+    print("\n" + "=" * 96)
+    print(f"Scenario: {scenario['name']}  centers: {scenario['centers']}  "
+          f"kiosks: {report['kiosks']}  dashboards: {report['dashboards']}  "
+          f"check-ins: {report['checkins_scheduled']}  elapsed: {report['elapsed_s']:.1f}s")
+    print("=" * 96)
+    print(f"{'Route':<26} {'Requests':>9} {'Req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'max ms':>9} {'Errors':>8}")
+    for route, stats in sorted(report['routes'].items()):
+        latency = stats['latency_ms']
+        print(f"{route:<26} {stats['requests']:>9} {stats['throughput_rps']:>8.1f} "
+              f"{latency['p50']:>9.1f} {latency['p95']:>9.1f} {latency['p99']:>9.1f} "
+              f"{latency['max']:>9.1f} {stats['error_rate']:>8.2%}")
+    lag = report['kiosk_schedule_lag_ms']
+    print("=" * 96)
+    print(f"Kiosk schedule lag: {lag['count']} late sends, p95 {lag['p95']:.1f}ms, max {lag['max']:.1f}ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run a daycare load scenario')
+    parser.add_argument('--scenario', default='morning_rush',
+                        help=f"Built-in scenario ({', '.join(SCENARIOS)}) or path to a JSON file")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--server', default='http://localhost:5001', help='Server base URL')
+    target.add_argument('--in-process', action='store_true',
+                        help="Drive flask_server's app through test clients on a temporary database")
+    parser.add_argument('--centers', type=int, help='Number of centers to simulate')
+    parser.add_argument('--children', type=int, help='Children per center')
+    parser.add_argument('--kiosks', type=int, help='Kiosks per center')
+    parser.add_argument('--dashboards', type=int, help='Dashboards per center')
+    parser.add_argument('--dashboard-interval', type=float, help='Seconds between dashboard polls')
+    parser.add_argument('--dashboard-mode', choices=['full', 'incremental'])
+    parser.add_argument('--duration', type=float, help='Real seconds the simulated day is compressed into')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the arrival schedule')
+    parser.add_argument('--json', metavar='PATH', help='Also write the report to a JSON file')
+    args = parser.parse_args()
+
+    if args.scenario in SCENARIOS:
+        scenario = Scenario.from_dict(asdict(SCENARIOS[args.scenario]))
+    else:
+        with open(args.scenario, encoding='utf-8') as f:
+            scenario = Scenario.from_dict(json.load(f))
+    overrides = {
+        'centers': args.centers, 'children_per_center': args.children,
+        'kiosks_per_center': args.kiosks, 'dashboards_per_center': args.dashboards,
+        'dashboard_interval_s': args.dashboard_interval, 'dashboard_mode': args.dashboard_mode,
+        'duration_s': args.duration,
+    }
+    for key, value in overrides.items():
+        if value is not None:
+            setattr(scenario, key, value)
+
+    if args.in_process:
+        import flask_server
+        flask_server.DATABASE_PATH = os.path.join(tempfile.mkdtemp(prefix='tothub_load_'),
+                                                  'daycare_checkins.db')
+        flask_server.init_database()
+        transport = InProcessTransport(flask_server.app)
+    else:
+        transport = HttpTransport(args.server)
+
+    report = run_scenario(scenario, transport, args.seed)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to: {args.json}")
+    errors = sum(stats['error_rate'] > 0 for stats in report['routes'].values())
+    return 0 if errors == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Capture Replay
+Re-issues traffic recorded by the server's request capture
+(CHECKIN_CAPTURE_PATH) against a local server at 1x, 10x or max speed,
+keeping the original inter-arrival timing, and compares per-route latency
+with the capture itself or with a saved replay of another build.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+import requests
+
+from daycare_capture import CapturedRequest, read_capture
+from daycare_stats import summarize_latencies
+
+# Approximate JSON size of one entry in a POST /checkins/batch body
+BATCH_ENTRY_BYTES = 120
+MAX_BATCH_ENTRIES = 500
+
+
+def parse_speed(value: str) -> Optional[float]:
+    """Parse '1x', '10x', '2.5' or 'max' (returned as None: no pacing)."""
+    value = value.strip().lower()
+    if value == 'max':
+        return None
+    speed = float(value.rstrip('x'))
+    if speed <= 0:
+        raise ValueError('speed must be positive')
+    return speed
+
+
+def synthesize_body(record: CapturedRequest, index: int) -> Optional[Dict[str, Any]]:
+    """
+    Build a request body of roughly the captured size.
+
+    Captures keep only the body size, so check-ins are replayed with
+    synthetic names and fresh idempotency keys.
+    """
+    route = record.route
+    if route == 'POST /checkin':
+        name = f"Replay {index:07d}"
+        padding = max(0, record.body_size - len(json.dumps({'client_name': name})))
+        return {'client_name': name + ' ' * padding if padding else name}
+    if route == 'POST /checkins/batch':
+        entries = max(1, min(MAX_BATCH_ENTRIES, round(record.body_size / BATCH_ENTRY_BYTES)))
+        now = datetime.now().isoformat()
+        return {'checkins': [
+            {'client_name': f"Replay {index:07d}-{n:03d}", 'check_in_time': now,
+             'idempotency_key': str(uuid.uuid4())}
+            for n in range(entries)
+        ]}
+    return None
+
+
+def summarize_routes(samples: Dict[str, List[float]], errors: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        route: {
+            'requests': len(latencies),
+            'errors': errors.get(route, 0),
+            'latency_ms': summarize_latencies(latencies),
+        }
+        for route, latencies in sorted(samples.items())
+    }
+
+
+def captured_summary(records: List[CapturedRequest]) -> Dict[str, Any]:
+    """Per-route latency as originally recorded by the server."""
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    for record in records:
+        samples.setdefault(record.route, []).append(record.latency_ms)
+        if record.status >= 500:
+            errors[record.route] = errors.get(record.route, 0) + 1
+    return summarize_routes(samples, errors)
+
+
+def replay(records: List[CapturedRequest], server_url: str, speed: Optional[float] = 1.0,
+           concurrency: int = 64, timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Replay captured requests against a server.
+
+    Requests are dispatched open-loop at their original offsets divided by
+    `speed` (None sends everything as fast as the worker pool allows).
+
+    Args:
+        records (List[CapturedRequest]): Captured requests, oldest first
+        server_url (str): Base URL of the server under test
+        speed (Optional[float]): Time compression factor, None for max speed
+        concurrency (int): Maximum requests in flight
+        timeout (float): Per-request timeout in seconds
+
+    Returns:
+        Dict[str, Any]: Per-route latency summaries (client-side, in ms),
+        error counts, status mismatches and dispatch lag
+    """
+    server_url = server_url.rstrip('/')
+    local = threading.local()
+    lock = threading.Lock()
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    mismatches = 0
+    lag_ms: List[float] = []
+
+    def send(record: CapturedRequest, index: int) -> None:
+        nonlocal mismatches
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+        body = synthesize_body(record, index)
+        start = time.perf_counter()
+        try:
+            response = session.request(record.method, f"{server_url}{record.path}",
+                                       json=body, timeout=timeout)
+            status = response.status_code
+        except requests.exceptions.RequestException:
+            status = None
+        latency_ms = (time.perf_counter() - start) * 1000
+        with lock:
+            samples.setdefault(record.route, []).append(latency_ms)
+            if status is None or status >= 500:
+                errors[record.route] = errors.get(record.route, 0) + 1
+            elif status != record.status:
+                mismatches += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='replay') as executor:
+        first = records[0].timestamp if records else 0.0
+        for index, record in enumerate(records):
+            if speed is not None:
+                delay = (record.timestamp - first) / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    lag_ms.append(-delay * 1000)
+            executor.submit(send, record, index)
+    elapsed_s = time.perf_counter() - start
+
+    return {
+        'server_url': server_url,
+        'speed': 'max' if speed is None else speed,
+        'requests': len(records),
+        'elapsed_s': round(elapsed_s, 3),
+        'status_mismatches': mismatches,
+        'dispatch_lag_ms': summarize_latencies(lag_ms),
+        'routes': summarize_routes(samples, errors),
+    }
+
+
+def compare_routes(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Latency differences per route (current minus baseline) at p50/p95/p99."""
+    rows = []
+    for route, stats in current.items():
+        base = baseline.get(route)
+        if not base:
+            continue
+        row = {'route': route, 'requests': stats['requests']}
+        for pct in ('p50', 'p95', 'p99'):
+            before, after = base['latency_ms'][pct], stats['latency_ms'][pct]
+            row[pct] = {'baseline': before, 'current': after, 'delta_ms': after - before,
+                        'change': (after - before) / before if before else 0.0}
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], label: str) -> None:
+    print("\n" + "=" * 92)
+    print(f"Latency vs {label} (ms: baseline → replay, change)")
+    print("=" * 92)
+    print(f"{'Route':<24} {'Requests':>8}  {'p50':>22}  {'p95':>22}  {'p99':>22}")
+    for row in rows:
+        cells = [f"{row[p]['baseline']:.1f}→{row[p]['current']:.1f} {row[p]['change']:+.0%}"
+                 for p in ('p50', 'p95', 'p99')]
+        print(f"{row['route']:<24} {row['requests']:>8}  {cells[0]:>22}  {cells[1]:>22}  {cells[2]:>22}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Replay captured check-in server traffic')
+    parser.add_argument('capture', help='Capture file written by the server (CHECKIN_CAPTURE_PATH)')
+    parser.add_argument('--server', default='http://localhost:5001', help='Server to replay against')
+    parser.add_argument('--speed', default='1x', help="Replay speed: '1x', '10x', any factor, or 'max'")
+    parser.add_argument('--concurrency', type=int, default=64, help='Maximum requests in flight')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout (s)')
+    parser.add_argument('--route', action='append', help="Only replay these routes, e.g. 'GET /checkins'")
+    parser.add_argument('--save', metavar='PATH', help='Save this replay run as JSON')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='Compare against a saved replay run (default: the captured latencies)')
+    args = parser.parse_args()
+
+    records = read_capture(args.capture)
+    if args.route:
+        records = [r for r in records if r.route in args.route]
+    if not records:
+        print("❌ No captured requests to replay")
+        return 1
+    speed = parse_speed(args.speed)
+    span = records[-1].timestamp - records[0].timestamp
+    print(f"🔁 Replaying {len(records)} requests spanning {span:.1f}s "
+          f"at {args.speed} against {args.server}")
+
+    run = replay(records, args.server, speed, args.concurrency, args.timeout)
+    run['capture'] = args.capture
+    print(f"✅ Replay finished in {run['elapsed_s']:.1f}s "
+          f"({run['status_mismatches']} status mismatches, "
+          f"dispatch lag p95 {run['dispatch_lag_ms']['p95']:.1f}ms)")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline, label = json.load(f)['routes'], args.compare
+    else:
+        baseline, label = captured_summary(records), 'capture'
+    print_comparison(compare_routes(baseline, run['routes']), label)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+        print(f"\nReplay run saved to: {args.save}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Client Resilience
+Retry with exponential backoff, Retry-After handling and a circuit breaker
+for kiosk calls, plus counters to measure retry amplification.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Any, List, Tuple
+
+import requests
+
+from daycare_stats import summarize_latencies
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry configuration for client calls.
+
+    Delays use exponential backoff with full jitter: attempt n sleeps a
+    uniformly random time in [0, min(max_delay, base_delay * 2**(n-1))], so a
+    fleet of kiosks recovering from the same outage spreads out its retries.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.2
+    max_delay: float = 10.0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    respect_retry_after: bool = True
+    # A read timeout on a POST may mean the server already committed the
+    # write; only retry it when the request is idempotent.
+    retry_read_timeouts: bool = False
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retrying after `attempt` failures."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, response: requests.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date), capped at max_delay."""
+        value = response.headers.get('Retry-After')
+        if not value or not self.respect_retry_after:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            delay = (when - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), self.max_delay)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by all calls to one server.
+
+    CLOSED: calls pass; `failure_threshold` consecutive failures open it.
+    OPEN: calls fail fast with CircuitOpenError until `reset_timeout`
+    (jittered per breaker) has elapsed.
+    HALF_OPEN: trial calls are admitted gradually -- one at first, one more
+    for each success -- and `success_threshold` successes close the circuit.
+    Any failure while half-open re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 success_threshold: int = 3, jitter: float = 0.2,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.success_threshold = success_threshold
+        self.jitter = jitter
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._in_flight = 0
+        self._opened_until = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self._clock() >= self._opened_until:
+            self._state = self.HALF_OPEN
+            self._successes = 0
+            self._in_flight = 0
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        spread = self.reset_timeout * self.jitter
+        self._opened_until = self._clock() + self.reset_timeout + random.uniform(-spread, spread)
+        self._failures = 0
+        self._successes = 0
+        self._in_flight = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed now (and reserve a half-open slot)."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._in_flight < self._successes + 1:
+                self._in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._in_flight = max(0, self._in_flight - 1)
+                self._successes += 1
+                if self._successes >= self.success_threshold:
+                    self._state = self.CLOSED
+                    self._failures = 0
+            else:
+                self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+            elif self._state == self.CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._open()
+
+
+@dataclass
+class CallStats:
+    """Thread-safe counters for calls made through `call_with_retry`."""
+    calls: int = 0
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    short_circuited: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, attempts: int, ok: bool, latency_ms: float,
+               short_circuited: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.attempts += attempts
+            self.latencies_ms.append(latency_ms)
+            if short_circuited:
+                self.short_circuited += 1
+            if ok:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    @property
+    def amplification(self) -> float:
+        """Average number of HTTP attempts per logical call."""
+        return self.attempts / self.calls if self.calls else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'attempts': self.attempts,
+                'successes': self.successes,
+                'failures': self.failures,
+                'short_circuited': self.short_circuited,
+                'retry_amplification': round(self.amplification, 3),
+                'latency_ms': summarize_latencies(self.latencies_ms),
+            }
+
+
+@dataclass
+class CallOutcome:
+    """Final response of a retried call and how many attempts it took."""
+    response: requests.Response
+    attempts: int
+    latency_ms: float
+
+
+def call_with_retry(send: Callable[[], requests.Response],
+                    policy: Optional[RetryPolicy] = None,
+                    breaker: Optional[CircuitBreaker] = None,
+                    stats: Optional[CallStats] = None,
+                    sleep: Callable[[float], None] = time.sleep) -> CallOutcome:
+    """
+    Invoke `send` with retries, backoff and circuit breaking.
+
+    Args:
+        send (Callable): Performs one HTTP attempt and returns the response
+        policy (Optional[RetryPolicy]): Retry configuration (None = single attempt)
+        breaker (Optional[CircuitBreaker]): Shared breaker for the target server
+        stats (Optional[CallStats]): Counters to update with this call
+        sleep (Callable): Sleep function (injectable for tests/simulations)
+
+    Returns:
+        CallOutcome: The final response (possibly a retryable status once
+        attempts are exhausted), attempt count and total latency
+
+    Raises:
+        CircuitOpenError: If the breaker rejected the call
+        requests.exceptions.RequestException: If the last attempt raised
+
+    Exceptions raised here carry an `attempts` attribute with the number of
+    HTTP attempts made before giving up.
+    """
+    policy = policy or RetryPolicy(max_attempts=1)
+    start = time.perf_counter()
+    attempt = 0
+
+    def finish(ok: bool, short_circuited: bool = False) -> float:
+        latency_ms = (time.perf_counter() - start) * 1000
+        if stats is not None:
+            stats.record(attempt, ok, latency_ms, short_circuited)
+        return latency_ms
+
+    while True:
+        if breaker is not None and not breaker.allow_request():
+            finish(False, short_circuited=True)
+            error = CircuitOpenError("circuit breaker is open; server marked unavailable")
+            error.attempts = attempt
+            raise error
+
+        attempt += 1
+        try:
+            response = send()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if breaker is not None:
+                breaker.record_failure()
+            retryable = (not isinstance(e, requests.exceptions.ReadTimeout)
+                         or policy.retry_read_timeouts)
+            if not retryable or attempt >= policy.max_attempts:
+                finish(False)
+                e.attempts = attempt
+                raise
+            sleep(policy.backoff(attempt))
+            continue
+
+        if response.status_code in policy.retry_statuses or response.status_code >= 500:
+            if breaker is not None:
+                breaker.record_failure()
+            if (response.status_code in policy.retry_statuses
+                    and attempt < policy.max_attempts):
+                delay = policy.retry_after(response)
+                sleep(delay if delay is not None else policy.backoff(attempt))
+                continue
+            return CallOutcome(response, attempt, finish(False))
+
+        if breaker is not None:
+            breaker.record_success()
+        return CallOutcome(response, attempt, finish(response.ok))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Daycare Check-in System - Latency Statistics
+Small helpers for summarizing request timings reported by the client tools.
+"""
+
+import math
+from typing import Dict, Iterable, List, Sequence
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of an already sorted sequence.
+
+    Uses linear interpolation between the closest ranks, so p50 of an even
+    number of samples is the midpoint of the two middle values.
+
+    Args:
+        sorted_values (Sequence[float]): Values in ascending order
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The interpolated percentile, or 0.0 for an empty sequence
+    """
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+
+    rank = (len(sorted_values) - 1) * (pct / 100.0)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(sorted_values[int(rank)])
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize_latencies(latencies_ms: Iterable[float]) -> Dict[str, float]:
+    """
+    Summarize a collection of latencies (in milliseconds).
+
+    Args:
+        latencies_ms (Iterable[float]): Individual request latencies
+
+    Returns:
+        Dict[str, float]: count, min, mean, p50, p95, p99 and max
+    """
+    values: List[float] = sorted(latencies_ms)
+    if not values:
+        return {'count': 0, 'min': 0.0, 'mean': 0.0, 'p50': 0.0,
+                'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+    return {
+        'count': len(values),
+        'min': values[0],
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': values[-1],
+    }
@@ -7,15 +7,38 @@ A complete client-server architecture for daycare check-in management using Flas
 import sqlite3
 import json
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from contextlib import contextmanager
 import os
+import time
+import uuid
+
+from daycare_capture import CaptureRing
 
 app = Flask(__name__)
 
 # Database configuration
 DATABASE_PATH = 'daycare_checkins.db'
 
+# Largest number of check-ins accepted by one POST /checkins/batch request
+MAX_BATCH_SIZE = 500
+
+# Longest idempotency key accepted (client-generated UUIDs fit easily)
+MAX_IDEMPOTENCY_KEY_LENGTH = 128
+
+# Largest page GET /checkins returns as JSON (larger limits are clamped);
+# NDJSON streams in constant memory and is not capped
+MAX_PAGE_SIZE = 10000
+
+# Rows fetched from SQLite per round when streaming NDJSON
+STREAM_FETCH_SIZE = 1000
+
+# Optional request capture for daycare_replay.py: set CHECKIN_CAPTURE_PATH to
+# record every request into a fixed-size binary ring file
+CAPTURE_PATH = os.environ.get('CHECKIN_CAPTURE_PATH')
+CAPTURE_CAPACITY = int(os.environ.get('CHECKIN_CAPTURE_CAPACITY', '100000'))
+capture_ring = CaptureRing(CAPTURE_PATH, CAPTURE_CAPACITY) if CAPTURE_PATH else None
+
 @contextmanager
 def get_db_connection():
     """Context manager for database connections with proper error handling."""
@@ -41,20 +64,112 @@ def init_database():
                 CREATE TABLE IF NOT EXISTS checkins (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     client_name TEXT NOT NULL,
-                    check_in_time DATETIME NOT NULL
+                    check_in_time DATETIME NOT NULL,
+                    idempotency_key TEXT
+                )
+            ''')
+            # Databases created before idempotency keys existed lack the column
+            columns = [row['name'] for row in cursor.execute('PRAGMA table_info(checkins)')]
+            if 'idempotency_key' not in columns:
+                cursor.execute('ALTER TABLE checkins ADD COLUMN idempotency_key TEXT')
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_checkins_idempotency_key
+                ON checkins (idempotency_key)
+            ''')
+            # The epoch identifies this database instance; clients holding a
+            # cache from a different epoch must do a full resync.
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS server_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
                 )
             ''')
+            cursor.execute(
+                "INSERT OR IGNORE INTO server_meta (key, value) VALUES ('epoch', ?)",
+                (uuid.uuid4().hex,)
+            )
             conn.commit()
             print("Database initialized successfully")
     except sqlite3.Error as e:
         print(f"Database initialization error: {e}")
         raise
 
+def parse_checkin_entry(data):
+    """
+    Validate one check-in payload.
+    
+    Returns a (client_name, check_in_time, idempotency_key) tuple, or raises
+    ValueError with a message suitable for the client. 'check_in_time' is
+    optional and lets offline kiosks preserve the original time of arrival.
+    """
+    if not isinstance(data, dict) or 'client_name' not in data:
+        raise ValueError('Missing required field: client_name')
+    
+    if not isinstance(data['client_name'], str):
+        raise ValueError('client_name must be a string')
+    client_name = data['client_name'].strip()
+    if not client_name:
+        raise ValueError('client_name cannot be empty')
+    
+    check_in_time = data.get('check_in_time')
+    if check_in_time:
+        try:
+            check_in_time = datetime.fromisoformat(check_in_time).isoformat()
+        except (TypeError, ValueError):
+            raise ValueError('check_in_time must be an ISO 8601 timestamp')
+    else:
+        check_in_time = datetime.now().isoformat()
+    
+    idempotency_key = data.get('idempotency_key')
+    if idempotency_key is not None:
+        if not isinstance(idempotency_key, str) or not idempotency_key.strip():
+            raise ValueError('idempotency_key must be a non-empty string')
+        if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise ValueError(f'idempotency_key is too long (max {MAX_IDEMPOTENCY_KEY_LENGTH} characters)')
+    return client_name, check_in_time, idempotency_key
+
+def find_checkin_by_key(cursor, idempotency_key):
+    """Return the check-in previously stored under an idempotency key, if any."""
+    cursor.execute(
+        'SELECT id, client_name, check_in_time FROM checkins WHERE idempotency_key = ?',
+        (idempotency_key,)
+    )
+    return cursor.fetchone()
+
+@app.before_request
+def start_capture_timer():
+    """Note the arrival time and start the latency clock for request capture."""
+    if capture_ring is not None:
+        g.capture_arrival = time.time()
+        g.capture_start = time.perf_counter()
+
+@app.after_request
+def capture_request(response):
+    """
+    Record the request in the capture ring.
+    
+    Latency is measured until the response object is ready, so for streamed
+    NDJSON it covers time to first byte rather than the whole transfer. The
+    timestamp is the arrival time, so replay spacing follows request arrivals.
+    """
+    if capture_ring is not None and 'capture_start' in g:
+        capture_ring.record(
+            request.method,
+            request.full_path.rstrip('?'),
+            response.status_code,
+            (time.perf_counter() - g.capture_start) * 1000,
+            request.content_length or 0,
+            g.capture_arrival
+        )
+    return response
+
 @app.route('/checkin', methods=['POST'])
 def create_checkin():
     """
     POST /checkin endpoint
     Accepts JSON payload with 'client_name' and creates a new check-in record.
+    An optional 'idempotency_key' (or Idempotency-Key header) makes retries
+    safe: a repeated key returns the original record with status 200.
     """
     try:
         # Validate request content type
@@ -65,26 +180,34 @@ def create_checkin():
         
         # Get and validate input data
         data = request.get_json()
-        if not data or 'client_name' not in data:
+        if isinstance(data, dict) and request.headers.get('Idempotency-Key'):
+            data.setdefault('idempotency_key', request.headers['Idempotency-Key'])
+        try:
+            client_name, check_in_time, idempotency_key = parse_checkin_entry(data)
+        except ValueError as e:
             return jsonify({
-                'error': 'Missing required field: client_name'
-            }), 400
-        
-        client_name = data['client_name'].strip()
-        if not client_name:
-            return jsonify({
-                'error': 'client_name cannot be empty'
+                'error': str(e)
             }), 400
         
         # Insert new check-in record
-        current_time = datetime.now().isoformat()
-        
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                'INSERT INTO checkins (client_name, check_in_time) VALUES (?, ?)',
-                (client_name, current_time)
-            )
+            try:
+                cursor.execute(
+                    'INSERT INTO checkins (client_name, check_in_time, idempotency_key) '
+                    'VALUES (?, ?, ?)',
+                    (client_name, check_in_time, idempotency_key)
+                )
+            except sqlite3.IntegrityError:
+                existing = find_checkin_by_key(cursor, idempotency_key)
+                return jsonify({
+                    'success': True,
+                    'duplicate': True,
+                    'message': f'Check-in already recorded for {existing["client_name"]}',
+                    'checkin_id': existing['id'],
+                    'client_name': existing['client_name'],
+                    'check_in_time': existing['check_in_time']
+                }), 200
             conn.commit()
             checkin_id = cursor.lastrowid
         
@@ -94,7 +217,7 @@ def create_checkin():
             'message': f'Check-in successful for {client_name}',
             'checkin_id': checkin_id,
             'client_name': client_name,
-            'check_in_time': current_time
+            'check_in_time': check_in_time
         }), 201
         
     except sqlite3.Error as e:
@@ -106,19 +229,160 @@ def create_checkin():
             'error': f'Server error: {str(e)}'
         }), 500
 
+@app.route('/checkins/batch', methods=['POST'])
+def create_checkins_batch():
+    """
+    POST /checkins/batch endpoint
+    Accepts {"checkins": [{client_name, check_in_time, idempotency_key}, ...]}
+    and stores them in a single transaction. Used by offline kiosks to replay
+    their journal; entries whose idempotency key is already stored are
+    reported as duplicates instead of being inserted twice.
+    """
+    try:
+        if not request.is_json:
+            return jsonify({
+                'error': 'Content-Type must be application/json'
+            }), 400
+        
+        data = request.get_json()
+        entries = data.get('checkins') if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            return jsonify({
+                'error': 'Missing required field: checkins'
+            }), 400
+        if len(entries) > MAX_BATCH_SIZE:
+            return jsonify({
+                'error': f'Batch too large (max {MAX_BATCH_SIZE} check-ins)'
+            }), 413
+        
+        results = []
+        created = duplicates = rejected = 0
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            for entry in entries:
+                key = entry.get('idempotency_key') if isinstance(entry, dict) else None
+                try:
+                    client_name, check_in_time, idempotency_key = parse_checkin_entry(entry)
+                except ValueError as e:
+                    results.append({'idempotency_key': key, 'status': 'rejected', 'error': str(e)})
+                    rejected += 1
+                    continue
+                
+                cursor.execute(
+                    'INSERT OR IGNORE INTO checkins (client_name, check_in_time, idempotency_key) '
+                    'VALUES (?, ?, ?)',
+                    (client_name, check_in_time, idempotency_key)
+                )
+                if cursor.rowcount:
+                    results.append({'idempotency_key': idempotency_key, 'status': 'created',
+                                    'checkin_id': cursor.lastrowid})
+                    created += 1
+                else:
+                    existing = find_checkin_by_key(cursor, idempotency_key)
+                    results.append({'idempotency_key': idempotency_key, 'status': 'duplicate',
+                                    'checkin_id': existing['id']})
+                    duplicates += 1
+            conn.commit()
+        
+        return jsonify({
+            'success': True,
+            'created': created,
+            'duplicates': duplicates,
+            'rejected': rejected,
+            'results': results
+        }), 200
+        
+    except sqlite3.Error as e:
+        return jsonify({
+            'error': f'Database error: {str(e)}'
+        }), 500
+    except Exception as e:
+        return jsonify({
+            'error': f'Server error: {str(e)}'
+        }), 500
+
 @app.route('/checkins', methods=['GET'])
 def get_all_checkins():
     """
     GET /checkins endpoint
     Retrieves and returns all check-in records from the database.
+    
+    Incremental sync: with '?since_id=N' only rows with id > N are returned,
+    oldest first. Every response carries the database 'epoch' and 'max_id'
+    and an ETag, so a client with an up-to-date cache gets a bodiless 304.
+    If the client's watermark or epoch does not match this database,
+    'resync_required' tells it to discard its cache and fetch everything.
+    
+    Paging and streaming: 'limit' caps the rows returned (combine with
+    since_id for keyset pages; 'next_since_id' continues the scan), 'since'
+    keeps only check-ins at or after an ISO timestamp, and '?format=ndjson'
+    streams every matching row as one JSON object per line. 'limit' must be
+    a positive integer; JSON pages are capped at MAX_PAGE_SIZE rows.
     """
     try:
+        since_id = request.args.get('since_id', type=int)
+        client_epoch = request.args.get('epoch')
+        limit = request.args.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return jsonify({
+                    'error': 'limit must be a positive integer'
+                }), 400
+        since = request.args.get('since')
+        if since:
+            try:
+                since = datetime.fromisoformat(since).isoformat()
+            except ValueError:
+                return jsonify({
+                    'error': 'since must be an ISO 8601 timestamp'
+                }), 400
+        
+        filters = []
+        params = []
+        if since_id is not None:
+            filters.append('id > ?')
+            params.append(since_id)
+        if since:
+            filters.append('check_in_time >= ?')
+            params.append(since)
+        where = f"WHERE {' AND '.join(filters)}" if filters else ''
+        
+        if request.args.get('format') == 'ndjson':
+            return stream_checkins_ndjson(where, params, limit)
+        if limit is not None:
+            limit = min(limit, MAX_PAGE_SIZE)
+        
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                'SELECT id, client_name, check_in_time FROM checkins ORDER BY check_in_time DESC'
+            cursor.execute("SELECT value FROM server_meta WHERE key = 'epoch'")
+            epoch = cursor.fetchone()['value']
+            cursor.execute('SELECT COALESCE(MAX(id), 0) AS max_id FROM checkins')
+            max_id = cursor.fetchone()['max_id']
+            
+            # Werkzeug keeps entity tags unquoted; set_etag() adds the quotes
+            tag = f"{epoch}-{max_id}"
+            if request.if_none_match.contains(tag):
+                response = app.response_class(status=304)
+                response.set_etag(tag)
+                return response
+            
+            resync_required = since_id is not None and (
+                since_id > max_id or (client_epoch is not None and client_epoch != epoch)
             )
-            rows = cursor.fetchall()
+            if resync_required:
+                rows = []
+            else:
+                order = 'ORDER BY id' if since_id is not None else 'ORDER BY check_in_time DESC'
+                limit_clause = 'LIMIT ?' if limit is not None else ''
+                cursor.execute(
+                    f'SELECT id, client_name, check_in_time FROM checkins {where} {order} {limit_clause}',
+                    params + ([limit] if limit is not None else [])
+                )
+                rows = cursor.fetchall()
         
         # Convert rows to list of dictionaries
         checkins = []
@@ -129,11 +393,20 @@ def get_all_checkins():
                 'check_in_time': row['check_in_time']
             })
         
-        return jsonify({
+        body = {
             'success': True,
             'count': len(checkins),
-            'checkins': checkins
-        }), 200
+            'checkins': checkins,
+            'epoch': epoch,
+            'max_id': max_id,
+            'resync_required': resync_required
+        }
+        if since_id is not None and limit is not None:
+            body['has_more'] = len(checkins) == limit
+            body['next_since_id'] = checkins[-1]['id'] if checkins else since_id
+        response = jsonify(body)
+        response.set_etag(tag)
+        return response, 200
         
     except sqlite3.Error as e:
         return jsonify({
@@ -144,6 +417,31 @@ def get_all_checkins():
             'error': f'Server error: {str(e)}'
         }), 500
 
+def stream_checkins_ndjson(where, params, limit):
+    """Stream matching check-ins as NDJSON in id order without buffering them."""
+    limit_clause = 'LIMIT ?' if limit is not None else ''
+    query = f'SELECT id, client_name, check_in_time FROM checkins {where} ORDER BY id {limit_clause}'
+    query_params = params + ([limit] if limit is not None else [])
+    
+    def generate():
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, query_params)
+            while True:
+                rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+                if not rows:
+                    break
+                yield ''.join(
+                    json.dumps({
+                        'id': row['id'],
+                        'client_name': row['client_name'],
+                        'check_in_time': row['check_in_time']
+                    }) + '\n'
+                    for row in rows
+                )
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring server status."""
@@ -158,7 +456,8 @@ def not_found(error):
     """Handle 404 errors with JSON response."""
     return jsonify({
         'error': 'Endpoint not found',
-        'available_endpoints': ['/checkin (POST)', '/checkins (GET)', '/health (GET)']
+        'available_endpoints': ['/checkin (POST)', '/checkins/batch (POST)',
+                                '/checkins (GET)', '/health (GET)']
     }), 404
 
 @app.errorhandler(405)
@@ -177,6 +476,7 @@ if __name__ == '__main__':
         print("Starting Daycare Check-in Server on port 5001...")
         print("Available endpoints:")
         print("  POST /checkin - Create new check-in record")
+        print("  POST /checkins/batch - Replay a batch of offline check-ins")
         print("  GET /checkins - Retrieve all check-in records")
         print("  GET /health - Server health check")
         
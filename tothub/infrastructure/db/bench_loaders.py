@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Loader strategy benchmark for TotHub bulk imports
+Loads the same generated attendance and billing rows with each insert
+strategy - one execute per row, executemany, execute_values and COPY - at
+several batch sizes, with and without the tables' indexes. Every trial runs
+in its own subprocess so peak RSS is per trial, and reports rows/sec,
+WAL (or SQLite journal) bytes written and peak RSS as JSON and markdown.
+
+Trials load into scratch copies of the tables (bench_attendance,
+bench_billing) without foreign keys, so existing data is left alone.
+
+Usage:
+    python bench_loaders.py
+    python bench_loaders.py --batch-sizes 100,1000,10000 --repeat 3 --output loaders
+    DATABASE_URL=sqlite:///bench.db python bench_loaders.py
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence
+
+from bulk_loader import _batches, copy_rows
+from db_backends import make_backend, sqlite_value
+from seed_bulk import ATTENDANCE_COLUMNS, BILLING_COLUMNS
+
+TABLES = {'attendance': ATTENDANCE_COLUMNS, 'billing': BILLING_COLUMNS}
+STRATEGIES = ['execute', 'executemany', 'execute_values', 'copy']
+# execute_values and COPY are psycopg2/Postgres only
+SQLITE_STRATEGIES = ['execute', 'executemany']
+DEFAULT_BATCH_SIZES = [100, 1000, 10000]
+BENCH_PREFIX = 'bench_'
+
+
+def generate_rows(table: str, centers: int, years: float, seed: int,
+                  limit: Optional[int] = None) -> List[tuple]:
+    """
+    Deterministic synthetic rows for one table.
+
+    Child and staff ids are positional (1..n) since the scratch tables have
+    no foreign keys, so every trial loads exactly the same rows.
+    """
+    from synthetic_data import ScaleConfig, SyntheticDataset
+
+    dataset = SyntheticDataset(ScaleConfig(centers=centers, years=years, seed=seed,
+                                           end_date=date(2024, 6, 28)))
+    counts = dataset.counts()
+    child_ids = list(range(1, counts['children'] + 1))
+    staff_ids = list(range(1, counts['staff'] + 1))
+    if table == 'attendance':
+        rows = dataset.attendance_rows(child_ids, staff_ids)
+    else:
+        rows = dataset.billing_rows(child_ids)
+    return list(islice(rows, limit))
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class PostgresTarget:
+    """Scratch table and WAL accounting on Postgres"""
+
+    strategies = STRATEGIES
+
+    def __init__(self, backend, conn):
+        self.backend = backend
+        self.conn = conn
+
+    def create_table(self, table: str, with_indexes: bool) -> str:
+        bench = BENCH_PREFIX + table
+        cur = self.conn.cursor()
+        cur.execute(f"DROP TABLE IF EXISTS {bench}")
+        # LIKE copies columns and defaults but not the source's id sequence ownership,
+        # so give the copy its own identity to keep the real sequence untouched
+        cur.execute(f"CREATE TABLE {bench} (LIKE {table} INCLUDING DEFAULTS)")
+        cur.execute(f"ALTER TABLE {bench} ALTER COLUMN id DROP DEFAULT, "
+                    f"ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+        if with_indexes:
+            cur.execute("SELECT indexname, indexdef FROM pg_indexes "
+                        "WHERE schemaname = 'public' AND tablename = %s", (table,))
+            for name, definition in cur.fetchall():
+                cur.execute(_rename_index(definition, name, table))
+        self.conn.commit()
+        return bench
+
+    def drop_table(self, bench: str) -> None:
+        self.conn.cursor().execute(f"DROP TABLE IF EXISTS {bench}")
+        self.conn.commit()
+
+    def wal_position(self):
+        cur = self.conn.cursor()
+        # Start each trial right after a checkpoint so every trial pays the same
+        # full-page-image cost (CHECKPOINT needs superuser or pg_checkpoint)
+        if _can_checkpoint(cur):
+            cur.execute("CHECKPOINT")
+        cur.execute("SELECT pg_current_wal_insert_lsn()")
+        position = cur.fetchone()[0]
+        self.conn.commit()
+        return position
+
+    def wal_bytes(self, since) -> int:
+        cur = self.conn.cursor()
+        cur.execute("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", (since,))
+        written = int(cur.fetchone()[0])
+        self.conn.commit()
+        return written
+
+    def table_bytes(self, bench: str) -> int:
+        cur = self.conn.cursor()
+        cur.execute("SELECT pg_total_relation_size(%s)", (bench,))
+        size = cur.fetchone()[0]
+        self.conn.commit()
+        return size
+
+    def load(self, strategy: str, bench: str, columns: Sequence[str], rows: List[tuple],
+             batch_size: int) -> None:
+        from psycopg2.extras import execute_values
+
+        column_list = ', '.join(columns)
+        placeholders = ', '.join('%s' for _ in columns)
+        with self.conn.cursor() as cur:
+            if strategy == 'execute':
+                sql = f"INSERT INTO {bench} ({column_list}) VALUES ({placeholders})"
+                for row in rows:
+                    cur.execute(sql, row)
+            elif strategy == 'executemany':
+                sql = f"INSERT INTO {bench} ({column_list}) VALUES ({placeholders})"
+                for batch in _batches(rows, batch_size):
+                    cur.executemany(sql, batch)
+            elif strategy == 'execute_values':
+                sql = f"INSERT INTO {bench} ({column_list}) VALUES %s"
+                for batch in _batches(rows, batch_size):
+                    execute_values(cur, sql, batch, page_size=len(batch))
+            elif strategy == 'copy':
+                copy_rows(self.conn, bench, columns, rows, batch_size, commit=False)
+            else:
+                raise ValueError(f"unknown strategy '{strategy}'")
+        self.conn.commit()
+
+
+class SQLiteTarget:
+    """Scratch table and journal accounting on a SQLite file"""
+
+    strategies = SQLITE_STRATEGIES
+
+    def __init__(self, backend, conn):
+        self.backend = backend
+        self.conn = conn
+        self.wal_path = backend.path + '-wal'
+        # Keep the WAL from being checkpointed mid-trial so its size is the bytes written
+        conn.execute("PRAGMA wal_autocheckpoint = 0")
+
+    def create_table(self, table: str, with_indexes: bool) -> str:
+        bench = BENCH_PREFIX + table
+        self.conn.execute(f"DROP TABLE IF EXISTS {bench}")
+        (definition,) = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        definition = re.sub(r'\s+REFERENCES\s+\w+\s*\(\w+\)', '', definition)
+        self.conn.execute(re.sub(r'(CREATE TABLE (IF NOT EXISTS )?)\w+', rf'\g<1>{bench}', definition, count=1))
+        if with_indexes:
+            indexes = self.conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (table,)
+            ).fetchall()
+            for name, sql in indexes:
+                self.conn.execute(_rename_index(sql, name, table))
+        self.conn.commit()
+        return bench
+
+    def drop_table(self, bench: str) -> None:
+        self.conn.execute(f"DROP TABLE IF EXISTS {bench}")
+        self.conn.commit()
+
+    def wal_position(self) -> int:
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return 0
+
+    def wal_bytes(self, since) -> int:
+        return os.path.getsize(self.wal_path) if os.path.exists(self.wal_path) else 0
+
+    def table_bytes(self, bench: str) -> Optional[int]:
+        try:
+            (size,) = self.conn.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name = ? OR name IN "
+                "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?)",
+                (bench, bench)
+            ).fetchone()
+            return size
+        except Exception:
+            return None  # dbstat is not compiled into every SQLite build
+
+    def prepare_row(self, row: Sequence[Any]) -> Sequence[Any]:
+        return tuple(sqlite_value(value) for value in row)
+
+    def load(self, strategy: str, bench: str, columns: Sequence[str], rows: List[tuple],
+             batch_size: int) -> None:
+        sql = (f"INSERT INTO {bench} ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' for _ in columns)})")
+        if strategy == 'execute':
+            for row in rows:
+                self.conn.execute(sql, self.prepare_row(row))
+        elif strategy == 'executemany':
+            for batch in _batches(rows, batch_size):
+                self.conn.executemany(sql, [self.prepare_row(row) for row in batch])
+        else:
+            raise ValueError(f"strategy '{strategy}' is not available on SQLite")
+        self.conn.commit()
+
+
+def _rename_index(definition: str, name: str, table: str) -> str:
+    """Point an index definition at the scratch table under a scratch name"""
+    definition = definition.replace(name, BENCH_PREFIX + name, 1)
+    return re.sub(rf'\bON\s+((public\.)?){table}\b', f'ON {BENCH_PREFIX}{table}', definition, count=1)
+
+
+def _can_checkpoint(cur) -> bool:
+    cur.execute("""
+        SELECT rolsuper OR EXISTS (
+            SELECT 1 FROM pg_roles c
+            WHERE c.rolname = 'pg_checkpoint' AND pg_has_role(current_user, c.oid, 'MEMBER'))
+        FROM pg_roles WHERE rolname = current_user
+    """)
+    row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def target_class(backend):
+    return SQLiteTarget if backend.name == 'sqlite' else PostgresTarget
+
+
+def run_trial(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one load in this process and measure it.
+
+    Rows are generated before the clock starts; the RSS baseline is taken
+    after generation, so rss_delta_bytes is the loader's own overhead.
+    """
+    backend = make_backend(spec['dsn'])
+    conn = backend.connect()
+    try:
+        backend.prepare(conn)
+        target = target_class(backend)(backend, conn)
+        rows = generate_rows(spec['table'], spec['centers'], spec['years'], spec['seed'], spec['rows'])
+        bench = target.create_table(spec['table'], spec['indexes'])
+        baseline_rss = peak_rss_bytes()
+        position = target.wal_position()
+
+        start = time.perf_counter()
+        target.load(spec['strategy'], bench, TABLES[spec['table']], rows, spec['batch_size'] or len(rows))
+        seconds = time.perf_counter() - start
+
+        peak_rss = peak_rss_bytes()
+        result = dict(spec, dsn=None, row_count=len(rows), seconds=seconds,
+                      rows_per_sec=len(rows) / seconds if seconds else 0.0,
+                      wal_bytes=target.wal_bytes(position),
+                      table_bytes=target.table_bytes(bench),
+                      peak_rss_bytes=peak_rss,
+                      rss_delta_bytes=peak_rss - baseline_rss)
+        target.drop_table(bench)
+        return result
+    finally:
+        conn.close()
+
+
+def run_in_subprocess(spec: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+    """Run a trial in a fresh interpreter so its peak RSS isn't inflated by earlier trials"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', json.dumps(spec)],
+        capture_output=True, text=True, timeout=timeout,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if completed.returncode != 0:
+        error = (completed.stderr.strip().splitlines() or ['worker failed'])[-1]
+        return dict(spec, dsn=None, error=error)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def plan_trials(strategies: Sequence[str], batch_sizes: Sequence[int], tables: Sequence[str],
+                index_modes: Sequence[bool]) -> List[Dict[str, Any]]:
+    """Every (table, indexes, strategy, batch size) combination; per-row execute has no batch size"""
+    trials = []
+    for table in tables:
+        for indexes in index_modes:
+            for strategy in strategies:
+                sizes = [None] if strategy == 'execute' else batch_sizes
+                for batch_size in sizes:
+                    trials.append({'table': table, 'indexes': indexes,
+                                   'strategy': strategy, 'batch_size': batch_size})
+    return trials
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Collapse repeated runs of one trial into medians (RSS and WAL take the max)"""
+    ok = [run for run in runs if 'error' not in run]
+    if not ok:
+        return dict(runs[0], repeats=len(runs))
+    seconds = statistics.median(run['seconds'] for run in ok)
+    summary = dict(ok[0], seconds=seconds, repeats=len(ok),
+                   rows_per_sec=ok[0]['row_count'] / seconds if seconds else 0.0,
+                   wal_bytes=max(run['wal_bytes'] for run in ok),
+                   peak_rss_bytes=max(run['peak_rss_bytes'] for run in ok),
+                   rss_delta_bytes=max(run['rss_delta_bytes'] for run in ok))
+    if len(ok) > 1:
+        summary['seconds_stdev'] = statistics.stdev(run['seconds'] for run in ok)
+    return summary
+
+
+def _mb(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value / 1024 / 1024:,.1f}"
+
+
+def markdown_report(report: Dict[str, Any]) -> str:
+    """Render the benchmark results as a markdown document"""
+    meta = report['environment']
+    lines = [
+        '# Loader Strategy Benchmark',
+        '',
+        f"- Generated: {report['generated_at']}",
+        f"- Backend: {meta['backend']} {meta.get('server_version') or ''}".rstrip(),
+        f"- Python: {meta['python']} on {meta['platform']}",
+        f"- Data: {report['params']['centers']} center(s), {report['params']['years']:g} years, "
+        f"seed {report['params']['seed']}; "
+        + ', '.join(f"{table} {count:,} rows" for table, count in report['row_counts'].items()),
+        f"- Repeats per trial: {report['params']['repeat']} (median time, max WAL/RSS)",
+        '',
+    ]
+    for table in report['row_counts']:
+        results = [r for r in report['results'] if r['table'] == table]
+        lines += [f"## {table}", '',
+                  '| Strategy | Batch | Indexes | Rows/s | Seconds | WAL MB | Table MB | Peak RSS MB | RSS Δ MB |',
+                  '|---|---:|---|---:|---:|---:|---:|---:|---:|']
+        for r in sorted(results, key=lambda r: (not r['indexes'], -r.get('rows_per_sec', 0))):
+            batch = r['batch_size'] or '1 row'
+            indexes = 'yes' if r['indexes'] else 'no'
+            if 'error' in r:
+                lines.append(f"| {r['strategy']} | {batch} | {indexes} | failed: {r['error']} | | | | | |")
+                continue
+            lines.append(
+                f"| {r['strategy']} | {batch} | {indexes} | {r['rows_per_sec']:,.0f} | {r['seconds']:.3f} "
+                f"| {_mb(r['wal_bytes'])} | {_mb(r['table_bytes'])} | {_mb(r['peak_rss_bytes'])} "
+                f"| {_mb(r['rss_delta_bytes'])} |"
+            )
+        lines.append('')
+
+    lines += ['## Fastest per table', '']
+    for table in report['row_counts']:
+        for indexes in (True, False):
+            candidates = [r for r in report['results']
+                          if r['table'] == table and r['indexes'] == indexes and 'error' not in r]
+            if candidates:
+                best = max(candidates, key=lambda r: r['rows_per_sec'])
+                lines.append(f"- {table}, {'with' if indexes else 'without'} indexes: "
+                             f"{best['strategy']} (batch {best['batch_size'] or 1}) "
+                             f"at {best['rows_per_sec']:,.0f} rows/s")
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def server_version(backend) -> Optional[str]:
+    conn = backend.connect()
+    try:
+        if backend.name == 'sqlite':
+            return 'SQLite ' + conn.execute("SELECT sqlite_version()").fetchone()[0]
+        cur = conn.cursor()
+        cur.execute("SHOW server_version")
+        return 'PostgreSQL ' + cur.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def run_benchmark(dsn: str, strategies: Sequence[str], batch_sizes: Sequence[int],
+                  tables: Sequence[str], index_modes: Sequence[bool], centers: int = 1,
+                  years: float = 2.0, seed: int = 42, rows: Optional[int] = None,
+                  repeat: int = 1, timeout: int = 1800) -> Dict[str, Any]:
+    """
+    Run every trial and collect the report.
+
+    Returns:
+        Report dict (environment, params, row counts and per-trial results)
+    """
+    backend = make_backend(dsn)
+    available = [s for s in strategies if s in target_class(backend).strategies]
+    skipped = [s for s in strategies if s not in available]
+    if skipped:
+        print(f"⚠️  Skipping strategies not available on {backend}: {', '.join(skipped)}")
+
+    results = []
+    trials = plan_trials(available, batch_sizes, tables, index_modes)
+    for number, trial in enumerate(trials, 1):
+        spec = dict(trial, dsn=dsn, centers=centers, years=years, seed=seed, rows=rows)
+        runs = [run_in_subprocess(spec, timeout) for _ in range(repeat)]
+        result = summarize(runs)
+        results.append(result)
+        label = (f"[{number}/{len(trials)}] {trial['table']:<10} {trial['strategy']:<14} "
+                 f"batch={trial['batch_size'] or 1:<6} indexes={'yes' if trial['indexes'] else 'no ':<3}")
+        if 'error' in result:
+            print(f"❌ {label} {result['error']}")
+        else:
+            print(f"✓ {label} {result['rows_per_sec']:>10,.0f} rows/s  "
+                  f"WAL {_mb(result['wal_bytes'])} MB  RSS {_mb(result['peak_rss_bytes'])} MB")
+
+    row_counts = {}
+    for result in results:
+        if 'row_count' in result:
+            row_counts.setdefault(result['table'], result['row_count'])
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'backend': backend.name,
+            'server_version': server_version(backend),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'params': {'strategies': list(available), 'batch_sizes': list(batch_sizes),
+                   'centers': centers, 'years': years, 'seed': seed, 'rows': rows, 'repeat': repeat},
+        'row_counts': row_counts,
+        'results': results,
+    }
+
+
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TotHub bulk loading strategies')
+    parser.add_argument('--strategies', type=_csv, default=STRATEGIES,
+                        help=f"Comma-separated subset of {','.join(STRATEGIES)}")
+    parser.add_argument('--batch-sizes', type=lambda v: [int(x) for x in _csv(v)],
+                        default=DEFAULT_BATCH_SIZES, help='Comma-separated rows per call/statement')
+    parser.add_argument('--tables', type=_csv, default=list(TABLES))
+    parser.add_argument('--indexes', choices=['both', 'with', 'without'], default='both')
+    parser.add_argument('--centers', type=int, default=1, help='Synthetic data scale')
+    parser.add_argument('--years', type=float, default=2.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--rows', type=int, help='Cap rows per table')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per trial (median is reported)')
+    parser.add_argument('--timeout', type=int, default=1800, help='Seconds per trial')
+    parser.add_argument('--output', default='loader_benchmark',
+                        help='Report path without extension (.json and .md are written)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_trial(json.loads(args.worker)), default=str))
+        return 0
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("Error: DATABASE_URL environment variable not set")
+        return 1
+    unknown = [s for s in args.strategies if s not in STRATEGIES]
+    unknown += [t for t in args.tables if t not in TABLES]
+    if unknown:
+        print(f"Error: unknown strategy/table: {', '.join(unknown)}")
+        return 1
+    index_modes = {'both': [True, False], 'with': [True], 'without': [False]}[args.indexes]
+
+    print("=== TotHub Loader Benchmark ===")
+    report = run_benchmark(database_url, args.strategies, args.batch_sizes, args.tables, index_modes,
+                           args.centers, args.years, args.seed, args.rows, args.repeat, args.timeout)
+
+    json_path, md_path = f"{args.output}.json", f"{args.output}.md"
+    with open(json_path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    with open(md_path, 'w') as f:
+        f.write(markdown_report(report))
+    print(f"\n📊 Report written to {json_path} and {md_path}")
+    return 0 if all('error' not in r for r in report['results']) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Bulk loading helpers for TotHub seed data
+Streams generated rows into Postgres with COPY FROM STDIN, or with
+execute_values for tables whose generated ids are needed by later tables.
+"""
+
+import io
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from psycopg2.extras import execute_values
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+@dataclass
+class LoadStats:
+    """Timing for one bulk load"""
+    table: str
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.table}: {self.rows:,} rows in {self.seconds:.2f}s "
+                f"({self.rows_per_sec:,.0f} rows/s, {self.batches} batches)")
+
+
+def _array_literal(values: Sequence[Any]) -> str:
+    """Format a Python list as a Postgres array literal, e.g. {"CPR","First Aid"}"""
+    items = []
+    for value in values:
+        if value is None:
+            items.append('NULL')
+        else:
+            text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+            items.append(f'"{text}"')
+    return '{' + ','.join(items) + '}'
+
+
+def copy_value(value: Any) -> str:
+    """Format one value for COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return _array_literal(value).translate(_COPY_ESCAPES)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_line(row: Sequence[Any]) -> str:
+    return '\t'.join(copy_value(value) for value in row) + '\n'
+
+
+class CopyStream(io.TextIOBase):
+    """
+    File-like adapter that renders rows as COPY text on demand.
+
+    psycopg2's copy_expert pulls fixed-size chunks with read(), so only one
+    chunk of formatted text is held in memory no matter how many rows the
+    iterator produces.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = ''
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while size is None or size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = copy_line(row)
+            parts.append(line)
+            length += len(line)
+            self.rows += 1
+        data = ''.join(parts)
+        if size is None or size < 0:
+            self._buffer = ''
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size: int = -1) -> str:
+        if '\n' not in self._buffer:
+            row = next(self._rows, None)
+            if row is not None:
+                self._buffer += copy_line(row)
+                self.rows += 1
+        line, sep, rest = self._buffer.partition('\n')
+        self._buffer = rest
+        return line + sep
+
+
+def _batches(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def copy_rows(conn, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+              batch_size: int = 50000, commit: bool = True) -> LoadStats:
+    """
+    Stream rows into a table with COPY FROM STDIN.
+
+    Args:
+        conn: psycopg2 connection
+        table: Target table
+        columns: Column names, in the order of each row tuple
+        rows: Iterable of row tuples (a generator keeps memory flat)
+        batch_size: Rows per COPY statement
+        commit: Commit once all rows are loaded
+
+    Returns:
+        LoadStats for the load
+    """
+    stats = LoadStats(table)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    start = time.perf_counter()
+    iterator = iter(rows)
+    with conn.cursor() as cur:
+        while True:
+            stream = CopyStream(islice(iterator, batch_size))
+            cur.copy_expert(sql, stream)
+            if not stream.rows:
+                break
+            stats.rows += stream.rows
+            stats.batches += 1
+            if stream.rows < batch_size:
+                break
+    if commit:
+        conn.commit()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def copy_text(conn, table: str, columns: Sequence[str], chunks: Iterable[str],
+              commit: bool = True) -> LoadStats:
+    """
+    COPY pre-rendered text into a table, one COPY statement per chunk.
+
+    For generators that already produce COPY text format (tab-separated,
+    \\N for NULL, one row per line).
+
+    Returns:
+        LoadStats for the load
+    """
+    stats = LoadStats(table)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        for chunk in chunks:
+            cur.copy_expert(sql, io.StringIO(chunk))
+            stats.rows += chunk.count('\n')
+            stats.batches += 1
+    if commit:
+        conn.commit()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def insert_returning_ids(conn, table: str, columns: Sequence[str],
+                         rows: Iterable[Sequence[Any]], batch_size: int = 1000,
+                         commit: bool = True) -> Tuple[List[Any], LoadStats]:
+    """
+    Insert rows with multi-row INSERT ... VALUES ... RETURNING id.
+
+    Used for tables whose ids later tables reference. Ids come back in the
+    same order as the rows.
+
+    Returns:
+        (ids, LoadStats)
+    """
+    stats = LoadStats(table)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s RETURNING id"
+    ids: List[Any] = []
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        for batch in _batches(rows, batch_size):
+            returned = execute_values(cur, sql, batch, page_size=len(batch), fetch=True)
+            ids.extend(row[0] for row in returned)
+            stats.rows += len(batch)
+            stats.batches += 1
+    if commit:
+        conn.commit()
+    stats.seconds = time.perf_counter() - start
+    return ids, stats
+
+
+def insert_values(conn, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                  batch_size: int = 1000, suffix: str = '', commit: bool = True) -> LoadStats:
+    """
+    Insert rows with multi-row INSERT ... VALUES, without returning ids.
+
+    Args:
+        suffix: SQL appended to each statement, e.g. an ON CONFLICT clause
+
+    Returns:
+        LoadStats for the load
+    """
+    stats = LoadStats(table)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s {suffix}".rstrip()
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        for batch in _batches(rows, batch_size):
+            execute_values(cur, sql, batch, page_size=len(batch))
+            stats.rows += len(batch)
+            stats.batches += 1
+    if commit:
+        conn.commit()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def print_load_stats(all_stats: Iterable[LoadStats]) -> Optional[LoadStats]:
+    """Print per-table load stats and an overall total"""
+    all_stats = list(all_stats)
+    if not all_stats:
+        return None
+    total = LoadStats('total', sum(s.rows for s in all_stats), sum(s.batches for s in all_stats),
+                      sum(s.seconds for s in all_stats))
+    print("\n=== Bulk Load Results ===")
+    for stats in all_stats:
+        print(f"✓ {stats}")
+    print(f"✓ {total}")
+    return total
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Structured results for TotHub checks and tests
+One record per check (status, duration, rows examined, query plan),
+collected into a ResultSet that can be written as JSON for diffing between
+runs or as JUnit XML for CI dashboards.
+
+Usage:
+    python check_results.py diff baseline.json current.json [--slower 1.5]
+"""
+
+import argparse
+import json
+import socket
+import sys
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+STATUSES = ('passed', 'failed', 'error', 'skipped')
+
+
+@dataclass
+class CheckResult:
+    """Outcome and timing of one check or test"""
+    name: str
+    status: str  # one of STATUSES
+    seconds: float = 0.0
+    group: str = ''
+    message: str = ''
+    value: Optional[float] = None
+    rows_examined: Optional[int] = None
+    plan: Optional[str] = None
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return self.status == 'passed'
+
+
+@dataclass
+class ResultSet:
+    """All results of one run of a suite, plus where and when it ran"""
+    suite: str
+    results: List[CheckResult] = field(default_factory=list)
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec='seconds'))
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def add(self, result: CheckResult) -> CheckResult:
+        self.results.append(result)
+        return result
+
+    def extend(self, results) -> None:
+        self.results.extend(results)
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.status in ('passed', 'skipped') for result in self.results)
+
+    @property
+    def seconds(self) -> float:
+        return sum(result.seconds for result in self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'suite': self.suite,
+            'started_at': self.started_at,
+            'metadata': self.metadata,
+            'summary': {status: self.count(status) for status in STATUSES},
+            'seconds': self.seconds,
+            'results': [asdict(result) for result in self.results],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResultSet':
+        return cls(data['suite'], [CheckResult(**result) for result in data['results']],
+                   data.get('started_at', ''), data.get('metadata', {}))
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    @classmethod
+    def load_json(cls, path: str) -> 'ResultSet':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def to_junit_xml(self) -> str:
+        """
+        Render as a JUnit XML <testsuite>.
+
+        Groups become test classes; rows examined and the check value are
+        testcase properties and the query plan goes to system-out.
+        """
+        suite = ET.Element('testsuite', {
+            'name': self.suite,
+            'tests': str(len(self.results)),
+            'failures': str(self.count('failed')),
+            'errors': str(self.count('error')),
+            'skipped': str(self.count('skipped')),
+            'time': f"{self.seconds:.6f}",
+            'timestamp': self.started_at,
+            'hostname': socket.gethostname(),
+        })
+        if self.metadata:
+            properties = ET.SubElement(suite, 'properties')
+            for key, value in self.metadata.items():
+                ET.SubElement(properties, 'property', {'name': key, 'value': str(value)})
+        for result in self.results:
+            classname = f"{self.suite}.{result.group}" if result.group else self.suite
+            case = ET.SubElement(suite, 'testcase', {
+                'classname': classname, 'name': result.name, 'time': f"{result.seconds:.6f}"})
+            case_properties = {'rows_examined': result.rows_examined, 'value': result.value,
+                               **result.details}
+            case_properties = {k: v for k, v in case_properties.items() if v is not None}
+            if case_properties:
+                properties = ET.SubElement(case, 'properties')
+                for key, value in case_properties.items():
+                    ET.SubElement(properties, 'property', {'name': key, 'value': str(value)})
+            if result.status == 'failed':
+                ET.SubElement(case, 'failure', {'message': result.message}).text = result.message
+            elif result.status == 'error':
+                ET.SubElement(case, 'error', {'message': result.error or result.message}).text = result.error
+            elif result.status == 'skipped':
+                ET.SubElement(case, 'skipped', {'message': result.message})
+            if result.plan:
+                ET.SubElement(case, 'system-out').text = result.plan
+        ET.indent(suite)
+        return ET.tostring(suite, encoding='unicode', xml_declaration=True)
+
+    def write_junit(self, path: str) -> None:
+        with open(path, 'w') as f:
+            f.write(self.to_junit_xml())
+
+
+def diff_results(baseline: ResultSet, current: ResultSet, slower: float = 1.5,
+                 min_seconds: float = 0.001) -> List[str]:
+    """
+    Compare two runs of a suite.
+
+    Returns:
+        One line per status change, added/removed check, or check that got
+        `slower` times slower (ignoring checks faster than `min_seconds`)
+    """
+    before = {result.name: result for result in baseline.results}
+    after = {result.name: result for result in current.results}
+    lines = []
+    for name, result in after.items():
+        old = before.get(name)
+        if old is None:
+            lines.append(f"+ {name}: new ({result.status})")
+        elif old.status != result.status:
+            lines.append(f"! {name}: {old.status} -> {result.status}")
+        elif result.seconds >= min_seconds and result.seconds > old.seconds * slower:
+            lines.append(f"~ {name}: {old.seconds * 1000:.1f} ms -> {result.seconds * 1000:.1f} ms")
+    lines.extend(f"- {name}: removed" for name in before if name not in after)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Work with saved check results')
+    sub = parser.add_subparsers(dest='command', required=True)
+    diff = sub.add_parser('diff', help='Compare two JSON result files')
+    diff.add_argument('baseline')
+    diff.add_argument('current')
+    diff.add_argument('--slower', type=float, default=1.5,
+                      help='Report checks this many times slower than the baseline')
+    args = parser.parse_args()
+
+    lines = diff_results(ResultSet.load_json(args.baseline), ResultSet.load_json(args.current),
+                         args.slower)
+    for line in lines:
+        print(line)
+    if not lines:
+        print("No differences")
+    return 1 if any(line.startswith('!') for line in lines) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
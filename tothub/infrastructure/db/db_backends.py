@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Database backends for TotHub seeding
+Lets the seed engine and bulk loaders target Postgres or a local SQLite
+file through one interface. Each backend handles its own paramstyle
+(%s vs ?), returning generated ids, value types SQLite has no column type
+for (arrays, JSON, booleans, dates) and its fastest bulk-load path (COPY
+vs executemany in one transaction).
+
+Usage:
+    backend = make_backend(os.environ['DATABASE_URL'])  # or 'sqlite:///bench.db'
+"""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bulk_loader import LoadStats, _batches, copy_rows, copy_text, insert_returning_ids, insert_values
+
+SQLITE_SCHEMA_PATH = Path(__file__).resolve().parent / 'sqlite_schema.sql'
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+class PostgresBackend:
+    """Postgres via psycopg2: COPY for bulk loads, multi-row INSERT ... RETURNING for ids"""
+
+    name = 'postgres'
+    concurrent_writes = True
+    supports_copy_text = True
+
+    def __init__(self, dsn: Optional[str] = None):
+        self.dsn = dsn
+
+    def connect(self, dsn: Optional[str] = None):
+        import psycopg2
+        return psycopg2.connect(dsn or self.dsn)
+
+    def sql(self, query: str) -> str:
+        """Convert a %s-style query to this backend's paramstyle"""
+        return query
+
+    def prepare(self, conn) -> bool:
+        """Create missing tables; returns True if the schema may have changed"""
+        return False  # Postgres schema is managed by migrations
+
+    def introspect_schema(self, conn) -> Dict[str, Dict[str, str]]:
+        """Return {table: {column: data_type}} for the public schema"""
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+            ORDER BY table_name, ordinal_position
+        """)
+        schema: Dict[str, Dict[str, str]] = {}
+        for table, column, data_type in cur.fetchall():
+            schema.setdefault(table, {})[column] = data_type
+        return schema
+
+    def existing_tables(self, conn, tables: Sequence[str]) -> List[str]:
+        cur = conn.cursor()
+        cur.execute("SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass(t) IS NOT NULL",
+                    (list(tables),))
+        found = {row[0] for row in cur.fetchall()}
+        return [table for table in tables if table in found]
+
+    def clear_tables(self, conn, tables: Sequence[str]) -> List[str]:
+        """
+        Truncate the listed tables that exist, in one statement.
+
+        Returns:
+            The tables that were missing
+        """
+        existing = self.existing_tables(conn, tables)
+        if existing:
+            conn.cursor().execute(f"TRUNCATE TABLE {', '.join(existing)} CASCADE")
+        conn.commit()
+        return [table for table in tables if table not in existing]
+
+    def insert_returning_ids(self, conn, table, columns, rows, batch_size=1000, commit=True):
+        return insert_returning_ids(conn, table, columns, rows, batch_size, commit)
+
+    def insert_values(self, conn, table, columns, rows, batch_size=1000, suffix='', commit=True):
+        return insert_values(conn, table, columns, rows, batch_size, suffix, commit)
+
+    def bulk_load(self, conn, table, columns, rows, batch_size=50000, commit=True):
+        return copy_rows(conn, table, columns, rows, batch_size, commit)
+
+    def copy_text(self, conn, table, columns, chunks, commit=True):
+        return copy_text(conn, table, columns, chunks, commit)
+
+    def __str__(self) -> str:
+        return 'Postgres'
+
+
+def sqlite_value(value: Any) -> Any:
+    """Convert a Python value to one SQLite stores natively"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value)
+    return value
+
+
+class SQLiteBackend:
+    """
+    A local SQLite file.
+
+    Writes go through executemany in one transaction with synchronous=OFF,
+    which is the fastest bulk path SQLite has. Ids come back by reading the
+    rowids above the table's previous maximum, since RETURNING cannot be used
+    with executemany. SQLite allows one writer at a time, so the seed engine
+    loads tables sequentially.
+    """
+
+    name = 'sqlite'
+    concurrent_writes = False
+    # No COPY, so no copy_text(); callers check this and use bulk_load()
+    supports_copy_text = False
+
+    def __init__(self, path: str, schema_path: Path = SQLITE_SCHEMA_PATH):
+        self.path = path
+        self.dsn = path
+        self.schema_path = schema_path
+
+    def connect(self, dsn: Optional[str] = None):
+        conn = sqlite3.connect(dsn or self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def sql(self, query: str) -> str:
+        return query.replace('%s', '?')
+
+    def prepare(self, conn) -> bool:
+        with open(self.schema_path) as f:
+            conn.executescript(f.read())
+        conn.commit()
+        return True
+
+    def introspect_schema(self, conn) -> Dict[str, Dict[str, str]]:
+        schema: Dict[str, Dict[str, str]] = {}
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+        for (table,) in tables:
+            for _, column, data_type, *_ in conn.execute(f"PRAGMA table_info({table})"):
+                schema.setdefault(table, {})[column] = data_type.lower()
+        return schema
+
+    def existing_tables(self, conn, tables: Sequence[str]) -> List[str]:
+        found = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return [table for table in tables if table in found]
+
+    def clear_tables(self, conn, tables: Sequence[str]) -> List[str]:
+        existing = self.existing_tables(conn, tables)
+        conn.execute("PRAGMA foreign_keys = OFF")
+        for table in existing:
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+        conn.execute("PRAGMA foreign_keys = ON")
+        return [table for table in tables if table not in existing]
+
+    def _insert_sql(self, table: str, columns: Sequence[str], suffix: str = '') -> str:
+        placeholders = ', '.join('?' for _ in columns)
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) {suffix}".rstrip()
+
+    def _executemany(self, conn, table, columns, rows, batch_size, suffix='') -> LoadStats:
+        stats = LoadStats(table)
+        sql = self._insert_sql(table, columns, suffix)
+        start = time.perf_counter()
+        for batch in _batches(rows, batch_size):
+            conn.executemany(sql, [tuple(sqlite_value(value) for value in row) for row in batch])
+            stats.rows += len(batch)
+            stats.batches += 1
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def insert_returning_ids(self, conn, table, columns, rows, batch_size=1000,
+                             commit=True) -> Tuple[List[Any], LoadStats]:
+        start = time.perf_counter()
+        (before,) = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()
+        stats = self._executemany(conn, table, columns, rows, batch_size)
+        ids = [row[0] for row in conn.execute(
+            f"SELECT id FROM {table} WHERE rowid > ? ORDER BY rowid", (before,)
+        )]
+        if commit:
+            conn.commit()
+        stats.seconds = time.perf_counter() - start
+        return ids, stats
+
+    def insert_values(self, conn, table, columns, rows, batch_size=1000, suffix='',
+                      commit=True) -> LoadStats:
+        stats = self._executemany(conn, table, columns, rows, batch_size, suffix)
+        if commit:
+            conn.commit()
+        return stats
+
+    def bulk_load(self, conn, table, columns, rows, batch_size=50000, commit=True) -> LoadStats:
+        return self.insert_values(conn, table, columns, rows, batch_size, commit=commit)
+
+    def __str__(self) -> str:
+        return f"SQLite ({self.path})"
+
+
+def make_backend(url: str):
+    """
+    Pick a backend from a database URL.
+
+    sqlite:///relative.db, sqlite:////absolute/path.db, or a plain path
+    ending in .db/.sqlite/.sqlite3 selects SQLite; anything else is passed
+    to psycopg2.
+    """
+    if url.startswith('sqlite:///'):
+        return SQLiteBackend(url[len('sqlite:///'):])
+    if url.lower().endswith(SQLITE_SUFFIXES) and '://' not in url:
+        return SQLiteBackend(os.path.expanduser(url))
+    return PostgresBackend(url)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+PIN and password hashing for TotHub seed scripts
+bcrypt work fanned out over a process pool, with a configurable cost factor
+for test data and an optional on-disk cache of pre-computed hashes.
+
+Environment:
+    TOTHUB_SEED_BCRYPT_ROUNDS: bcrypt cost for seed data (default 12, minimum 4)
+    TOTHUB_SEED_HASH_CACHE: path of a hash cache file to reuse across seeds
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+import bcrypt
+
+DEFAULT_ROUNDS = 12
+# Below this many hashes a process pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+
+def seed_rounds() -> int:
+    """bcrypt cost factor for seed data"""
+    return max(4, int(os.environ.get('TOTHUB_SEED_BCRYPT_ROUNDS', DEFAULT_ROUNDS)))
+
+
+def _hash_one(args) -> str:
+    secret, rounds = args
+    return bcrypt.hashpw(secret.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+class HashCache:
+    """
+    SQLite file mapping (secret, cost) to a previously computed hash.
+
+    Secrets are stored as SHA-256 digests, not in plain text. A cached
+    secret always gets the same hash, so rows sharing a PIN share a hash
+    when the cache is used.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS bcrypt_hashes (
+                digest TEXT NOT NULL,
+                rounds INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (digest, rounds)
+            )
+        ''')
+        self._conn.commit()
+
+    @staticmethod
+    def _digest(secret: str) -> str:
+        return hashlib.sha256(secret.encode('utf-8')).hexdigest()
+
+    def get_many(self, secrets: Iterable[str], rounds: int) -> dict:
+        """Return {secret: hash} for the secrets already cached"""
+        found = {}
+        with self._lock:
+            for secret in set(secrets):
+                row = self._conn.execute(
+                    'SELECT hash FROM bcrypt_hashes WHERE digest = ? AND rounds = ?',
+                    (self._digest(secret), rounds)
+                ).fetchone()
+                if row:
+                    found[secret] = row[0]
+        return found
+
+    def put_many(self, hashes: dict, rounds: int) -> None:
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO bcrypt_hashes (digest, rounds, hash) VALUES (?, ?, ?)',
+                [(self._digest(secret), rounds, value) for secret, value in hashes.items()]
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+
+
+def default_cache() -> Optional[HashCache]:
+    """The cache named by TOTHUB_SEED_HASH_CACHE, if set"""
+    global _default_cache
+    path = os.environ.get('TOTHUB_SEED_HASH_CACHE')
+    if not path:
+        return None
+    if _default_cache is None or _default_cache.path != path:
+        _default_cache = HashCache(path)
+    return _default_cache
+
+
+def hash_many(secrets: Iterable[str], rounds: Optional[int] = None,
+              workers: Optional[int] = None, cache: Optional[HashCache] = None) -> List[str]:
+    """
+    bcrypt-hash many secrets in parallel.
+
+    Args:
+        secrets: PINs or passwords, in row order
+        rounds: bcrypt cost (default: seed_rounds())
+        workers: Process pool size (default: CPU count)
+        cache: Hash cache (default: default_cache()); without one every
+            secret gets its own salt, as with one hashpw call per row
+
+    Returns:
+        One hash per secret, in the same order
+    """
+    secrets = list(secrets)
+    rounds = rounds or seed_rounds()
+    cache = cache if cache is not None else default_cache()
+
+    if cache is not None:
+        known = cache.get_many(secrets, rounds)
+        missing = sorted(set(secrets) - set(known))
+        computed = dict(zip(missing, _hash_all(missing, rounds, workers)))
+        if computed:
+            cache.put_many(computed, rounds)
+        known.update(computed)
+        return [known[secret] for secret in secrets]
+    return _hash_all(secrets, rounds, workers)
+
+
+def _hash_all(secrets: List[str], rounds: int, workers: Optional[int]) -> List[str]:
+    jobs = [(secret, rounds) for secret in secrets]
+    workers = workers or os.cpu_count() or 1
+    if len(jobs) < PARALLEL_THRESHOLD or workers == 1:
+        return [_hash_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hash_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+def hash_secret(secret: str, rounds: Optional[int] = None) -> str:
+    """Hash a single PIN or password (uses the cache when configured)"""
+    return hash_many([secret], rounds)[0]
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Scaled test data for the SQLite optimization benchmarks
+Generates users, children, schedules and attendance at a chosen scale
+(1.0 = 100k users, 500k schedules, 5M attendance rows) with realistic
+spreads: children fill rooms of different sizes by age group, attendance
+follows weekday and seasonal patterns plus per-child habits, and arrival
+times cluster around the morning drop-off peaks.
+
+Generation writes a standalone SQLite cache file in batched transactions.
+The cache is keyed by scale, seed and this file's source, so repeat runs
+only copy it into the target database (ATTACH + INSERT ... SELECT).
+
+Usage:
+    python optimization_data.py ../tothub.db --scale 0.1
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DB_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = Path(os.environ.get('TOTHUB_TEST_DATA_CACHE', DB_DIR / '.test_data_cache'))
+
+# Row counts at scale 1.0; children follow users
+SCALE_ROWS = {'users': 100_000, 'schedules': 500_000, 'attendance': 5_000_000}
+CHILDREN_PER_USER = 0.2
+STAFF_SHARE = 0.1
+ADMIN_SHARE = 0.005
+
+# Age group share of enrollment, room capacity and age range (months)
+ROOM_KINDS = [
+    ('Infant', 0.15, 8, (6, 18)),
+    ('Toddler', 0.30, 12, (18, 36)),
+    ('Preschool', 0.55, 18, (36, 60)),
+]
+# Rooms run between these fractions of capacity
+OCCUPANCY = (0.7, 1.0)
+
+# Share of enrolled children present by weekday (Mon=0) and month
+WEEKDAY_RATES = {0: 0.86, 1: 0.90, 2: 0.91, 3: 0.90, 4: 0.81}
+MONTH_FACTORS = {6: 0.92, 7: 0.85, 8: 0.88, 12: 0.85}
+# Per-child attendance habit (part-time families, frequent absences)
+HABIT_RANGE = (0.55, 1.0)
+# Data ends here so the historic benchmark dates fall inside it
+END_DATE = date(2025, 1, 31)
+
+# Drop-off peaks (minute of day, spread, share) and pickup around 16:45
+ARRIVAL_PEAKS = [(7 * 60 + 30, 20, 0.55), (8 * 60 + 30, 15, 0.45)]
+PICKUP = (16 * 60 + 45, 35)
+STAFF_SHIFTS = [('07:00:00', '15:30:00'), ('08:00:00', '16:30:00'), ('09:30:00', '18:00:00')]
+MOOD_WEIGHTS = [0.03, 0.07, 0.22, 0.43, 0.25]
+MINUTE_TEXT = [f"{m // 60:02d}:{m % 60:02d}:00" for m in range(24 * 60)]
+
+FIRST_NAMES = ['Ava', 'Liam', 'Mia', 'Noah', 'Emma', 'Lucas', 'Olivia', 'Ethan', 'Sofia',
+               'Mason', 'Chloe', 'Leo', 'Grace', 'Owen', 'Zoe', 'Eli', 'Nora', 'Jack']
+LAST_NAMES = ['Smith', 'Garcia', 'Nguyen', 'Johnson', 'Brown', 'Lee', 'Martinez', 'Davis',
+              'Lopez', 'Wilson', 'Clark', 'Patel', 'Young', 'Kim', 'Walker', 'Hall']
+
+COLUMNS = {
+    'users': ('id', 'email', 'password_hash', 'first_name', 'last_name', 'role',
+              'tenant_id', 'is_active', 'position', 'employee_id'),
+    'children': ('id', 'first_name', 'last_name', 'date_of_birth', 'parent_id',
+                 'enrollment_date', 'room', 'age_group', 'is_active'),
+    'schedules': ('id', 'schedule_type', 'entity_id', 'entity_type', 'room', 'date',
+                  'scheduled_start', 'scheduled_end', 'is_present', 'status'),
+    'attendance': ('id', 'child_id', 'date', 'room', 'check_in_time', 'check_out_time',
+                   'checked_in_by', 'checked_out_by', 'mood_rating'),
+}
+# Generated ids all start with this, so reloads can remove exactly these rows
+ID_PREFIX = 'test_'
+META_TABLE = '_test_data'
+
+
+def scaled_counts(scale: float) -> Dict[str, int]:
+    """Row targets for a scale factor (at least a handful of each)"""
+    counts = {table: max(int(rows * scale), 10) for table, rows in SCALE_ROWS.items()}
+    counts['children'] = max(int(counts['users'] * CHILDREN_PER_USER), 5)
+    return counts
+
+
+def data_fingerprint(scale: float, seed: int) -> str:
+    """Cache key: the generator's source plus its parameters"""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(f"{scale!r}:{seed}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def school_days(end: date = END_DATE) -> Iterator[date]:
+    """Weekdays going back from `end`, newest first"""
+    day = end
+    while True:
+        if day.weekday() < 5:
+            yield day
+        day -= timedelta(days=1)
+
+
+class TestDataGenerator:
+    """Deterministic row generators for one (scale, seed)"""
+
+    def __init__(self, scale: float = 0.01, seed: int = 42):
+        self.scale = scale
+        self.seed = seed
+        self.counts = scaled_counts(scale)
+        self.rng = random.Random(seed)
+        self._build_population()
+
+    def _name(self) -> Tuple[str, str]:
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _build_population(self) -> None:
+        """Decide rooms, staff, parents and children before any rows are written"""
+        rng = self.rng
+        users = self.counts['users']
+        admins = max(int(users * ADMIN_SHARE), 1)
+        staff = max(int(users * STAFF_SHARE), 1)
+        self.admin_ids = [f"{ID_PREFIX}admin_{i}" for i in range(admins)]
+        self.staff_ids = [f"{ID_PREFIX}staff_{i}" for i in range(staff)]
+        self.parent_ids = [f"{ID_PREFIX}parent_{i}" for i in range(max(users - admins - staff, 1))]
+
+        # Fill rooms of each age group to a random occupancy until its share is placed
+        self.rooms: List[Tuple[str, str]] = []  # (room, age group)
+        self.children: List[Tuple[str, str, str, float]] = []  # (id, room, age group, habit)
+        for kind, share, capacity, _ in ROOM_KINDS:
+            remaining = max(int(self.counts['children'] * share), 1)
+            number = 0
+            while remaining > 0:
+                number += 1
+                room = f"{kind} Room {number}"
+                size = min(remaining, max(int(capacity * rng.uniform(*OCCUPANCY)), 1))
+                self.rooms.append((room, kind.lower()))
+                for _ in range(size):
+                    child_id = f"{ID_PREFIX}child_{len(self.children)}"
+                    self.children.append((child_id, room, kind.lower(), rng.uniform(*HABIT_RANGE)))
+                remaining -= size
+        self.staff_rooms = {staff_id: self.rooms[i % len(self.rooms)][0]
+                            for i, staff_id in enumerate(self.staff_ids)}
+        self.room_staff: Dict[str, List[str]] = {}
+        for staff_id, room in self.staff_rooms.items():
+            self.room_staff.setdefault(room, []).append(staff_id)
+
+    def users(self) -> Iterator[tuple]:
+        for i, user_id in enumerate(self.admin_ids + self.staff_ids + self.parent_ids):
+            first, last = self._name()
+            if user_id in self.staff_rooms:
+                role, position, employee_id = 'staff', 'Teacher', f"TEST{i:07d}"
+            elif user_id.startswith(f"{ID_PREFIX}admin_"):
+                role, position, employee_id = 'admin', 'Director', f"TEST{i:07d}"
+            else:
+                role, position, employee_id = 'parent', None, None
+            # A few accounts have been deactivated
+            active = 0 if self.rng.random() < 0.04 else 1
+            yield (user_id, f"{user_id}@test.com", 'test_hash', first, last, role,
+                   f"{ID_PREFIX}tenant", active, position, employee_id)
+
+    def children_rows(self) -> Iterator[tuple]:
+        ages = {kind.lower(): months for kind, _, _, months in ROOM_KINDS}
+        for child_id, room, age_group, _ in self.children:
+            first, last = self._name()
+            birth = END_DATE - timedelta(days=30 * self.rng.randint(*ages[age_group]))
+            enrolled = END_DATE - timedelta(days=self.rng.randint(30, 700))
+            yield (child_id, first, last, birth.isoformat(), self.rng.choice(self.parent_ids),
+                   max(enrolled, birth).isoformat(), room, age_group,
+                   0 if self.rng.random() < 0.03 else 1)
+
+    def _arrival(self) -> int:
+        peak, spread, _ = self.rng.choices(ARRIVAL_PEAKS, [share for *_, share in ARRIVAL_PEAKS])[0]
+        return min(max(int(self.rng.gauss(peak, spread)), 6 * 60 + 30), 11 * 60)
+
+    def _pickup(self) -> int:
+        return min(max(int(self.rng.gauss(*PICKUP)), 12 * 60), 18 * 60)
+
+    def attendance(self) -> Iterator[tuple]:
+        """Day by day back from END_DATE until the attendance target is reached"""
+        rng, target, n = self.rng, self.counts['attendance'], 0
+        for day in school_days():
+            rate = WEEKDAY_RATES[day.weekday()] * MONTH_FACTORS.get(day.month, 1.0)
+            day_text = day.isoformat()
+            for child_id, room, _, habit in self.children:
+                if rng.random() >= rate * habit:
+                    continue
+                staff = self.room_staff.get(room) or self.staff_ids
+                yield (f"{ID_PREFIX}attendance_{n}", child_id, day_text, room,
+                       MINUTE_TEXT[self._arrival()], MINUTE_TEXT[self._pickup()],
+                       rng.choice(staff), rng.choice(staff),
+                       rng.choices(range(1, 6), MOOD_WEIGHTS)[0])
+                n += 1
+                if n >= target:
+                    return
+
+    def schedules(self) -> Iterator[tuple]:
+        """Staff shifts and child schedules for the most recent school days"""
+        rng, target, n = self.rng, self.counts['schedules'], 0
+        for day in school_days():
+            day_text = day.isoformat()
+            entries = [('staff', staff_id, room, *rng.choice(STAFF_SHIFTS), 0.9)
+                       for staff_id, room in self.staff_rooms.items()]
+            entries += [('child', child_id, room, MINUTE_TEXT[self._arrival()],
+                         MINUTE_TEXT[self._pickup()], habit)
+                        for child_id, room, _, habit in self.children]
+            for kind, entity_id, room, start, end, likelihood in entries:
+                if rng.random() >= likelihood:
+                    continue
+                yield (f"{ID_PREFIX}schedule_{n}", kind, entity_id, kind, room, day_text,
+                       start, end, 1 if day < END_DATE else 0,
+                       'completed' if day < END_DATE else 'scheduled')
+                n += 1
+                if n >= target:
+                    return
+
+    def tables(self) -> List[Tuple[str, Iterator[tuple]]]:
+        return [('users', self.users()), ('children', self.children_rows()),
+                ('schedules', self.schedules()), ('attendance', self.attendance())]
+
+
+def _batches(rows: Iterator[tuple], size: int) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_cache(path: Path, scale: float, seed: int, batch_size: int = 50_000) -> Dict[str, int]:
+    """
+    Generate the dataset into a standalone SQLite file.
+
+    Each batch is its own transaction; the file is written under a temp
+    name and moved into place, so an interrupted build never leaves a
+    partial cache behind.
+
+    Returns:
+        Rows written per table
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.build-', suffix='.db')
+    os.close(fd)
+    counts = {}
+    try:
+        conn = sqlite3.connect(tmp)
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        generator = TestDataGenerator(scale, seed)
+        for table, rows in generator.tables():
+            columns = COLUMNS[table]
+            conn.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+            insert = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+            counts[table] = 0
+            for batch in _batches(rows, batch_size):
+                with conn:
+                    conn.executemany(insert, batch)
+                counts[table] += len(batch)
+        conn.close()
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return counts
+
+
+def cache_path(scale: float, seed: int, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    return Path(cache_dir) / f"optimization_data_s{scale:g}_r{seed}_{data_fingerprint(scale, seed)}.db"
+
+
+def loaded_fingerprint(conn) -> Optional[str]:
+    """Fingerprint of the generated data already in the target, if any"""
+    row = conn.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{META_TABLE}'").fetchone()
+    if row is None:
+        return None
+    row = conn.execute(f"SELECT value FROM {META_TABLE} WHERE key = 'fingerprint'").fetchone()
+    return row[0] if row else None
+
+
+def _target_columns(conn, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA main.table_info({table})")]
+
+
+def clear_test_data(conn, tables: Sequence[str] = tuple(COLUMNS)) -> None:
+    """Remove previously generated rows (ids in the ID_PREFIX range)"""
+    for table in tables:
+        if _target_columns(conn, table):
+            with conn:
+                conn.execute(f"DELETE FROM {table} WHERE id >= ? AND id < ?",
+                             (ID_PREFIX, ID_PREFIX[:-1] + chr(ord(ID_PREFIX[-1]) + 1)))
+
+
+def load_cache(conn, path: Path, fingerprint: str) -> Dict[str, int]:
+    """
+    Copy a cache file into the target database.
+
+    Only columns the target table has are copied; tables the target lacks
+    are skipped. Each table loads in one transaction, then ANALYZE gives
+    the query planner statistics for the new volumes.
+
+    Returns:
+        Rows copied per table
+    """
+    conn.commit()
+    conn.execute("ATTACH DATABASE ? AS cache", (str(path),))
+    copied = {}
+    try:
+        for table, columns in COLUMNS.items():
+            target = _target_columns(conn, table)
+            common = [column for column in columns if column in target]
+            if not common:
+                continue
+            column_list = ', '.join(common)
+            with conn:
+                cursor = conn.execute(f"INSERT OR IGNORE INTO main.{table} ({column_list}) "
+                                      f"SELECT {column_list} FROM cache.{table}")
+            copied[table] = cursor.rowcount
+    finally:
+        conn.execute("DETACH DATABASE cache")
+    with conn:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(f"INSERT OR REPLACE INTO {META_TABLE} VALUES ('fingerprint', ?)", (fingerprint,))
+    conn.execute("ANALYZE")
+    return copied
+
+
+def ensure_test_data(conn, scale: float = 0.01, seed: int = 42,
+                     cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> Dict[str, int]:
+    """
+    Make the target hold exactly the generated dataset for (scale, seed).
+
+    Does nothing if it already does; otherwise replaces any previously
+    generated rows, building the cache file first if needed. With
+    cache_dir=None the dataset is generated into a temporary file that is
+    discarded afterwards.
+
+    Returns:
+        Rows copied per table (empty if the data was already loaded)
+    """
+    fingerprint = data_fingerprint(scale, seed)
+    if loaded_fingerprint(conn) == fingerprint:
+        print(f"📊 Test data (scale {scale:g}, seed {seed}) already loaded, skipping creation")
+        return {}
+
+    temp_dir = None
+    if cache_dir is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix='tothub-test-data-')
+        cache_dir = Path(temp_dir.name)
+    path = cache_path(scale, seed, cache_dir)
+    try:
+        if path.exists():
+            print(f"📦 Using cached test data: {path}")
+        else:
+            counts = scaled_counts(scale)
+            print(f"📊 Generating test data (scale {scale:g}): {counts['users']:,} users, "
+                  f"{counts['children']:,} children, {counts['schedules']:,} schedules, "
+                  f"{counts['attendance']:,} attendance rows...")
+            started = time.perf_counter()
+            build_cache(path, scale, seed)
+            print(f"✅ Generated in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        clear_test_data(conn)
+        copied = load_cache(conn, path, fingerprint)
+        print(f"✅ Loaded {sum(copied.values()):,} rows in {time.perf_counter() - started:.1f}s "
+              f"({', '.join(f'{table}: {rows:,}' for table, rows in copied.items())})")
+        return copied
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load scaled test data into a TotHub SQLite database')
+    parser.add_argument('database_path')
+    parser.add_argument('--scale', type=float, default=0.01,
+                        help='1.0 = 100k users, 500k schedules, 5M attendance rows')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--no-cache', action='store_true', help='Generate without keeping a cache file')
+    parser.add_argument('--clear', action='store_true', help='Only remove previously generated rows')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.database_path)
+    try:
+        if args.clear:
+            clear_test_data(conn)
+            with conn:
+                conn.execute(f"DROP TABLE IF EXISTS {META_TABLE}")
+            print("✅ Test data removed")
+        else:
+            ensure_test_data(conn, args.scale, args.seed, None if args.no_cache else args.cache_dir)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Query benchmarking harness for TotHub
+Times queries with perf_counter_ns, measuring execute and fetch separately.
+Each query is warmed up until its timings stop drifting, then run for an
+adaptive number of iterations (a time budget bounded by min/max counts).
+Results are reported as distributions: p50/p95/p99 with bootstrap
+confidence intervals rather than a single mean.
+
+Works with any DB-API connection (sqlite3 or psycopg2); queries use the
+connection's own paramstyle. Bootstrapping uses NumPy from the 'seed' extra
+(pip install '.[seed]'); without it fewer resamples are drawn.
+"""
+
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional 'seed' extra: bootstrap falls back to pure Python with fewer resamples
+    np = None
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class QueryCase:
+    """
+    One benchmarked query.
+
+    Iterations cycle through `params`, so a case covers a realistic spread
+    of lookups instead of one hot row. `param_sql`, if given, is run once to
+    draw the parameter sets from the data itself; `params` is the fallback
+    when it returns nothing.
+    """
+    name: str
+    sql: str
+    params: List[Sequence[Any]] = field(default_factory=lambda: [()])
+    param_sql: Optional[str] = None
+
+
+@dataclass
+class BenchmarkConfig:
+    """Iteration and stability controls"""
+    min_iterations: int = 30
+    max_iterations: int = 10000
+    time_budget: float = 1.0  # seconds of measured iterations per query
+    warmup_window: int = 10
+    warmup_cv: float = 0.10  # stop warming up once a window's median moves less than this
+    max_warmup: int = 500
+    bootstrap_resamples: int = 1000
+    bootstrap_max_samples: int = 2000  # CIs are bootstrapped from at most this many timings
+    confidence: float = 0.95
+    seed: int = 42
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def bootstrap_ci(values: Sequence[float], pct: float, resamples: int = 1000,
+                 confidence: float = 0.95, seed: int = 42) -> Tuple[float, float]:
+    """
+    Percentile-bootstrap confidence interval for a percentile.
+
+    Returns:
+        (low, high) bounds at `confidence`
+    """
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return value, value
+    alpha = (1 - confidence) / 2
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        data = np.asarray(values, dtype=float)
+        samples = rng.choice(data, size=(resamples, len(data)), replace=True)
+        estimates = np.percentile(samples, pct, axis=1)
+        low, high = np.percentile(estimates, [alpha * 100, (1 - alpha) * 100])
+        return float(low), float(high)
+    rng = random.Random(seed)
+    resamples = min(resamples, 200)
+    estimates = sorted(
+        percentile(sorted(rng.choices(values, k=len(values))), pct) for _ in range(resamples)
+    )
+    return percentile(estimates, alpha * 100), percentile(estimates, (1 - alpha) * 100)
+
+
+def summarize(values_ns: Sequence[int], config: BenchmarkConfig) -> Dict[str, Any]:
+    """
+    Distribution of timings in milliseconds, with bootstrap CIs for each percentile.
+
+    Percentiles use every timing. The CIs are bootstrapped from a random
+    subsample of at most `bootstrap_max_samples` timings, which keeps the
+    resample matrix small (and errs towards wider intervals).
+    """
+    values = sorted(v / 1e6 for v in values_ns)
+    ci_values = values
+    if len(values) > config.bootstrap_max_samples:
+        ci_values = random.Random(config.seed).sample(values, config.bootstrap_max_samples)
+    summary: Dict[str, Any] = {
+        'n': len(values),
+        'min': values[0] if values else 0.0,
+        'max': values[-1] if values else 0.0,
+        'mean': statistics.fmean(values) if values else 0.0,
+        'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+        'ci_samples': len(ci_values),
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}'] = percentile(values, pct)
+        summary[f'p{pct}_ci'] = list(bootstrap_ci(ci_values, pct, config.bootstrap_resamples,
+                                                  config.confidence, config.seed))
+    return summary
+
+
+def load_params(conn, case: QueryCase) -> List[Sequence[Any]]:
+    """Parameter sets for a case, drawn from the data when `param_sql` is set"""
+    if case.param_sql:
+        cursor = conn.cursor()
+        cursor.execute(case.param_sql)
+        rows = [tuple(row) for row in cursor.fetchall()]
+        if rows:
+            return rows
+    return list(case.params) or [()]
+
+
+def _run_once(cursor, sql: str, params: Sequence[Any]) -> Tuple[int, int, int]:
+    start = time.perf_counter_ns()
+    cursor.execute(sql, params)
+    executed = time.perf_counter_ns()
+    rows = cursor.fetchall()
+    fetched = time.perf_counter_ns()
+    return executed - start, fetched - executed, len(rows)
+
+
+def _window_cv(values: Sequence[int]) -> float:
+    mean = statistics.fmean(values)
+    return statistics.stdev(values) / mean if mean and len(values) > 1 else 0.0
+
+
+def benchmark_query(conn, case: QueryCase, config: Optional[BenchmarkConfig] = None) -> Dict[str, Any]:
+    """
+    Warm up, then time one query case.
+
+    Warmup runs windows of `warmup_window` iterations until two consecutive
+    window medians differ by less than `warmup_cv` (relative) or
+    `max_warmup` iterations have run. Measurement then runs at least
+    `min_iterations` and at most `max_iterations`, stopping once
+    `time_budget` seconds have been spent.
+
+    Returns:
+        Dict with execute/fetch/total distributions (ms), iteration counts
+        and rows per execution
+    """
+    config = config or BenchmarkConfig()
+    params = load_params(conn, case)
+    cursor = conn.cursor()
+
+    warmup, previous, stable = 0, None, False
+    while warmup < config.max_warmup and not stable:
+        window = []
+        for i in range(config.warmup_window):
+            execute_ns, fetch_ns, _ = _run_once(cursor, case.sql, params[(warmup + i) % len(params)])
+            window.append(execute_ns + fetch_ns)
+        warmup += config.warmup_window
+        median = statistics.median(window)
+        stable = previous is not None and abs(median - previous) <= config.warmup_cv * previous
+        previous = median
+
+    execute_times: List[int] = []
+    fetch_times: List[int] = []
+    rows: List[int] = []
+    deadline = time.perf_counter_ns() + int(config.time_budget * 1e9)
+    while len(execute_times) < config.max_iterations and (
+            len(execute_times) < config.min_iterations or time.perf_counter_ns() < deadline):
+        execute_ns, fetch_ns, row_count = _run_once(
+            cursor, case.sql, params[len(execute_times) % len(params)])
+        execute_times.append(execute_ns)
+        fetch_times.append(fetch_ns)
+        rows.append(row_count)
+
+    total_times = [e + f for e, f in zip(execute_times, fetch_times)]
+    return {
+        'name': case.name,
+        'sql': case.sql,
+        'param_sets': len(params),
+        'warmup_iterations': warmup,
+        'warmup_stable': stable,
+        'iterations': len(total_times),
+        'rows_mean': statistics.fmean(rows) if rows else 0.0,
+        'cv': _window_cv(total_times),
+        'execute_ms': summarize(execute_times, config),
+        'fetch_ms': summarize(fetch_times, config),
+        'total_ms': summarize(total_times, config),
+    }
+
+
+def format_distribution(stats: Dict[str, Any]) -> str:
+    """One-line summary, e.g. p50 0.12 ms [0.11-0.12]  p95 ...  p99 ..."""
+    return '  '.join(
+        f"p{pct} {stats[f'p{pct}']:.3f} ms [{stats[f'p{pct}_ci'][0]:.3f}-{stats[f'p{pct}_ci'][1]:.3f}]"
+        for pct in PERCENTILES
+    )
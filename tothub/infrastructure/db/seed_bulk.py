@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Bulk seed script for TotHub database
+Loads large volumes of staff, parents, children, attendance and billing for
+load testing, using COPY and multi-row INSERTs instead of one round trip
+per row. DATABASE_URL may also name a SQLite file (sqlite:///bench.db) to
+generate benchmark data without a database server.
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+from faker import Faker
+
+from bulk_loader import print_load_stats
+from db_backends import PostgresBackend, make_backend
+from hashing import hash_many
+from seed_data_complete import clear_existing_data
+
+fake = Faker()
+
+STAFF_COLUMNS = (
+    'first_name', 'last_name', 'email', 'phone_number', 'address',
+    'date_of_birth', 'ssn', 'position', 'department', 'hire_date',
+    'employment_type', 'wage_type', 'hourly_rate', 'salary',
+    'emergency_contact_name', 'emergency_contact_phone',
+    'certifications', 'background_check_date', 'fingerprint_on_file',
+    'health_screening_date', 'pin_hash', 'employee_id', 'is_active',
+)
+PARENT_COLUMNS = (
+    'first_name', 'last_name', 'email', 'phone_number', 'address',
+    'emergency_priority', 'relationship', 'can_pickup',
+    'id_verified', 'notes', 'is_active',
+)
+CHILD_COLUMNS = (
+    'first_name', 'last_name', 'date_of_birth', 'gender',
+    'enrollment_date', 'classroom', 'allergies', 'medical_conditions',
+    'medications', 'emergency_contact_name', 'emergency_contact_phone',
+    'pediatrician_name', 'pediatrician_phone', 'notes',
+    'parent_id', 'profile_image', 'age_months', 'is_active',
+)
+ATTENDANCE_COLUMNS = (
+    'child_id', 'date', 'check_in_time', 'check_out_time',
+    'checked_in_by', 'checked_out_by', 'status', 'notes',
+    'mood_at_checkin', 'mood_rating', 'activities_participated',
+    'temperature', 'photo_url',
+)
+BILLING_COLUMNS = (
+    'child_id', 'billing_date', 'due_date', 'amount_due',
+    'amount_paid', 'payment_date', 'payment_method',
+    'invoice_number', 'status', 'late_fee', 'notes',
+)
+
+POSITIONS = [('Director', 75000), ('Lead Teacher', 45000), ('Teacher', 40000),
+             ('Assistant Teacher', 35000), ('Floater', 35000)]
+
+
+def generate_staff(count):
+    """Yield staff rows shaped like the complete profile's staff (seed_profiles.py)"""
+    today = datetime.now().date()
+    # bcrypt dominates staff generation, so hash every PIN up front in parallel
+    pin_hashes = hash_many(f"{random.randint(0, 9999):04d}" for _ in range(count))
+    for i in range(count):
+        first, last = fake.first_name(), fake.last_name()
+        position, salary = POSITIONS[0] if i == 0 else random.choice(POSITIONS[1:])
+        yield (
+            first, last, f"{first}.{last}.{i + 1}@tothub.com".lower(),
+            fake.phone_number(), fake.address(),
+            fake.date_of_birth(minimum_age=25, maximum_age=55),
+            f'XXX-XX-{random.randint(1000, 9999)}',  # Masked SSN
+            position, 'Education',
+            today - timedelta(days=random.randint(180, 1825)),
+            'full-time', 'salary', None, salary,
+            fake.name(), fake.phone_number(),
+            ['CPR', 'First Aid'] if random.random() < 0.6 else ['CPR'],
+            today - timedelta(days=30),
+            True,
+            today - timedelta(days=60),
+            pin_hashes[i],
+            f'EMP{str(i + 1).zfill(5)}',
+            True,
+        )
+
+
+def generate_parents(count):
+    """Yield parent rows shaped like the complete profile's parents"""
+    for i in range(count):
+        first, last = fake.first_name(), fake.last_name()
+        yield (
+            first, last, f"{first}.{last}.{i + 1}@example.com".lower(),
+            fake.phone_number(), fake.address(),
+            1 if i % 2 == 0 else 2,
+            'Mother' if i % 2 == 0 else 'Father',
+            True, True,
+            'Primary contact' if i % 2 == 0 else None,
+            True,
+        )
+
+
+def generate_children(count, parent_ids):
+    """Yield child rows shaped like the complete profile's children"""
+    today = datetime.now().date()
+    rooms = ['infant', 'toddler', 'preschool']
+    for i in range(count):
+        age = random.randint(1, 5)
+        yield (
+            fake.first_name(), fake.last_name(),
+            today - timedelta(days=age * 365),
+            random.choice(['M', 'F']),
+            today - timedelta(days=random.randint(30, 180)),
+            random.choice(rooms),
+            'Peanuts' if i % 5 == 0 else None,
+            'Asthma' if i % 4 == 0 else None,
+            'Inhaler PRN' if i % 4 == 0 else None,
+            fake.name(), fake.phone_number(),
+            f"Dr. {fake.last_name()}", fake.phone_number(),
+            f"Loves {random.choice(['art', 'music', 'reading', 'blocks'])}",
+            parent_ids[i % len(parent_ids)],
+            None, age * 12, True,
+        )
+
+
+def generate_attendance(child_ids, staff_ids, days, attendance_rate=0.85):
+    """Yield one attendance row per attending child per weekday"""
+    today = datetime.now().date()
+    for days_ago in range(days):
+        day = today - timedelta(days=days_ago)
+        if day.weekday() >= 5:
+            continue
+        for child_id in child_ids:
+            if random.random() > attendance_rate:
+                continue
+            check_in = datetime.combine(day, datetime.min.time()).replace(
+                hour=random.randint(7, 9), minute=random.randint(0, 59))
+            check_out = check_in + timedelta(hours=random.randint(6, 9))
+            yield (
+                child_id, day, check_in,
+                check_out if days_ago > 0 else None,
+                random.choice(staff_ids),
+                random.choice(staff_ids) if days_ago > 0 else None,
+                'present', None,
+                random.choice(['happy', 'calm', 'tired', 'excited']),
+                random.randint(3, 5),
+                ['Circle Time', 'Snack', 'Outdoor Play'],
+                round(98.6 + random.random(), 1),
+                None,
+            )
+
+
+def generate_billing(child_ids, months):
+    """Yield one billing row per child per month"""
+    first_of_month = datetime.now().date().replace(day=1)
+    for month_offset in range(months):
+        year, month = divmod(first_of_month.year * 12 + first_of_month.month - 1 - month_offset, 12)
+        billing_date = first_of_month.replace(year=year, month=month + 1)
+        due_date = billing_date + timedelta(days=5)
+        for child_id in child_ids:
+            amount = random.choice([800, 900, 1000, 1200])
+            paid = month_offset > 0 or random.choice([True, False])
+            yield (
+                child_id, billing_date, due_date, amount,
+                amount if paid else 0,
+                billing_date + timedelta(days=random.randint(1, 5)) if paid else None,
+                random.choice(['credit_card', 'check', 'cash']) if paid else None,
+                f"INV-{billing_date.strftime('%Y%m')}-{str(child_id).zfill(6)}",
+                'paid' if paid else 'pending',
+                0, None,
+            )
+
+
+def bulk_seed(conn, staff=50, parents=2000, children=3000, days=30, months=12,
+              batch_size=5000, backend=None):
+    """
+    Bulk load the core tables in dependency order.
+
+    Args:
+        backend: db_backends backend for conn (default: Postgres)
+
+    Returns:
+        List of LoadStats, one per table
+    """
+    backend = backend or PostgresBackend()
+    results = []
+    staff_ids, stats = backend.insert_returning_ids(conn, 'staff', STAFF_COLUMNS,
+                                                    generate_staff(staff), batch_size)
+    results.append(stats)
+    parent_ids, stats = backend.insert_returning_ids(conn, 'parents', PARENT_COLUMNS,
+                                                     generate_parents(parents), batch_size)
+    results.append(stats)
+    child_ids, stats = backend.insert_returning_ids(conn, 'children', CHILD_COLUMNS,
+                                                    generate_children(children, parent_ids), batch_size)
+    results.append(stats)
+    results.append(backend.bulk_load(conn, 'attendance', ATTENDANCE_COLUMNS,
+                                     generate_attendance(child_ids, staff_ids, days), batch_size))
+    results.append(backend.bulk_load(conn, 'billing', BILLING_COLUMNS,
+                                     generate_billing(child_ids, months), batch_size))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk load TotHub seed data for load testing')
+    parser.add_argument('--staff', type=int, default=50)
+    parser.add_argument('--parents', type=int, default=2000)
+    parser.add_argument('--children', type=int, default=3000)
+    parser.add_argument('--days', type=int, default=30, help='Days of attendance history')
+    parser.add_argument('--months', type=int, default=12, help='Months of billing history')
+    parser.add_argument('--scale', type=int, metavar='CENTERS',
+                        help='Generate a realistic multi-year dataset for this many centers '
+                             '(replaces the per-table counts)')
+    parser.add_argument('--years', type=float, default=2.0, help='Years of history with --scale')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed with --scale')
+    parser.add_argument('--pure-python', action='store_true',
+                        help='Use the per-row generators even if NumPy is installed')
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help='Rows per COPY statement / multi-row INSERT')
+    parser.add_argument('--no-clear', action='store_true', help='Keep existing data')
+    parser.add_argument('--yes', action='store_true', help='Do not ask before clearing data')
+    args = parser.parse_args()
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("Error: DATABASE_URL environment variable not set")
+        return 1
+
+    backend = make_backend(database_url)
+    conn = backend.connect()
+    try:
+        backend.prepare(conn)
+        if not args.no_clear:
+            if not args.yes:
+                response = input("\nThis will clear existing data. Continue? (yes/no): ")
+                if response.lower() != 'yes':
+                    print("Seeding cancelled.")
+                    return 0
+            print("\nClearing existing data...")
+            clear_existing_data(conn, backend)
+
+        if args.scale:
+            from synthetic_data import ScaleConfig, load_dataset
+            from vectorized_data import make_dataset
+            dataset = make_dataset(ScaleConfig(centers=args.scale, years=args.years, seed=args.seed),
+                                   vectorized=not args.pure_python)
+            counts = dataset.counts()
+            print(f"\nGenerating {args.scale} center(s), {args.years:g} years: "
+                  f"{counts['staff']:,} staff, {counts['parents']:,} parents, "
+                  f"{counts['children']:,} children")
+            print_load_stats(load_dataset(conn, dataset, args.batch_size, backend))
+        else:
+            print("\nBulk loading data...")
+            print_load_stats(bulk_seed(conn, args.staff, args.parents, args.children,
+                                       args.days, args.months, args.batch_size, backend))
+        return 0
+    except Exception as e:
+        conn.rollback()
+        print(f"\n❌ Error during bulk seeding: {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
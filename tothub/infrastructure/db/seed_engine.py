@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Declarative seeding engine for TotHub
+Tables are described by TableSpecs (columns, value generators, foreign-key
+sources) grouped into profiles (see seed_profiles.py). The engine reads the
+live schema once, skips tables and columns the database does not have,
+orders tables by their references and loads each one with the fastest path
+available: bulk load (COPY on Postgres) for large tables nothing references,
+multi-row INSERT for small tables and upserts, and INSERT ... RETURNING when
+later tables need the ids. Postgres and SQLite are both supported through
+db_backends.py.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from faker import Faker
+
+from bulk_loader import LoadStats
+from db_backends import make_backend
+from seed_orchestrator import SeedOrchestrator, Stage, print_stage_report
+
+# Tables at least this large (and not referenced by id) are bulk loaded
+COPY_MIN_ROWS = 1000
+
+# Parsed schemas keyed by DSN, so each process introspects a database once
+_schema_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+
+class RowContext:
+    """
+    State handed to value generators while a table's rows are built.
+
+    Attributes:
+        i: Index of the row being generated
+        row: Values generated so far for this row, in column order
+        rng: random.Random seeded per table
+        fake: Faker seeded per table
+        now / today: Timestamp shared by every row of the run
+    """
+
+    def __init__(self, table: str, seed: Any, ids: Dict[str, List[Any]], now: datetime,
+                 generated: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.table = table
+        self.rng = random.Random(f"{seed}:{table}")
+        self.fake = Faker()
+        self.fake.seed_instance(f"{seed}:{table}")
+        self.now = now
+        self.today = now.date()
+        self.i = 0
+        self.row: Dict[str, Any] = {}
+        self._ids = ids
+        self._generated = generated or {}
+
+    def ids(self, table: str) -> List[Any]:
+        """Ids of a referenced table, in insertion order"""
+        return self._ids.get(table, [])
+
+    def generated(self, table: str) -> List[Dict[str, Any]]:
+        """Rows generated for a referenced table in this run, in id order"""
+        return self._generated.get(table, [])
+
+    def ref(self, table: str) -> Any:
+        """A random id from a referenced table"""
+        ids = self.ids(table)
+        return self.rng.choice(ids) if ids else None
+
+    def cycle(self, table: str) -> Any:
+        """The referenced id at position i, wrapping around"""
+        ids = self.ids(table)
+        return ids[self.i % len(ids)] if ids else None
+
+
+Generator = Union[Callable[[RowContext], Any], Any]
+
+
+@dataclass
+class TableSpec:
+    """
+    How to seed one table.
+
+    Rows come from `rows` (a callable returning dicts, for fixed data or
+    tables whose shape depends on other tables) or are `count` empty rows.
+    Each `columns` entry then fills its column unless the row already has
+    it: callables are called with the RowContext, anything else is used as
+    a constant. `references` map foreign-key columns to the table they
+    point at; unfilled ones get ctx.cycle(table).
+    """
+    table: str
+    columns: Dict[str, Generator] = field(default_factory=dict)
+    count: Union[int, Callable[[RowContext], int]] = 0
+    rows: Optional[Callable[[RowContext], Iterable[Dict[str, Any]]]] = None
+    references: Dict[str, str] = field(default_factory=dict)
+    after: Tuple[str, ...] = ()  # other tables whose ids or rows the generators use
+    requires: Tuple[str, ...] = ()  # skip the table unless these columns exist
+    on_conflict: Optional[str] = None  # e.g. "(key) DO UPDATE SET value = EXCLUDED.value"
+    key: str = 'id'
+
+    @property
+    def depends_on(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(list(self.references.values()) + list(self.after)))
+
+
+@dataclass
+class Profile:
+    """A named set of table specs plus how to reset before seeding"""
+    name: str
+    description: str
+    tables: List[TableSpec]
+    clear: Tuple[str, ...] = ()  # tables to truncate before seeding
+    post_steps: List[Callable[[Any, Any], None]] = field(default_factory=list)  # step(conn, backend)
+
+
+@dataclass
+class TableLoad:
+    """How a table was loaded"""
+    table: str
+    path: str  # 'bulk', 'values', 'returning' or 'skipped'
+    stats: LoadStats
+    note: str = ''
+
+
+def choose_load_path(spec: TableSpec, row_count: int, needs_ids: bool) -> str:
+    """Pick the fastest load path that still gives the engine what it needs"""
+    if needs_ids:
+        return 'returning'
+    if spec.on_conflict or row_count < COPY_MIN_ROWS:
+        return 'values'
+    return 'bulk'
+
+
+class SeedEngine:
+    """
+    Seeds a database from a Profile.
+
+    Example:
+        engine = SeedEngine(DATABASE_URL)  # or 'sqlite:///bench.db'
+        engine.run(PROFILES['complete'])
+    """
+
+    def __init__(self, dsn: str, seed: Any = None, max_workers: int = 4, backend=None):
+        """
+        Args:
+            dsn: Database URL (Postgres DSN or SQLite path/URL)
+            seed: Seed for generated values (None: different data each run)
+            max_workers: Tables loaded at once (1 on backends with a single writer)
+            backend: Backend to use (default: make_backend(dsn))
+        """
+        self.backend = backend or make_backend(dsn)
+        self.dsn = self.backend.dsn
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.max_workers = max_workers if self.backend.concurrent_writes else 1
+        self.connect = self.backend.connect
+        self.loads: Dict[str, TableLoad] = {}
+        self.generated: Dict[str, List[Dict[str, Any]]] = {}
+
+    @property
+    def schema(self) -> Dict[str, Dict[str, str]]:
+        if self.dsn not in _schema_cache:
+            conn = self.connect(self.dsn)
+            try:
+                _schema_cache[self.dsn] = self.backend.introspect_schema(conn)
+            finally:
+                conn.close()
+        return _schema_cache[self.dsn]
+
+    def refresh_schema(self) -> None:
+        """Forget the cached schema, e.g. after a migration"""
+        _schema_cache.pop(self.dsn, None)
+
+    def _existing_ids(self, tables: Iterable[str]) -> Dict[str, List[Any]]:
+        """Ids already in the database for referenced tables outside the profile"""
+        ids = {}
+        conn = self.connect(self.dsn)
+        try:
+            cur = conn.cursor()
+            for table in tables:
+                if 'id' in self.schema.get(table, {}):
+                    cur.execute(f"SELECT id FROM {table} ORDER BY id")
+                    ids[table] = [row[0] for row in cur.fetchall()]
+                else:
+                    ids[table] = []
+        finally:
+            conn.close()
+        return ids
+
+    def generate(self, spec: TableSpec, ids: Dict[str, List[Any]],
+                 now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Build the rows for a spec as dicts"""
+        ctx = RowContext(spec.table, self.seed, ids, now or datetime.now(), self.generated)
+        if spec.rows is not None:
+            base = spec.rows(ctx)
+        else:
+            count = spec.count(ctx) if callable(spec.count) else spec.count
+            base = ({} for _ in range(count))
+        rows = []
+        for i, row in enumerate(base):
+            ctx.i, ctx.row = i, dict(row)
+            for column, generator in spec.columns.items():
+                if column not in ctx.row:
+                    ctx.row[column] = generator(ctx) if callable(generator) else generator
+            for column, table in spec.references.items():
+                if column not in ctx.row:
+                    ctx.row[column] = ctx.cycle(table)
+            rows.append(ctx.row)
+        return rows
+
+    def load_table(self, conn, spec: TableSpec, ids: Dict[str, List[Any]],
+                   needs_ids: bool) -> List[Any]:
+        """
+        Generate and load one table in the connection's open transaction.
+
+        Returns:
+            Inserted ids when needs_ids, otherwise an empty list
+        """
+        live = self.schema.get(spec.table)
+        if live is None:
+            return self._skip(spec, 'table does not exist')
+        missing = [column for column in spec.requires if column not in live]
+        if missing:
+            return self._skip(spec, f"missing columns {', '.join(missing)}")
+
+        rows = self.generate(spec, ids)
+        columns = list(rows[0]) if rows else []
+        dropped = [column for column in columns if column not in live]
+        columns = [column for column in columns if column in live]
+        values = [tuple(row.get(column) for column in columns) for row in rows]
+        note = f"dropped {', '.join(dropped)}" if dropped else ''
+
+        if needs_ids:
+            self.generated[spec.table] = rows
+        path = choose_load_path(spec, len(values), needs_ids)
+        inserted: List[Any] = []
+        if not values:
+            stats = LoadStats(spec.table)
+        elif path == 'returning':
+            inserted, stats = self.backend.insert_returning_ids(conn, spec.table, columns, values,
+                                                                commit=False)
+        elif path == 'bulk':
+            stats = self.backend.bulk_load(conn, spec.table, columns, values, commit=False)
+        else:
+            suffix = f"ON CONFLICT {spec.on_conflict}" if spec.on_conflict else ''
+            stats = self.backend.insert_values(conn, spec.table, columns, values, suffix=suffix,
+                                               commit=False)
+
+        self.loads[spec.table] = TableLoad(spec.table, path, stats, note)
+        print(f"✓ {spec.table}: {stats.rows} rows via {path}" + (f" ({note})" if note else ''))
+        return inserted
+
+    def _skip(self, spec: TableSpec, reason: str) -> List[Any]:
+        self.loads[spec.table] = TableLoad(spec.table, 'skipped', LoadStats(spec.table), reason)
+        print(f"⚠️  Skipping {spec.table} - {reason}")
+        return []
+
+    def run(self, profile: Profile, clear: bool = True) -> bool:
+        """
+        Seed every table in a profile.
+
+        Tables whose references are all loaded run concurrently, each on its
+        own connection in one transaction. References to tables outside the
+        profile use the ids already in the database.
+
+        Returns:
+            True if every table loaded
+        """
+        conn = self.connect(self.dsn)
+        try:
+            if self.backend.prepare(conn):
+                self.refresh_schema()
+            if clear and profile.clear:
+                missing = self.backend.clear_tables(conn, profile.clear)
+                print(f"  Cleared {len(profile.clear) - len(missing)} tables")
+        finally:
+            conn.close()
+
+        names = {spec.table for spec in profile.tables}
+        referenced = {table for spec in profile.tables for table in spec.depends_on}
+        external = self._existing_ids(referenced - names)
+
+        def stage(spec: TableSpec) -> Stage:
+            def run(conn, results):
+                return self.load_table(conn, spec, {**external, **results}, spec.table in referenced)
+            return Stage(spec.table, run, tuple(dep for dep in spec.depends_on if dep in names))
+
+        orchestrator = SeedOrchestrator(self.dsn, [stage(spec) for spec in profile.tables],
+                                        self.max_workers, self.connect)
+        ok = print_stage_report(orchestrator.run(), orchestrator.wall_seconds)
+
+        if ok and profile.post_steps:
+            conn = self.connect(self.dsn)
+            try:
+                for step in profile.post_steps:
+                    step(conn, self.backend)
+                conn.commit()
+            finally:
+                conn.close()
+        return ok
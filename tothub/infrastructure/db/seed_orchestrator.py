@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware seeding for TotHub
+Runs seed stages as a DAG: a stage starts as soon as every stage it depends
+on has finished, independent stages run concurrently on their own
+connections, and each stage is a single transaction.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import psycopg2
+
+
+@dataclass
+class Stage:
+    """
+    One seeding step.
+
+    `run` is called as run(conn, results), where results maps the names of
+    finished stages to their return values (e.g. the ids they inserted).
+    """
+    name: str
+    run: Callable[[Any, Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageResult:
+    """Outcome and timing of one stage"""
+    name: str
+    status: str  # 'ok', 'failed' or 'skipped'
+    started: float = 0.0  # seconds after the run began
+    seconds: float = 0.0
+    value: Any = None
+    error: Optional[str] = None
+
+
+def check_dag(stages: Sequence[Stage]) -> List[str]:
+    """
+    Validate stage dependencies and return a topological order.
+
+    Raises:
+        ValueError: On duplicate names, unknown dependencies or cycles
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"duplicate stage '{stage.name}'")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dep in stage.depends_on:
+            if dep not in by_name:
+                raise ValueError(f"stage '{stage.name}' depends on unknown stage '{dep}'")
+
+    order, state = [], {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = 'visiting'
+        for dep in by_name[name].depends_on:
+            visit(dep, path + [name])
+        state[name] = 'done'
+        order.append(name)
+
+    for stage in stages:
+        visit(stage.name, [])
+    return order
+
+
+class SeedOrchestrator:
+    """
+    Runs seed stages concurrently in dependency order.
+
+    Example:
+        orchestrator = SeedOrchestrator(DATABASE_URL, SEED_STAGES)
+        results = orchestrator.run()
+        print_stage_report(results, orchestrator.wall_seconds)
+    """
+
+    def __init__(self, dsn: str, stages: Sequence[Stage], max_workers: int = 4,
+                 connect: Callable[[str], Any] = psycopg2.connect):
+        """
+        Args:
+            dsn: Database connection string; each stage opens its own connection
+            stages: Stages to run
+            max_workers: Maximum stages running at once
+            connect: Connection factory
+        """
+        check_dag(stages)
+        self.dsn = dsn
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self.connect = connect
+        self.wall_seconds = 0.0
+
+    def _run_stage(self, stage: Stage, values: Dict[str, Any], origin: float) -> StageResult:
+        started = time.perf_counter()
+        result = StageResult(stage.name, 'ok', started - origin)
+        conn = self.connect(self.dsn)
+        try:
+            result.value = stage.run(conn, values)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            result.status, result.error = 'failed', str(e)
+        finally:
+            conn.close()
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def run(self) -> Dict[str, StageResult]:
+        """
+        Run every stage; dependents of a failed stage are skipped.
+
+        Returns:
+            Results keyed by stage name, in completion order
+        """
+        origin = time.perf_counter()
+        pending = {stage.name: stage for stage in self.stages}
+        results: Dict[str, StageResult] = {}
+        values: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='seed') as pool:
+            running = {}
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    blocked = [dep for dep in stage.depends_on
+                               if dep in results and results[dep].status != 'ok']
+                    if blocked:
+                        results[name] = StageResult(name, 'skipped',
+                                                    error=f"dependency failed: {', '.join(blocked)}")
+                        del pending[name]
+                    elif all(dep in values for dep in stage.depends_on):
+                        future = pool.submit(self._run_stage, stage, dict(values), origin)
+                        running[future] = stage
+                        del pending[name]
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    result = future.result()
+                    results[stage.name] = result
+                    if result.status == 'ok':
+                        values[stage.name] = result.value
+        self.wall_seconds = time.perf_counter() - origin
+        return results
+
+
+def print_stage_report(results: Dict[str, StageResult], wall_seconds: float) -> bool:
+    """
+    Print per-stage timing.
+
+    Returns:
+        True if every stage succeeded
+    """
+    print("\n=== Seed Stage Timing ===")
+    print(f"{'Stage':<20} {'Start':>8} {'Duration':>10}  Status")
+    for result in sorted(results.values(), key=lambda r: (r.status == 'skipped', r.started)):
+        mark = {'ok': '✓', 'failed': '✗', 'skipped': '-'}[result.status]
+        line = f"{result.name:<20} {result.started:>7.2f}s {result.seconds:>9.2f}s  {mark} {result.status}"
+        if result.error:
+            line += f" ({result.error.strip().splitlines()[0]})"
+        print(line)
+    serial = sum(r.seconds for r in results.values())
+    print(f"Wall clock: {wall_seconds:.2f}s (stages sum to {serial:.2f}s, "
+          f"{serial / wall_seconds if wall_seconds else 0:.1f}x overlap)")
+    return all(r.status == 'ok' for r in results.values())
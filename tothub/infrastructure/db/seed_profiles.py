@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+"""
+Seed profiles for the TotHub seeding engine
+Each profile describes the data one of the seed scripts loads:
+
+    complete  seed_data_complete.py - every core table, current schema
+    minimal   seed_minimal.py       - settings, staff, parents, children, attendance, billing
+    final     seed_final.py         - the auth-style parents/staff schema
+    sample    seed_data.py          - extras layered on top of existing data
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from hashing import hash_many
+from seed_engine import Profile, RowContext, TableSpec
+
+# Tables cleared before a full reseed, in reverse dependency order
+ALL_TABLES = (
+    'session_activity', 'billing', 'attendance', 'child_schedules',
+    'staff_schedules', 'messages', 'alerts', 'daily_reports',
+    'media_shares', 'teacher_notes', 'documents', 'document_reminders',
+    'document_renewals', 'safety_reminder_completions', 'security_logs',
+    'pay_stubs', 'timesheet_entries', 'payroll_audit', 'payroll_reports',
+    'security_credentials', 'children', 'parents', 'staff',
+    'room_schedules', 'schedule_templates', 'security_devices',
+    'security_zones', 'state_compliance', 'state_ratios',
+    'safety_reminders', 'document_types', 'pay_periods', 'settings'
+)
+
+SETTINGS = [
+    ('facility_name', 'TotHub Learning Center'),
+    ('facility_address', '123 Education Way, Learning City, ST 12345'),
+    ('facility_phone', '(555) 123-4567'),
+    ('facility_email', 'info@tothub.com'),
+    ('business_hours', '7:00 AM - 6:00 PM'),
+    ('time_zone', 'America/New_York'),
+    ('state', 'NY'),
+    ('license_number', 'DC-2024-123456'),
+    ('capacity', '100'),
+    ('age_limit', '14')
+]
+
+SETTINGS_UPSERT = "(key) DO UPDATE SET value = EXCLUDED.value"
+
+
+def settings_spec(settings) -> TableSpec:
+    return TableSpec(
+        'settings',
+        rows=lambda ctx: ({'key': key, 'value': value} for key, value in settings),
+        columns={'updated_at': lambda ctx: ctx.now},
+        on_conflict=SETTINGS_UPSERT, key='key'
+    )
+
+
+def staff_email(ctx: RowContext) -> str:
+    return f"{ctx.row['first_name'][0].lower()}{ctx.row['last_name'].lower()}@tothub.com"
+
+
+def masked_ssn(ctx: RowContext) -> str:
+    return f'XXX-XX-{ctx.rng.randint(1000, 9999)}'
+
+
+def staff_rows(members, pin_index: int):
+    """Fixed staff rows with their PINs hashed in one batch"""
+    def rows(ctx: RowContext):
+        pin_hashes = hash_many(member[pin_index] for member in members)
+        for member, pin_hash in zip(members, pin_hashes):
+            yield {'first_name': member[0], 'last_name': member[1], 'position': member[2],
+                   'pin_hash': pin_hash}
+    return rows
+
+
+def attendance_rows(days: int, min_attending: int):
+    """
+    Daily attendance for a random subset of children.
+
+    Args:
+        days: Days back from today
+        min_attending: Fewest children present on a day
+    """
+    def rows(ctx: RowContext):
+        child_ids = ctx.ids('children')
+        for days_ago in range(days):
+            day = ctx.today - timedelta(days=days_ago)
+            count = ctx.rng.randint(min(min_attending, len(child_ids)), len(child_ids))
+            for child_id in ctx.rng.sample(child_ids, count):
+                check_in = datetime.combine(day, datetime.min.time()).replace(
+                    hour=ctx.rng.randint(7, 9), minute=ctx.rng.randint(0, 59)
+                )
+                check_out = check_in + timedelta(hours=ctx.rng.randint(6, 9))
+                yield {
+                    'child_id': child_id,
+                    'date': day,
+                    'check_in_time': check_in,
+                    'check_out_time': check_out if days_ago > 0 else None,
+                    'checked_in_by': ctx.ref('staff'),
+                    'checked_out_by': ctx.ref('staff') if days_ago > 0 else None,
+                }
+    return rows
+
+
+# --- complete -----------------------------------------------------------------
+
+COMPLETE_DOCUMENT_TYPES = [
+    ('Medical Information Form', 'child', 'Medical history and conditions', True, 'annual', None, 30, 'NY Department of Health'),
+    ('Immunization Records', 'child', 'Vaccination records', True, 'annual', None, 30, 'CDC'),
+    ('Emergency Contact Form', 'child', 'Emergency contact information', True, 'semi-annual', None, 14, 'State Licensing'),
+    ('Professional License', 'staff', 'Teaching or childcare license', True, 'annual', None, 60, 'NY State Education Department'),
+    ('Background Check', 'staff', 'Criminal background check', True, 'custom', 730, 60, 'FBI/State Police'),
+    ('CPR Certification', 'staff', 'CPR training certification', False, 'annual', None, 30, 'American Heart Association'),
+    ('Allergy Information', 'child', 'Food and environmental allergies', True, 'annual', None, 30, 'Physician')
+]
+
+COMPLETE_STAFF = [
+    ('Sarah', 'Johnson', 'Director', 75000, '1234'),
+    ('Michael', 'Brown', 'Lead Teacher', 45000, '2345'),
+    ('Emily', 'Davis', 'Teacher', 40000, '3456'),
+    ('James', 'Wilson', 'Assistant Teacher', 35000, '4567'),
+    ('Lisa', 'Martinez', 'Floater', 35000, '5678')
+]
+
+COMPLETE_MESSAGES = [
+    ("Reminder: Picture Day Tomorrow", "Don't forget - tomorrow is picture day! Please have your child wear their best smile.", 'high'),
+    ("Weekly Newsletter", "This week's activities include art projects and outdoor exploration.", 'normal'),
+    ("Schedule Update", "We'll be closing early on Friday at 4 PM for staff training.", 'high'),
+    ("Thank You!", "Thank you for your participation in our recent fundraiser!", 'normal'),
+    ("Health Alert", "We've had a case of strep throat. Please monitor your child for symptoms.", 'urgent')
+]
+
+COMPLETE_ALERTS = [
+    ('low', 'Supplies Low', 'Paper towels running low in Toddler Room'),
+    ('medium', 'Staff Ratio Warning', 'Preschool room approaching maximum ratio'),
+    ('high', 'Document Expiring', '3 staff certifications expire this month'),
+    ('critical', 'Emergency Drill Due', 'Monthly fire drill has not been completed')
+]
+
+
+def _document_type_rows(ctx):
+    for name, category, description, required, frequency, custom_days, alert_days, regulatory in COMPLETE_DOCUMENT_TYPES:
+        yield {
+            'name': name, 'category': category, 'description': description,
+            'is_required': required, 'renewal_frequency': frequency,
+            'custom_frequency_days': custom_days, 'alert_days_before': alert_days,
+            'regulatory_body': regulatory,
+            'compliance_notes': f"Required by {regulatory}" if required else "Recommended",
+        }
+
+
+def _state_compliance_rows(ctx):
+    for state in ['NY', 'CA', 'TX', 'FL', 'IL']:
+        yield {
+            'state_code': state,
+            'staff_child_ratio_infant': 3 if state == 'NY' else 4,
+            'staff_child_ratio_toddler': 5 if state == 'NY' else 6,
+            'staff_child_ratio_preschool': 7 if state == 'NY' else 8,
+            'staff_child_ratio_school_age': 10 if state == 'NY' else 12,
+            'max_group_size_infant': 8,
+            'max_group_size_toddler': 12,
+            'max_group_size_preschool': 18,
+            'max_group_size_school_age': 20,
+            'training_hours_required': 30 if state == 'CA' else 24,
+            'background_check_required': True,
+            'health_screening_required': True,
+            'additional_requirements': json.dumps({'fingerprinting': state in ['NY', 'CA']}),
+        }
+
+
+def _room_schedule_rows(ctx):
+    for i in range(7):  # Next 7 days
+        day = ctx.now + timedelta(days=i)
+        for room in ['Infant Room', 'Toddler Room', 'Preschool Room']:
+            for slot in ['morning', 'afternoon', 'full_day']:
+                yield {
+                    'room': room,
+                    'date': day,
+                    'time_slot': slot,
+                    'max_capacity': 12 if room == 'Infant Room' else 20,
+                    'current_occupancy': ctx.rng.randint(5, 10),
+                    'staff_required': 2 if room == 'Infant Room' else 3,
+                    'staff_assigned': 2 if room == 'Infant Room' else 3,
+                    'is_available': True,
+                    'activities': ['Art', 'Music', 'Story Time'] if slot != 'full_day' else ['All Day Activities'],
+                    'special_requirements': 'Extra staff for field trip' if i == 3 and room == 'Preschool Room' else None,
+                    'notes': None,
+                }
+
+
+def _billing_rows(months: int, children: int, amounts, methods, invoice_suffix):
+    def rows(ctx: RowContext):
+        for month_offset in range(months):
+            billing_date = ctx.today.replace(day=1) - timedelta(days=month_offset * 30)
+            for child_id in ctx.ids('children')[:children]:
+                amount = ctx.rng.choice(amounts)
+                paid = month_offset > 0 or ctx.rng.choice([True, False])
+                yield {
+                    'child_id': child_id,
+                    'billing_date': billing_date,
+                    'due_date': billing_date + timedelta(days=5),
+                    'amount_due': amount,
+                    'amount_paid': amount if paid else 0,
+                    'payment_date': billing_date + timedelta(days=ctx.rng.randint(1, 5)) if paid else None,
+                    'payment_method': ctx.rng.choice(methods) if paid else None,
+                    'invoice_number': f"INV-{billing_date.strftime('%Y%m')}-{invoice_suffix(child_id)}",
+                    'status': 'paid' if paid else 'pending',
+                }
+    return rows
+
+
+def _document_rows(ctx):
+    doc_types = list(zip(ctx.ids('document_types'), COMPLETE_DOCUMENT_TYPES))
+    staff_ids = ctx.ids('staff')
+    owners = [('child', ctx.ids('children')[:5], 30, 335),  # First 5 children have documents
+              ('staff', staff_ids[:3], 60, 305)]  # First 3 staff have documents
+    for category, entity_ids, age_days, valid_days in owners:
+        for entity_id in entity_ids:
+            for doc_type_id, (doc_name, doc_category, *_) in doc_types:
+                if doc_category != category:
+                    continue
+                yield {
+                    'entity_type': category,
+                    'entity_id': entity_id,
+                    'document_type_id': doc_type_id,
+                    'file_name': f"{doc_name}_{entity_id}.pdf",
+                    'file_url': f"/documents/{doc_name}_{entity_id}.pdf",
+                    'status': 'current',
+                    'upload_date': ctx.today - timedelta(days=age_days),
+                    'expiration_date': ctx.today + timedelta(days=valid_days),
+                    'verified_by': staff_ids[0] if staff_ids else None,
+                    'notes': None,
+                }
+
+
+COMPLETE = Profile(
+    'complete', 'Every core table against the current schema',
+    clear=ALL_TABLES,
+    tables=[
+        settings_spec(SETTINGS),
+        TableSpec('document_types', rows=_document_type_rows),
+        TableSpec('state_compliance', rows=_state_compliance_rows),
+        TableSpec('room_schedules', rows=_room_schedule_rows),
+        TableSpec('staff', rows=staff_rows(COMPLETE_STAFF, pin_index=4), columns={
+            'email': staff_email,
+            'phone_number': lambda ctx: ctx.fake.phone_number(),
+            'address': lambda ctx: ctx.fake.address(),
+            'date_of_birth': lambda ctx: ctx.fake.date_of_birth(minimum_age=25, maximum_age=55),
+            'ssn': masked_ssn,
+            'department': 'Education',
+            'hire_date': lambda ctx: ctx.today - timedelta(days=ctx.rng.randint(180, 1825)),
+            'employment_type': 'full-time',
+            'wage_type': 'salary',
+            'hourly_rate': None,
+            'salary': lambda ctx: COMPLETE_STAFF[ctx.i][3],
+            'emergency_contact_name': lambda ctx: ctx.fake.name(),
+            'emergency_contact_phone': lambda ctx: ctx.fake.phone_number(),
+            'certifications': lambda ctx: ['CPR', 'First Aid'] if ctx.i < 3 else ['CPR'],
+            'background_check_date': lambda ctx: ctx.today - timedelta(days=30),
+            'fingerprint_on_file': True,
+            'health_screening_date': lambda ctx: ctx.today - timedelta(days=60),
+            'employee_id': lambda ctx: f'EMP{str(ctx.i + 1).zfill(3)}',
+            'is_active': True,
+        }),
+        TableSpec('parents', count=8, columns={
+            'first_name': lambda ctx: ctx.fake.first_name(),
+            'last_name': lambda ctx: ctx.fake.last_name(),
+            'email': lambda ctx: ctx.fake.email(),
+            'phone_number': lambda ctx: ctx.fake.phone_number(),
+            'address': lambda ctx: ctx.fake.address(),
+            'emergency_priority': lambda ctx: 1 if ctx.i % 2 == 0 else 2,  # Alternating priority
+            'relationship': lambda ctx: 'Mother' if ctx.i % 2 == 0 else 'Father',
+            'can_pickup': True,
+            'id_verified': True,
+            'notes': lambda ctx: 'Primary contact' if ctx.i < 4 else None,
+            'is_active': True,
+        }),
+        TableSpec('children', count=10, references={'parent_id': 'parents'}, columns={
+            'first_name': lambda ctx: ctx.fake.first_name(),
+            'last_name': lambda ctx: ctx.fake.last_name(),
+            'age_months': lambda ctx: ctx.rng.randint(1, 5) * 12,
+            'date_of_birth': lambda ctx: ctx.today - timedelta(days=ctx.row['age_months'] // 12 * 365),
+            'gender': lambda ctx: ctx.rng.choice(['M', 'F']),
+            'enrollment_date': lambda ctx: ctx.today - timedelta(days=ctx.rng.randint(30, 180)),
+            'classroom': lambda ctx: ctx.rng.choice(['infant', 'toddler', 'preschool']),
+            'allergies': lambda ctx: 'Peanuts' if ctx.i % 5 == 0 else None,
+            'medical_conditions': lambda ctx: 'Asthma' if ctx.i % 4 == 0 else None,
+            'medications': lambda ctx: 'Inhaler PRN' if ctx.i % 4 == 0 else None,
+            'emergency_contact_name': lambda ctx: ctx.fake.name(),
+            'emergency_contact_phone': lambda ctx: ctx.fake.phone_number(),
+            'pediatrician_name': lambda ctx: f"Dr. {ctx.fake.last_name()}",
+            'pediatrician_phone': lambda ctx: ctx.fake.phone_number(),
+            'notes': lambda ctx: f"Loves {ctx.rng.choice(['art', 'music', 'reading', 'blocks'])}",
+            'profile_image': None,  # No profile image in seed data
+            'is_active': True,
+        }),
+        TableSpec('attendance', rows=attendance_rows(days=7, min_attending=6),
+                  references={'child_id': 'children', 'checked_in_by': 'staff'}, columns={
+            'status': 'present',
+            'notes': None,
+            'mood_at_checkin': lambda ctx: ctx.rng.choice(['happy', 'calm', 'tired', 'excited']),
+            'mood_rating': lambda ctx: ctx.rng.randint(3, 5),
+            'activities_participated': ['Circle Time', 'Snack', 'Outdoor Play'],
+            'temperature': lambda ctx: 98.6 + ctx.rng.random(),
+            'photo_url': None,
+        }),
+        TableSpec('billing', references={'child_id': 'children'},
+                  rows=_billing_rows(2, 7, [800, 900, 1000, 1200], ['credit_card', 'check', 'cash'],
+                                     lambda child_id: str(child_id).zfill(3)),
+                  columns={'late_fee': 0, 'notes': None}),
+        TableSpec('messages', references={'sender_id': 'staff'},
+                  rows=lambda ctx: ({'subject': s, 'content': c, 'priority': p} for s, c, p in COMPLETE_MESSAGES),
+                  columns={
+            'sender_id': lambda ctx: ctx.ref('staff'),
+            'recipient_type': 'broadcast',
+            'recipient_id': None,
+            'is_read': False,
+            'created_at': lambda ctx: ctx.now - timedelta(days=ctx.rng.randint(0, 7)),
+        }),
+        TableSpec('alerts', references={'recipient_id': 'staff'},
+                  rows=lambda ctx: ({'severity': s, 'title': t, 'message': m} for s, t, m in COMPLETE_ALERTS),
+                  columns={
+            'type': 'system',
+            'recipient_id': lambda ctx: ctx.ref('staff'),
+            'recipient_type': 'staff',
+            'is_read': False,
+            'action_required': lambda ctx: ctx.row['severity'] in ['high', 'critical'],
+            'action_url': lambda ctx: '/admin/alerts' if ctx.row['severity'] in ['high', 'critical'] else None,
+            'created_at': lambda ctx: ctx.now - timedelta(hours=ctx.rng.randint(1, 48)),
+            'expires_at': lambda ctx: ctx.now + timedelta(days=7),
+        }),
+        TableSpec('documents', rows=_document_rows, after=('children',), references={
+            'document_type_id': 'document_types', 'verified_by': 'staff',
+        }),
+    ]
+)
+
+
+# --- minimal ------------------------------------------------------------------
+
+MINIMAL_STAFF = [
+    ('Sarah', 'Johnson', 'Director', '1234'),
+    ('Michael', 'Brown', 'Teacher', '2345'),
+    ('Emily', 'Davis', 'Teacher', '3456'),
+    ('James', 'Wilson', 'Assistant', '4567'),
+    ('Lisa', 'Martinez', 'Floater', '5678')
+]
+
+MINIMAL = Profile(
+    'minimal', 'Essential tables with a handful of rows',
+    clear=('attendance', 'billing', 'documents', 'children', 'parents', 'staff', 'settings'),
+    tables=[
+        settings_spec([setting for setting in SETTINGS
+                       if setting[0] in ('facility_name', 'facility_phone', 'state', 'age_limit')]),
+        TableSpec('staff', rows=staff_rows(MINIMAL_STAFF, pin_index=3), columns={
+            'email': staff_email,
+            'phone_number': lambda ctx: ctx.fake.phone_number(),
+            'address': lambda ctx: ctx.fake.address(),
+            'date_of_birth': lambda ctx: ctx.fake.date_of_birth(minimum_age=25, maximum_age=55),
+            'ssn': masked_ssn,
+            'department': 'Education',
+            'hire_date': lambda ctx: ctx.today - timedelta(days=ctx.rng.randint(180, 1825)),
+            'employment_type': 'full-time',
+            'wage_type': 'salary',
+            'salary': lambda ctx: ctx.rng.randint(35000, 75000),
+            'employee_id': lambda ctx: f'EMP{str(ctx.i + 1).zfill(3)}',
+            'is_active': True,
+        }),
+        TableSpec('parents', count=6, columns={
+            'first_name': lambda ctx: ctx.fake.first_name(),
+            'last_name': lambda ctx: ctx.fake.last_name(),
+            'email': lambda ctx: ctx.fake.email(),
+            'phone_number': lambda ctx: ctx.fake.phone_number(),
+            'address': lambda ctx: ctx.fake.address(),
+            'emergency_priority': lambda ctx: 1 if ctx.i < 3 else 2,
+            'relationship': lambda ctx: 'Mother' if ctx.i % 2 == 0 else 'Father',
+            'can_pickup': True,
+            'id_verified': True,
+            'is_active': True,
+        }),
+        TableSpec('children', count=8, references={'parent_id': 'parents'}, columns={
+            'first_name': lambda ctx: ctx.fake.first_name(),
+            'last_name': lambda ctx: ctx.fake.last_name(),
+            'age_months': lambda ctx: ctx.rng.randint(1, 5) * 12,
+            'date_of_birth': lambda ctx: ctx.today - timedelta(days=ctx.row['age_months'] // 12 * 365),
+            'gender': lambda ctx: ctx.rng.choice(['M', 'F']),
+            'enrollment_date': lambda ctx: ctx.today - timedelta(days=ctx.rng.randint(30, 180)),
+            'classroom': lambda ctx: ctx.rng.choice(['infant', 'toddler', 'preschool']),
+            'is_active': True,
+        }),
+        TableSpec('attendance', rows=attendance_rows(days=5, min_attending=5),
+                  references={'child_id': 'children', 'checked_in_by': 'staff'}, columns={
+            'status': 'present',
+            'mood_rating': lambda ctx: ctx.rng.randint(3, 5),
+            'temperature': lambda ctx: 98.6 + ctx.rng.random(),
+        }),
+        TableSpec('billing', references={'child_id': 'children'},
+                  rows=_billing_rows(2, 5, [800, 900, 1000], ['credit_card', 'check'],
+                                     lambda child_id: str(child_id)[-3:])),
+    ]
+)
+
+
+# --- final --------------------------------------------------------------------
+
+FINAL_DOCUMENT_TYPES = [
+    ('Medical Form', 'child', 'Medical history and conditions', True, 'annual', 30),
+    ('Immunization Records', 'child', 'Vaccination records', True, 'annual', 30),
+    ('Emergency Contact', 'child', 'Emergency contact information', True, 'semi-annual', 14),
+    ('Teaching License', 'staff', 'Professional teaching license', True, 'annual', 60),
+    ('Background Check', 'staff', 'Criminal background check', True, 'custom', 60),
+    ('CPR Certification', 'staff', 'CPR training certification', False, 'annual', 30),
+    ('Food Allergy Form', 'child', 'Food allergies and dietary restrictions', True, 'annual', 30)
+]
+
+FINAL_STAFF = [
+    ('Sarah', 'Johnson', 'Director', 75000),
+    ('Michael', 'Brown', 'Lead Teacher', 45000),
+    ('Emily', 'Davis', 'Teacher', 40000),
+    ('James', 'Wilson', 'Assistant Teacher', 35000),
+    ('Lisa', 'Martinez', 'Floater', 35000)
+]
+
+FINAL_MESSAGES = [
+    ("Picture Day Tomorrow", "Don't forget - tomorrow is picture day!", 'high'),
+    ("Weekly Update", "This week we'll be learning about shapes and colors.", 'normal'),
+    ("Holiday Schedule", "We'll be closed on Monday for the holiday.", 'high'),
+    ("Thank You", "Thank you for your participation in our fundraiser!", 'normal'),
+    ("Reminder", "Please update your emergency contact information.", 'normal')
+]
+
+FINAL_ALERTS = [
+    ('low', 'Supply Request', 'Paper towels running low'),
+    ('medium', 'Ratio Warning', 'Approaching maximum ratio in Toddler Room'),
+    ('high', 'Document Expiring', '2 staff certifications expire this month'),
+    ('critical', 'Safety Drill Due', 'Monthly fire drill scheduled'),
+    ('medium', 'Maintenance', 'AC filter replacement scheduled')
+]
+
+FINAL_ROOMS = ['Sunshine Room', 'Rainbow Room', 'Star Room']
+
+
+def _final_parent_rows(ctx):
+    password_hashes = hash_many(['parent123'] * 6)  # Default password for testing
+    for password_hash in password_hashes:
+        first, last = ctx.fake.first_name(), ctx.fake.last_name()
+        username = f"{first[0].lower()}{last.lower()}{ctx.rng.randint(10, 99)}"
+        yield {'username': username, 'password_hash': password_hash,
+               'email': f"{username}@email.com", 'first_name': first, 'last_name': last}
+
+
+def _final_child_rows(ctx):
+    parents = ctx.generated('parents')
+    for i in range(8):
+        age = ctx.rng.randint(1, 5)
+        parent = parents[i % len(parents)] if parents else {}
+        yield {
+            'first_name': ctx.fake.first_name(),
+            'last_name': parent.get('last_name') or ctx.fake.last_name(),  # Same last name as parent
+            'date_of_birth': ctx.now - timedelta(days=age * 365),
+            'age_group': 'infant' if age <= 1 else 'toddler' if age <= 3 else 'preschool',
+            'parent_name': f"{parent['first_name']} {parent['last_name']}" if parent else None,
+            'parent_email': parent.get('email'),
+            'parent_phone': parent.get('phone'),
+        }
+
+
+def _final_billing_rows(ctx):
+    for month_offset in range(2):
+        period_start = ctx.now.replace(day=1) - timedelta(days=month_offset * 30)
+        period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        for child_id in ctx.ids('children')[:5]:  # First 5 children
+            tuition = ctx.rng.choice([800, 900, 1000, 1200])
+            extra_fees = ctx.rng.choice([0, 50, 100]) if ctx.rng.random() > 0.7 else 0
+            paid = month_offset > 0 or ctx.rng.choice([True, False])
+            yield {
+                'child_id': child_id,
+                'period_start': period_start,
+                'period_end': period_end,
+                'attendance_days': ctx.rng.randint(15, 22),
+                'tuition_amount': tuition,
+                'extra_fees': extra_fees,
+                'total_amount': tuition + extra_fees,
+                'status': 'paid' if paid else 'pending',
+                'due_date': period_start + timedelta(days=5),
+            }
+
+
+FINAL = Profile(
+    'final', 'Minimal data for the auth-style parents/staff schema',
+    clear=('attendance', 'billing', 'messages', 'alerts', 'documents',
+           'children', 'parents', 'staff', 'settings', 'document_types'),
+    tables=[
+        settings_spec(SETTINGS),
+        TableSpec('document_types', rows=lambda ctx: (
+            {'name': name, 'category': category, 'description': desc, 'is_required': required,
+             'renewal_frequency': frequency, 'alert_days_before': alert_days}
+            for name, category, desc, required, frequency, alert_days in FINAL_DOCUMENT_TYPES
+        ), columns={'regulatory_body': 'State Licensing'}),
+        TableSpec('staff', rows=lambda ctx: (
+            {'first_name': first, 'last_name': last, 'position': position, 'salary_amount': salary}
+            for first, last, position, salary in FINAL_STAFF
+        ), columns={
+            'email': staff_email,
+            'phone': lambda ctx: ctx.fake.phone_number(),
+            'is_active': True,
+            'employee_number': lambda ctx: f"EMP{str(ctx.i + 1).zfill(3)}",
+            'pay_type': 'salary',
+        }),
+        TableSpec('parents', rows=_final_parent_rows, columns={
+            'phone': lambda ctx: ctx.fake.phone_number(),
+            'is_active': True,
+            'email_verified': True,
+        }),
+        TableSpec('children', rows=_final_child_rows, references={'parent_id': 'parents'}, columns={
+            'room': lambda ctx: ctx.rng.choice(FINAL_ROOMS),
+            'is_active': True,
+            'enrollment_date': lambda ctx: ctx.now - timedelta(days=ctx.rng.randint(30, 180)),
+            'tuition_rate': lambda ctx: ctx.rng.choice([800, 900, 1000, 1200]),
+            'enrollment_status': 'enrolled',
+            'allergies': lambda ctx: ['Peanuts'] if ctx.i % 4 == 0 else [],
+            'medical_conditions': lambda ctx: ['Asthma'] if ctx.i % 3 == 0 else [],
+        }),
+        TableSpec('attendance', rows=attendance_rows(days=5, min_attending=5),
+                  references={'child_id': 'children', 'checked_in_by': 'staff'}, columns={
+            'mood_rating': lambda ctx: ctx.rng.randint(3, 5),
+            'room': lambda ctx: ctx.rng.choice(FINAL_ROOMS),
+            'activities_completed': ['Circle Time', 'Snack', 'Outdoor Play', 'Art Project'],
+        }),
+        TableSpec('billing', rows=_final_billing_rows, references={'child_id': 'children'}),
+        TableSpec('messages', references={'sender_id': 'staff'},
+                  rows=lambda ctx: ({'subject': s, 'content': c, 'priority': p} for s, c, p in FINAL_MESSAGES),
+                  columns={
+            'sender_id': lambda ctx: ctx.ref('staff'),
+            'recipient_type': 'broadcast',
+            'is_read': False,
+            'created_at': lambda ctx: ctx.now - timedelta(days=ctx.rng.randint(0, 7)),
+        }),
+        TableSpec('alerts', rows=lambda ctx: (
+            {'severity': severity, 'message': f"{title}: {message}"}
+            for severity, title, message in FINAL_ALERTS
+        ), columns={
+            'type': 'system',
+            'is_read': False,
+            'created_at': lambda ctx: ctx.now - timedelta(hours=ctx.rng.randint(1, 48)),
+        }),
+        # Documents are not seeded: the table structure differs from expected
+    ]
+)
+
+
+# --- sample -------------------------------------------------------------------
+
+SAMPLE_PROFILES = [
+    ('dir-001', 'director', 'director@tothub.com', 'director', 'Sarah', 'Johnson', '555-0101', 'Center Director', 'Administration', 'EMP001'),
+    ('teach-001', 'teacher', 'teacher@tothub.com', 'teacher', 'Emily', 'Williams', '555-0102', 'Lead Teacher', 'Education', 'EMP002'),
+    ('staff-001', 'staff', 'staff@tothub.com', 'staff', 'Michael', 'Brown', '555-0103', 'Assistant Teacher', 'Education', 'EMP003'),
+    ('parent-001', 'jsmith', 'jsmith@email.com', 'parent', 'John', 'Smith', '555-0201', None, None, None),
+    ('parent-002', 'mjones', 'mjones@email.com', 'parent', 'Mary', 'Jones', '555-0202', None, None, None),
+]
+
+SAMPLE_TEMPLATES = [
+    ('Teacher Morning Shift', 'staff', '07:00:00', '15:00:00'),
+    ('Teacher Afternoon Shift', 'staff', '10:00:00', '18:00:00'),
+    ('Standard Child Schedule', 'child', '08:00:00', '17:00:00'),
+]
+
+SAMPLE_MESSAGES = [
+    ('Welcome to TotHub!', 'Welcome to our daycare center. Please feel free to reach out with any questions.', 'normal'),
+    ('Daily Report - Great Day!', 'Your child had a wonderful day today. They participated in all activities and enjoyed lunch.', 'normal'),
+    ('Upcoming Field Trip', 'We have a field trip planned for next week to the Children\'s Museum. Permission slip attached.', 'high'),
+]
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+PROFILE_COLUMNS = ('user_id', 'username', 'email', 'role', 'first_name', 'last_name',
+                   'phone_number', 'job_title', 'department', 'employee_id')
+
+
+def _sample_room_schedule_rows(ctx):
+    for i in range(7):  # Next 7 days
+        for room in ['Infant Room', 'Toddler Room', 'Preschool Room']:
+            yield {
+                'room_name': room,
+                'date': ctx.today + timedelta(days=i),
+                'capacity': 15 if room == 'Infant Room' else 20,
+                'assigned_staff': 2 if room == 'Infant Room' else 3,
+                'enrolled_children': ctx.rng.randint(8, 12),
+                'activities': ['Circle Time', 'Art & Crafts', 'Outdoor Play', 'Story Time'],
+                'meal_times': '{"breakfast": "8:00 AM", "lunch": "12:00 PM", "snack": "3:00 PM"}',
+            }
+
+
+def hash_plain_pins(conn, backend):
+    """Replace plain-text PIN credentials (4-6 digits) with bcrypt hashes"""
+    if not backend.existing_tables(conn, ['security_credentials']):
+        return
+    cur = conn.cursor()
+    cur.execute("SELECT id, credential_value FROM security_credentials WHERE credential_type = 'pin'")
+    plain = [(cred_id, value) for cred_id, value in cur.fetchall()
+             if value and len(value) <= 6 and value.isdigit()]
+    hashes = hash_many(value for _, value in plain)
+    for (cred_id, _), hashed in zip(plain, hashes):
+        cur.execute(backend.sql("""
+            UPDATE security_credentials
+            SET credential_value = %s, modified_by = 'seed_script'
+            WHERE id = %s
+        """), (hashed, cred_id))
+    print("✓ Hashed security credentials")
+
+
+SAMPLE = Profile(
+    'sample', 'Profiles, schedules, media and messages added to existing data',
+    tables=[
+        TableSpec('user_profiles', rows=lambda ctx: (dict(zip(PROFILE_COLUMNS, p)) for p in SAMPLE_PROFILES),
+                  on_conflict='(user_id) DO NOTHING', columns={
+            'bio': lambda ctx: f"{ctx.row['first_name']} is a dedicated {ctx.row['job_title'] or 'parent'} at TotHub.",
+            'preferred_language': 'en',
+            'is_active': True,
+        }),
+        TableSpec('room_schedules', rows=_sample_room_schedule_rows, requires=('room_name',)),
+        TableSpec('schedule_templates', rows=lambda ctx: (
+            {'template_name': name, 'template_type': kind, 'start_time': start, 'end_time': end}
+            for name, kind, start, end in SAMPLE_TEMPLATES
+        ), columns={'days_of_week': WEEKDAYS, 'is_active': True}),
+        TableSpec('media_shares', references={'child_id': 'children'},
+                  count=lambda ctx: 10 if ctx.ids('children') else 0, columns={
+            'child_id': lambda ctx: ctx.rng.choice(ctx.ids('children')[:5]),
+            'media_type': lambda ctx: ctx.rng.choice(['photo', 'video']),
+            'media_url': lambda ctx: f"/media/sample_{ctx.i}.jpg",
+            'caption': lambda ctx: ctx.fake.sentence(nb_words=6),
+            'shared_with_parents': True,
+            'uploaded_by': lambda ctx: ctx.rng.choice(['teacher', 'staff']),
+            'tags': lambda ctx: ctx.rng.sample(['activity', 'milestone', 'art', 'outdoor', 'learning'], k=2),
+        }),
+        TableSpec('messages', references={'parent_id': 'parents', 'staff_id': 'staff'},
+                  rows=lambda ctx: (
+                      {'subject': s, 'content': c, 'priority': p} for s, c, p in SAMPLE_MESSAGES
+                  ) if ctx.ids('parents') and ctx.ids('staff') else (), columns={
+            'parent_id': lambda ctx: ctx.rng.choice(ctx.ids('parents')[:3]),
+            'staff_id': lambda ctx: ctx.rng.choice(ctx.ids('staff')[:3]),
+            'is_read': lambda ctx: ctx.rng.choice([True, False]),
+        }),
+        TableSpec('billing', references={'child_id': 'children'},
+                  count=lambda ctx: len(ctx.ids('children')[:5]), columns={
+            'period_start': lambda ctx: ctx.today.replace(day=1),
+            'period_end': lambda ctx: (ctx.row['period_start'] + timedelta(days=32)).replace(day=1) - timedelta(days=1),
+            'attendance_days': 20,
+            'tuition_amount': 150000,  # $1500 in cents
+            'extra_fees': 5000,  # $50 extra fees
+            'total_amount': 155000,
+            'status': lambda ctx: ctx.rng.choice(['paid', 'pending', 'overdue']),
+            'due_date': lambda ctx: ctx.row['period_end'] + timedelta(days=5),
+        }),
+    ],
+    post_steps=[hash_plain_pins],
+)
+
+
+PROFILES = {profile.name: profile for profile in (COMPLETE, MINIMAL, FINAL, SAMPLE)}
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Seed snapshots for fast test database resets
+Seeds a database once and keeps the result as a Postgres template database
+or a custom-format dump. Later resets clone or restore the snapshot instead
+of truncating every table and re-seeding. A checksum over the seed sources
+and parameters marks the snapshot stale whenever the seed would change.
+
+Usage:
+    python seed_snapshot.py status
+    python seed_snapshot.py build [--mode template|dump]
+    python seed_snapshot.py reset [--mode template|dump]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import make_dsn, parse_dsn
+
+from hashing import seed_rounds
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+
+DB_DIR = Path(__file__).resolve().parent
+DEFAULT_DUMP_PATH = DB_DIR / 'backups' / 'seed_snapshot.dump'
+# Files whose contents determine the seeded data and schema
+SEED_SOURCES = ['seed_data_complete.py', 'seed_profiles.py', 'seed_engine.py', 'seed_orchestrator.py',
+                'bulk_loader.py', 'db_backends.py', 'hashing.py', 'migrations/*.sql']
+COMMENT_PREFIX = 'tothub-seed:'
+
+
+def seed_fingerprint(params: Optional[Dict] = None, sources: List[str] = SEED_SOURCES) -> str:
+    """
+    SHA-256 over the seed source files and seed parameters.
+
+    Args:
+        params: Extra parameters that change the seeded data
+        sources: Glob patterns relative to the db directory
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for pattern in sources:
+        for path in sorted(DB_DIR.glob(pattern)):
+            digest.update(str(path.relative_to(DB_DIR)).encode('utf-8'))
+            digest.update(path.read_bytes())
+    params = dict(params or {}, bcrypt_rounds=seed_rounds())
+    digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _tool(name: str) -> str:
+    """Path to a Postgres client binary (PG_BINDIR overrides PATH)"""
+    bindir = os.environ.get('PG_BINDIR')
+    path = os.path.join(bindir, name) if bindir else shutil.which(name)
+    if not path:
+        raise RuntimeError(f"{name} not found; install the Postgres client tools or set PG_BINDIR")
+    return path
+
+
+def seed_database(dsn: str) -> None:
+    """Clear and seed a database with the 'complete' seed profile"""
+    from seed_engine import SeedEngine
+    from seed_profiles import PROFILES
+
+    if not SeedEngine(dsn).run(PROFILES['complete']):
+        raise RuntimeError("seeding failed; snapshot not taken")
+
+
+class TemplateSnapshot:
+    """
+    Snapshot kept as a template database next to the target.
+
+    Resetting drops the target and re-creates it with CREATE DATABASE ...
+    TEMPLATE, a file-level copy. The fingerprint is stored as the template's
+    database comment. Both databases must be free of other sessions while
+    they are copied.
+    """
+
+    def __init__(self, dsn: str, template_name: Optional[str] = None,
+                 maintenance_db: str = 'postgres'):
+        self.dsn = dsn
+        self.target = parse_dsn(dsn)['dbname']
+        self.template = template_name or f"{self.target}_seed_template"
+        self.maintenance_dsn = make_dsn(dsn, dbname=maintenance_db)
+        if self.target == maintenance_db:
+            raise ValueError(f"cannot use template snapshots on the maintenance database '{maintenance_db}'")
+
+    def _admin(self):
+        conn = psycopg2.connect(self.maintenance_dsn)
+        conn.autocommit = True
+        return conn
+
+    def fingerprint(self) -> Optional[str]:
+        conn = self._admin()
+        try:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT shobj_description(oid, 'pg_database')
+                FROM pg_database WHERE datname = %s
+            """, (self.template,))
+            row = cur.fetchone()
+        finally:
+            conn.close()
+        if not row or not row[0] or not row[0].startswith(COMMENT_PREFIX):
+            return None
+        return row[0][len(COMMENT_PREFIX):]
+
+    def _clone(self, cur, source: str, dest: str) -> None:
+        cur.execute("""
+            SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+            WHERE datname = %s AND pid <> pg_backend_pid()
+        """, (source,))
+        cur.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(dest)))
+        cur.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+            sql.Identifier(dest), sql.Identifier(source)))
+
+    def save(self, fingerprint: str) -> None:
+        conn = self._admin()
+        try:
+            cur = conn.cursor()
+            self._clone(cur, self.target, self.template)
+            cur.execute(sql.SQL("COMMENT ON DATABASE {} IS {}").format(
+                sql.Identifier(self.template), sql.Literal(COMMENT_PREFIX + fingerprint)))
+        finally:
+            conn.close()
+
+    def restore(self) -> None:
+        conn = self._admin()
+        try:
+            self._clone(conn.cursor(), self.template, self.target)
+        finally:
+            conn.close()
+
+    def describe(self) -> str:
+        return f"template database '{self.template}'"
+
+
+class DumpSnapshot:
+    """
+    Snapshot kept as a pg_dump custom-format archive.
+
+    Restores use pg_restore --clean with parallel jobs. The fingerprint is
+    stored in a JSON manifest next to the archive. Portable across servers,
+    but slower than a template clone.
+    """
+
+    def __init__(self, dsn: str, path: Path = DEFAULT_DUMP_PATH, jobs: int = 4):
+        self.dsn = dsn
+        self.path = Path(path)
+        self.manifest_path = self.path.with_suffix('.json')
+        self.jobs = jobs
+
+    def fingerprint(self) -> Optional[str]:
+        if not self.path.exists() or not self.manifest_path.exists():
+            return None
+        with open(self.manifest_path) as f:
+            return json.load(f).get('fingerprint')
+
+    def save(self, fingerprint: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            [_tool('pg_dump'), '--format=custom', '--no-owner', '--file', str(self.path), self.dsn],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"pg_dump failed: {result.stderr.strip()}")
+        with open(self.manifest_path, 'w') as f:
+            json.dump({
+                'fingerprint': fingerprint,
+                'created_at': datetime.now().isoformat(),
+                'sources': SEED_SOURCES,
+                'size_bytes': self.path.stat().st_size,
+            }, f, indent=2)
+
+    def restore(self) -> None:
+        result = subprocess.run(
+            [_tool('pg_restore'), '--clean', '--if-exists', '--no-owner',
+             f'--jobs={self.jobs}', '--dbname', self.dsn, str(self.path)],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"pg_restore failed: {result.stderr.strip()}")
+
+    def describe(self) -> str:
+        return f"dump {self.path}"
+
+
+def make_snapshot(dsn: str, mode: str, dump_path: Path = DEFAULT_DUMP_PATH):
+    """Create the snapshot store for a mode ('template' or 'dump')"""
+    if mode == 'template':
+        return TemplateSnapshot(dsn)
+    if mode == 'dump':
+        return DumpSnapshot(dsn, dump_path)
+    raise ValueError(f"unknown snapshot mode '{mode}'")
+
+
+def build_snapshot(snapshot, fingerprint: str) -> float:
+    """
+    Seed the target database from scratch and save it as the snapshot.
+
+    Returns:
+        Seconds taken
+    """
+    start = time.perf_counter()
+    seed_database(snapshot.dsn)
+    snapshot.save(fingerprint)
+    return time.perf_counter() - start
+
+
+def reset_database(snapshot, fingerprint: str, force_rebuild: bool = False) -> bool:
+    """
+    Reset the target database from the snapshot, rebuilding it when stale.
+
+    Returns:
+        True if the snapshot was restored, False if it had to be rebuilt
+    """
+    current = snapshot.fingerprint()
+    if force_rebuild or current != fingerprint:
+        reason = 'forced' if force_rebuild else ('missing' if current is None else 'stale')
+        print(f"Snapshot {reason}; seeding from scratch...")
+        seconds = build_snapshot(snapshot, fingerprint)
+        print(f"✓ Seeded and saved {snapshot.describe()} in {seconds:.2f}s")
+        return False
+    start = time.perf_counter()
+    snapshot.restore()
+    print(f"✓ Restored from {snapshot.describe()} in {time.perf_counter() - start:.2f}s")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or restore TotHub seed snapshots')
+    parser.add_argument('command', choices=['status', 'build', 'reset'])
+    parser.add_argument('--mode', choices=['template', 'dump'], default='template',
+                        help='template: clone a template database (fastest); dump: pg_dump archive')
+    parser.add_argument('--dump-path', type=Path, default=DEFAULT_DUMP_PATH)
+    parser.add_argument('--yes', action='store_true', help='Do not ask before replacing data')
+    args = parser.parse_args()
+
+    if not DATABASE_URL:
+        print("Error: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    snapshot = make_snapshot(DATABASE_URL, args.mode, args.dump_path)
+    fingerprint = seed_fingerprint()
+    current = snapshot.fingerprint()
+
+    if args.command == 'status':
+        state = 'missing' if current is None else ('current' if current == fingerprint else 'stale')
+        print(f"{snapshot.describe()}: {state}")
+        print(f"  seed fingerprint:     {fingerprint}")
+        print(f"  snapshot fingerprint: {current or '-'}")
+        sys.exit(0 if state == 'current' else 1)
+
+    if not args.yes:
+        response = input("\nThis will replace all data in the database. Continue? (yes/no): ")
+        if response.lower() != 'yes':
+            print("Cancelled.")
+            return
+
+    try:
+        reset_database(snapshot, fingerprint, force_rebuild=args.command == 'build')
+    except Exception as e:
+        print(f"\n❌ Snapshot {args.command} failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
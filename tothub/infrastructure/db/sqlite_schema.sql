@@ -0,0 +1,202 @@
+-- SQLite schema for offline seeding and benchmarking
+-- Mirrors the Postgres columns written by the 'complete' seed profile and
+-- seed_bulk.py. Arrays and JSON are stored as JSON text, booleans as 0/1,
+-- dates and timestamps as ISO-8601 text.
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS document_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT,
+    description TEXT,
+    is_required INTEGER,
+    renewal_frequency TEXT,
+    custom_frequency_days INTEGER,
+    alert_days_before INTEGER,
+    regulatory_body TEXT,
+    compliance_notes TEXT
+);
+
+CREATE TABLE IF NOT EXISTS state_compliance (
+    id INTEGER PRIMARY KEY,
+    state_code TEXT NOT NULL,
+    staff_child_ratio_infant INTEGER,
+    staff_child_ratio_toddler INTEGER,
+    staff_child_ratio_preschool INTEGER,
+    staff_child_ratio_school_age INTEGER,
+    max_group_size_infant INTEGER,
+    max_group_size_toddler INTEGER,
+    max_group_size_preschool INTEGER,
+    max_group_size_school_age INTEGER,
+    training_hours_required INTEGER,
+    background_check_required INTEGER,
+    health_screening_required INTEGER,
+    additional_requirements TEXT
+);
+
+CREATE TABLE IF NOT EXISTS room_schedules (
+    id INTEGER PRIMARY KEY,
+    room TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time_slot TEXT,
+    max_capacity INTEGER,
+    current_occupancy INTEGER,
+    staff_required INTEGER,
+    staff_assigned INTEGER,
+    is_available INTEGER,
+    activities TEXT,
+    special_requirements TEXT,
+    notes TEXT
+);
+
+CREATE TABLE IF NOT EXISTS staff (
+    id INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    email TEXT UNIQUE,
+    phone_number TEXT,
+    address TEXT,
+    date_of_birth TEXT,
+    ssn TEXT,
+    position TEXT,
+    department TEXT,
+    hire_date TEXT,
+    employment_type TEXT,
+    wage_type TEXT,
+    hourly_rate REAL,
+    salary REAL,
+    emergency_contact_name TEXT,
+    emergency_contact_phone TEXT,
+    certifications TEXT,
+    background_check_date TEXT,
+    fingerprint_on_file INTEGER,
+    health_screening_date TEXT,
+    pin_hash TEXT,
+    employee_id TEXT UNIQUE,
+    is_active INTEGER DEFAULT 1,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS parents (
+    id INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    email TEXT,
+    phone_number TEXT,
+    address TEXT,
+    emergency_priority INTEGER,
+    relationship TEXT,
+    can_pickup INTEGER,
+    id_verified INTEGER,
+    notes TEXT,
+    is_active INTEGER DEFAULT 1,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS children (
+    id INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    date_of_birth TEXT NOT NULL,
+    gender TEXT,
+    enrollment_date TEXT,
+    classroom TEXT,
+    allergies TEXT,
+    medical_conditions TEXT,
+    medications TEXT,
+    emergency_contact_name TEXT,
+    emergency_contact_phone TEXT,
+    pediatrician_name TEXT,
+    pediatrician_phone TEXT,
+    notes TEXT,
+    parent_id INTEGER REFERENCES parents(id),
+    profile_image TEXT,
+    age_months INTEGER,
+    is_active INTEGER DEFAULT 1,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    id INTEGER PRIMARY KEY,
+    child_id INTEGER NOT NULL REFERENCES children(id),
+    date TEXT NOT NULL,
+    check_in_time TEXT NOT NULL,
+    check_out_time TEXT,
+    checked_in_by INTEGER REFERENCES staff(id),
+    checked_out_by INTEGER REFERENCES staff(id),
+    status TEXT,
+    notes TEXT,
+    mood_at_checkin TEXT,
+    mood_rating INTEGER,
+    activities_participated TEXT,
+    temperature REAL,
+    photo_url TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS billing (
+    id INTEGER PRIMARY KEY,
+    child_id INTEGER NOT NULL REFERENCES children(id),
+    billing_date TEXT,
+    due_date TEXT,
+    amount_due REAL,
+    amount_paid REAL,
+    payment_date TEXT,
+    payment_method TEXT,
+    invoice_number TEXT,
+    status TEXT,
+    late_fee REAL,
+    notes TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    sender_id INTEGER,
+    recipient_type TEXT,
+    recipient_id INTEGER,
+    subject TEXT,
+    content TEXT,
+    is_read INTEGER,
+    priority TEXT,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY,
+    type TEXT,
+    severity TEXT,
+    title TEXT,
+    message TEXT,
+    recipient_id INTEGER,
+    recipient_type TEXT,
+    is_read INTEGER,
+    action_required INTEGER,
+    action_url TEXT,
+    created_at TEXT,
+    expires_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    document_type_id INTEGER REFERENCES document_types(id),
+    file_name TEXT,
+    file_url TEXT,
+    status TEXT,
+    upload_date TEXT,
+    expiration_date TEXT,
+    verified_by INTEGER,
+    notes TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_attendance_child_date ON attendance (child_id, date);
+CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance (date);
+CREATE INDEX IF NOT EXISTS idx_billing_child ON billing (child_id);
+CREATE INDEX IF NOT EXISTS idx_children_parent ON children (parent_id);
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Scale-factor synthetic data for TotHub
+Generates a production-sized dataset for N centers: staff, families,
+children enrolling and aging out over several years, and their attendance,
+billing and messages. Output is deterministic for a given seed and every
+table is produced by a streaming generator, so memory stays flat however
+many years of attendance are generated.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Set
+
+from faker import Faker
+
+from db_backends import PostgresBackend
+from seed_bulk import (ATTENDANCE_COLUMNS, BILLING_COLUMNS, CHILD_COLUMNS,
+                       PARENT_COLUMNS, STAFF_COLUMNS)
+from hashing import hash_many
+
+MESSAGE_COLUMNS = (
+    'sender_id', 'recipient_type', 'recipient_id', 'subject',
+    'content', 'is_read', 'priority', 'created_at',
+)
+
+# Share of licensed capacity per room, the age range (months) children
+# enroll at, and the age they move up to the next room
+ROOMS = {
+    'infant': {'share': 0.15, 'enroll_age': (6, 12), 'move_up_age': 18, 'tuition': 1450},
+    'toddler': {'share': 0.30, 'enroll_age': (18, 24), 'move_up_age': 36, 'tuition': 1300},
+    'preschool': {'share': 0.55, 'enroll_age': (36, 42), 'move_up_age': None, 'tuition': 1150},
+}
+ROOM_ORDER = ['infant', 'toddler', 'preschool']
+# Children leave for kindergarten in August if 5 by September 1st
+KINDERGARTEN_AGE_MONTHS = 60
+ANNUAL_WITHDRAWAL_RATE = 0.15
+
+# Weekly schedules: weekday sets (Mon=0) and their share of enrollments
+SCHEDULES = [
+    ({0, 1, 2, 3, 4}, 0.70, 1.0),
+    ({0, 2, 4}, 0.18, 0.65),
+    ({1, 3}, 0.12, 0.5),
+]
+
+# Drop-off habits cluster around two peaks (before work and school start)
+ARRIVAL_PEAKS = [(7 * 60 + 30, 20, 0.55), (8 * 60 + 30, 15, 0.45)]
+CLOSING_MINUTE = 18 * 60
+
+STAFF_POSITIONS = [('Director', 75000), ('Lead Teacher', 45000), ('Lead Teacher', 45000),
+                   ('Lead Teacher', 45000), ('Teacher', 40000), ('Teacher', 40000),
+                   ('Teacher', 40000), ('Teacher', 40000), ('Teacher', 40000),
+                   ('Teacher', 40000), ('Assistant Teacher', 35000),
+                   ('Assistant Teacher', 35000), ('Assistant Teacher', 35000), ('Floater', 35000)]
+
+MOODS = ['upset', 'tired', 'calm', 'happy', 'excited']
+MOOD_WEIGHTS = [0.03, 0.07, 0.22, 0.43, 0.25]
+ACTIVITIES = {
+    'infant': ['Tummy Time', 'Sensory Play', 'Story Time', 'Nap', 'Bottle'],
+    'toddler': ['Circle Time', 'Snack', 'Outdoor Play', 'Music', 'Painting', 'Nap'],
+    'preschool': ['Circle Time', 'Snack', 'Outdoor Play', 'Letters', 'Science',
+                  'Art', 'Blocks', 'Story Time'],
+}
+BROADCASTS = [
+    ("Weekly Newsletter", "This week's activities include art projects and outdoor exploration.", 'normal'),
+    ("Reminder: Picture Day", "Picture day is coming up. Please have your child wear their best smile.", 'high'),
+    ("Health Alert", "We've had a case of strep throat. Please monitor your child for symptoms.", 'urgent'),
+    ("Schedule Update", "We'll be closing early on Friday at 4 PM for staff training.", 'high'),
+    ("Menu Update", "Next month's lunch menu is posted by the front desk.", 'normal'),
+]
+DIRECT_MESSAGES = [
+    ("Daily Update", "Had a great day today and enjoyed outdoor play.", 'normal'),
+    ("Supplies Needed", "Please send a fresh change of clothes and more diapers.", 'normal'),
+    ("Billing Reminder", "This month's tuition invoice is now available.", 'normal'),
+    ("Incident Report", "Minor bump during play today, cleaned and iced. No further concern.", 'high'),
+    ("Milestone", "Big milestone today - ask about it at pickup!", 'normal'),
+]
+
+
+@dataclass
+class ScaleConfig:
+    """
+    Size of the synthetic dataset.
+
+    `children_per_center` is licensed capacity; as children age out or
+    withdraw, new ones take their seats, so the total number of children
+    grows with `years`.
+    """
+    centers: int = 1
+    staff_per_center: int = 14
+    children_per_center: int = 120
+    years: float = 2.0
+    seed: int = 42
+    end_date: date = field(default_factory=date.today)
+
+    @property
+    def start_date(self) -> date:
+        return self.end_date - timedelta(days=round(self.years * 365))
+
+
+@dataclass
+class ChildPlan:
+    """Enrollment facts for one generated child"""
+    index: int
+    center: int
+    family: int
+    birth_date: date
+    enrollment_date: date
+    withdrawal_date: Optional[date]
+    weekdays: Set[int]
+    tuition_factor: float
+    arrival_minute: int
+    stay_minutes: int
+    rooms: List[tuple] = field(default_factory=list)  # (from_date, room), in order
+
+    def age_months(self, on: date) -> int:
+        return (on.year - self.birth_date.year) * 12 + on.month - self.birth_date.month
+
+    def room(self, on: date) -> str:
+        current = self.rooms[0][1]
+        for since, room in self.rooms:
+            if since > on:
+                break
+            current = room
+        return current
+
+    def enrolled(self, on: date) -> bool:
+        return self.enrollment_date <= on and (self.withdrawal_date is None
+                                               or on < self.withdrawal_date)
+
+
+@dataclass
+class FamilyPlan:
+    index: int
+    center: int
+    parents: int
+    payment_habit: str  # 'on_time', 'late' or 'delinquent'
+
+
+def us_holidays(year: int) -> Set[date]:
+    """Days centers are closed"""
+    def nth_weekday(month, weekday, n):
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+    last_may = date(year, 5, 31)
+    thanksgiving = nth_weekday(11, 3, 4)
+    return {
+        date(year, 1, 1), date(year, 7, 4), date(year, 12, 24), date(year, 12, 25),
+        date(year, 12, 31), last_may - timedelta(days=last_may.weekday()),
+        nth_weekday(9, 0, 1), thanksgiving, thanksgiving + timedelta(days=1),
+    }
+
+
+def month_starts(start: date, end: date) -> Iterator[date]:
+    current = start.replace(day=1)
+    while current <= end:
+        yield current
+        current = (current + timedelta(days=32)).replace(day=1)
+
+
+class SyntheticDataset:
+    """
+    Deterministic synthetic TotHub data at a given scale.
+
+    Enrollment is planned up front (a few thousand small records); the row
+    generators then stream from that plan. Each table draws from its own
+    seeded random stream, so generating one table never changes another.
+    The center is encoded in staff.department and in child/parent notes,
+    since the schema has no centers table.
+
+    Example:
+        dataset = SyntheticDataset(ScaleConfig(centers=10, years=3))
+        stats = load_dataset(conn, dataset)
+    """
+
+    def __init__(self, config: ScaleConfig):
+        self.config = config
+        self.children: List[ChildPlan] = []
+        self.families: List[FamilyPlan] = []
+        self._plan()
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.config.seed}-{stream}")
+
+    def _faker(self, stream: str) -> Faker:
+        fake = Faker()
+        fake.seed_instance(f"{self.config.seed}-{stream}")
+        return fake
+
+    def _plan(self):
+        """
+        Simulate enrollment month by month for each center.
+
+        Each room holds its share of licensed capacity. At every month start
+        children withdraw (about 15% a year) or leave for kindergarten in
+        August, children who have outgrown their room move up when the next
+        room has space, and open seats are filled by new enrollments of the
+        right age.
+        """
+        rng = self._rng('plan')
+        config = self.config
+        for center in range(config.centers):
+            families: List[int] = []
+            capacity = {room: round(config.children_per_center * ROOMS[room]['share'])
+                        for room in ROOM_ORDER}
+            occupants: Dict[str, List[ChildPlan]] = {room: [] for room in ROOM_ORDER}
+            for month in month_starts(config.start_date, config.end_date):
+                first_month = month <= config.start_date
+                for room in ROOM_ORDER:
+                    for child in list(occupants[room]):
+                        kindergarten = (month.month == 8 and
+                                        child.age_months(date(month.year, 9, 1)) >= KINDERGARTEN_AGE_MONTHS)
+                        if kindergarten:
+                            child.withdrawal_date = date(month.year, 8, 25)
+                        elif rng.random() < ANNUAL_WITHDRAWAL_RATE / 12:
+                            child.withdrawal_date = month + timedelta(days=rng.randint(0, 27))
+                        else:
+                            continue
+                        occupants[room].remove(child)
+                for room, next_room in (('toddler', 'preschool'), ('infant', 'toddler')):
+                    for child in sorted(occupants[room], key=lambda c: c.birth_date):
+                        if (child.age_months(month) >= ROOMS[room]['move_up_age']
+                                and len(occupants[next_room]) < capacity[next_room]):
+                            occupants[room].remove(child)
+                            occupants[next_room].append(child)
+                            child.rooms.append((month, next_room))
+                for room in ROOM_ORDER:
+                    while len(occupants[room]) < capacity[room]:
+                        child = self._enroll(rng, center, families, room, month, first_month)
+                        occupants[room].append(child)
+                        self.children.append(child)
+        for child in self.children:
+            if child.withdrawal_date and child.withdrawal_date > config.end_date:
+                child.withdrawal_date = None
+
+    def _enroll(self, rng, center, families, room, month, first_month) -> ChildPlan:
+        low, high = ROOMS[room]['enroll_age']
+        if first_month:
+            # Children already enrolled when the history starts
+            top = ROOMS[room]['move_up_age'] or KINDERGARTEN_AGE_MONTHS
+            age_days = rng.randint(low * 30, top * 30 - 1)
+            birth = month - timedelta(days=age_days)
+            enrollment = month - timedelta(days=rng.randint(0, age_days - low * 30))
+        else:
+            enrollment = month + timedelta(days=rng.randint(0, 20))
+            birth = enrollment - timedelta(days=rng.randint(low * 30, high * 30))
+        if families and rng.random() < 0.2:
+            family = rng.choice(families)  # sibling of an enrolled child
+        else:
+            family = len(self.families)
+            self.families.append(FamilyPlan(
+                family, center, 2 if rng.random() < 0.7 else 1,
+                rng.choices(['on_time', 'late', 'delinquent'], [0.8, 0.15, 0.05])[0]
+            ))
+            families.append(family)
+        weekdays, _, factor = rng.choices(SCHEDULES, [s[1] for s in SCHEDULES])[0]
+        mean, sd, _ = rng.choices(ARRIVAL_PEAKS, [p[2] for p in ARRIVAL_PEAKS])[0]
+        arrival = round(rng.gauss(mean, sd))
+        stay = round(rng.gauss(540, 45)) if factor == 1.0 else round(rng.gauss(360, 30))
+        return ChildPlan(len(self.children), center, family, birth, enrollment, None,
+                         weekdays, factor, arrival, stay, [(enrollment, room)])
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'staff': self.config.centers * self.config.staff_per_center,
+            'parents': sum(f.parents for f in self.families),
+            'children': len(self.children),
+        }
+
+    def staff_rows(self) -> Iterator[tuple]:
+        rng, fake = self._rng('staff'), self._faker('staff')
+        end = self.config.end_date
+        pins = self._rng('pins')
+        pin_hashes = hash_many(f"{pins.randint(0, 9999):04d}" for _ in range(
+            self.config.centers * self.config.staff_per_center))
+        for center in range(self.config.centers):
+            for i in range(self.config.staff_per_center):
+                number = center * self.config.staff_per_center + i + 1
+                position, salary = STAFF_POSITIONS[i % len(STAFF_POSITIONS)]
+                first, last = fake.first_name(), fake.last_name()
+                yield (
+                    first, last, f"{first}.{last}.{number}@tothub.com".lower(),
+                    fake.phone_number(), fake.address(),
+                    fake.date_of_birth(minimum_age=22, maximum_age=60),
+                    f'XXX-XX-{rng.randint(1000, 9999)}',  # Masked SSN
+                    position, f"Center {center + 1:03d}",
+                    end - timedelta(days=rng.randint(30, 3650)),
+                    'full-time', 'salary', None, salary,
+                    fake.name(), fake.phone_number(),
+                    ['CPR', 'First Aid'] if rng.random() < 0.7 else ['CPR'],
+                    end - timedelta(days=rng.randint(1, 365)),
+                    True,
+                    end - timedelta(days=rng.randint(1, 365)),
+                    pin_hashes[number - 1],
+                    f'EMP{number:06d}',
+                    True,
+                )
+
+    def parent_rows(self) -> Iterator[tuple]:
+        """Parents in family order; the first of each family is the primary contact"""
+        fake = self._faker('parents')
+        number = 0
+        for family in self.families:
+            last = fake.last_name()
+            for n in range(family.parents):
+                number += 1
+                first = fake.first_name_female() if n == 0 else fake.first_name_male()
+                yield (
+                    first, last, f"{first}.{last}.{number}@example.com".lower(),
+                    fake.phone_number(), fake.address(),
+                    n + 1, 'Mother' if n == 0 else 'Father', True, True,
+                    f"Center {family.center + 1:03d}" + (' - Primary contact' if n == 0 else ''),
+                    True,
+                )
+
+    def primary_parent_positions(self) -> List[int]:
+        """Position of each family's primary parent within parent_rows()"""
+        positions, position = [], 0
+        for family in self.families:
+            positions.append(position)
+            position += family.parents
+        return positions
+
+    def child_rows(self, parent_ids: List) -> Iterator[tuple]:
+        rng, fake = self._rng('children'), self._faker('children')
+        primary = self.primary_parent_positions()
+        end = self.config.end_date
+        for child in self.children:
+            last_day = min(end, child.withdrawal_date or end)
+            asthma = rng.random() < 0.08
+            yield (
+                fake.first_name(), fake.last_name(), child.birth_date,
+                rng.choice(['M', 'F']), child.enrollment_date, child.room(last_day),
+                'Peanuts' if rng.random() < 0.05 else None,
+                'Asthma' if asthma else None,
+                'Inhaler PRN' if asthma else None,
+                fake.name(), fake.phone_number(),
+                f"Dr. {fake.last_name()}", fake.phone_number(),
+                f"Center {child.center + 1:03d} - Loves {rng.choice(['art', 'music', 'reading', 'blocks'])}",
+                parent_ids[primary[child.family]],
+                None, child.age_months(last_day), child.withdrawal_date is None,
+            )
+
+    def _center_staff(self, staff_ids: List, center: int) -> List:
+        size = self.config.staff_per_center
+        return staff_ids[center * size:(center + 1) * size]
+
+    def attendance_rows(self, child_ids: List, staff_ids: List) -> Iterator[tuple]:
+        """
+        One row per child per day attended, in date order.
+
+        Absences come from holidays, part-time schedules, two vacation weeks
+        a year and multi-day sick spells that are more common in winter.
+        """
+        rng = self._rng('attendance')
+        config = self.config
+        sick_left = [0] * len(self.children)
+        vacation_weeks: Dict[tuple, Set[int]] = {}
+        holidays: Set[date] = set()
+        for year in range(config.start_date.year, config.end_date.year + 1):
+            holidays |= us_holidays(year)
+        center_staff = [self._center_staff(staff_ids, c) for c in range(config.centers)]
+
+        day = config.start_date
+        while day <= config.end_date:
+            if day.weekday() >= 5 or day in holidays:
+                day += timedelta(days=1)
+                continue
+            # Colds and flu peak in January, bottom out in July
+            sick_rate = 0.02 + 0.025 * (1 + math.cos((day.timetuple().tm_yday - 15) / 365 * 2 * math.pi))
+            week = day.isocalendar()[1]
+            for child, child_id in zip(self.children, child_ids):
+                if not child.enrolled(day) or day.weekday() not in child.weekdays:
+                    continue
+                key = (child.index, day.year)
+                if key not in vacation_weeks:
+                    vacation_weeks[key] = set(rng.sample(range(1, 53), 2))
+                if week in vacation_weeks[key]:
+                    continue
+                if sick_left[child.index]:
+                    sick_left[child.index] -= 1
+                    continue
+                if rng.random() < sick_rate:
+                    sick_left[child.index] = rng.choice([0, 1, 1, 2, 3])
+                    continue
+                arrival = child.arrival_minute + round(rng.gauss(0, 8))
+                departure = min(arrival + child.stay_minutes + round(rng.gauss(0, 15)), CLOSING_MINUTE)
+                check_in = datetime.combine(day, datetime.min.time()) + timedelta(minutes=arrival)
+                check_out = datetime.combine(day, datetime.min.time()) + timedelta(minutes=departure)
+                staff = center_staff[child.center]
+                mood = rng.choices(range(5), MOOD_WEIGHTS)[0]
+                activities = ACTIVITIES[child.room(day)]
+                today = day == config.end_date
+                yield (
+                    child_id, day, check_in,
+                    None if today else check_out,
+                    rng.choice(staff),
+                    None if today else rng.choice(staff),
+                    'present', None,
+                    MOODS[mood], mood + 1,
+                    rng.sample(activities, 3),
+                    round(rng.gauss(98.4, 0.4), 1),
+                    None,
+                )
+            # Enrollments spanning a year boundary no longer need last year's weeks
+            if day.month == 1 and day.day <= 7:
+                vacation_weeks = {k: v for k, v in vacation_weeks.items() if k[1] >= day.year}
+            day += timedelta(days=1)
+
+    def billing_rows(self, child_ids: List) -> Iterator[tuple]:
+        """Monthly tuition invoices, with a 3% increase each year"""
+        rng = self._rng('billing')
+        config = self.config
+        for billing_date in month_starts(config.start_date, config.end_date):
+            years_in = (billing_date - config.start_date).days / 365
+            due_date = billing_date + timedelta(days=5)
+            current = billing_date.year == config.end_date.year and billing_date.month == config.end_date.month
+            for child, child_id in zip(self.children, child_ids):
+                if not child.enrolled(billing_date):
+                    continue
+                amount = round(ROOMS[child.room(billing_date)]['tuition'] * child.tuition_factor
+                               * 1.03 ** int(years_in))
+                habit = self.families[child.family].payment_habit
+                if current and rng.random() < 0.6:
+                    paid_on, status = None, 'pending'
+                elif habit == 'delinquent' and rng.random() < 0.4:
+                    paid_on, status = None, 'overdue'
+                elif habit == 'late':
+                    paid_on, status = billing_date + timedelta(days=rng.randint(6, 20)), 'paid'
+                else:
+                    paid_on, status = billing_date + timedelta(days=rng.randint(1, 5)), 'paid'
+                late_fee = 50 if status == 'overdue' or (paid_on and paid_on > due_date) else 0
+                yield (
+                    child_id, billing_date, due_date, amount,
+                    amount + late_fee if paid_on else 0,
+                    paid_on,
+                    rng.choice(['credit_card', 'ach', 'check']) if paid_on else None,
+                    f"INV-{billing_date.strftime('%Y%m')}-{str(child_id).zfill(6)}",
+                    status, late_fee, None,
+                )
+
+    def message_rows(self, staff_ids: List, parent_ids: List) -> Iterator[tuple]:
+        """Weekly broadcasts per center and about two direct messages per family a month"""
+        rng = self._rng('messages')
+        config = self.config
+        primary = self.primary_parent_positions()
+        end = datetime.combine(config.end_date, datetime.min.time())
+        day = config.start_date
+        while day <= config.end_date:
+            if day.weekday() >= 5:
+                day += timedelta(days=1)
+                continue
+            for center in range(config.centers):
+                staff = self._center_staff(staff_ids, center)
+                sent = datetime.combine(day, datetime.min.time()) + timedelta(
+                    minutes=rng.randint(9 * 60, 17 * 60))
+                if day.weekday() == 0:
+                    subject, content, priority = rng.choice(BROADCASTS)
+                    yield (staff[0], 'broadcast', None, subject, content,
+                           (end - sent).days > 3, priority, sent)
+            for family in self.families:
+                if rng.random() < 2 / 21:
+                    sent = datetime.combine(day, datetime.min.time()) + timedelta(
+                        minutes=rng.randint(9 * 60, 18 * 60))
+                    subject, content, priority = rng.choice(DIRECT_MESSAGES)
+                    staff = self._center_staff(staff_ids, family.center)
+                    yield (rng.choice(staff), 'parent', parent_ids[primary[family.index]],
+                           subject, content, (end - sent).days > 3 or rng.random() < 0.5,
+                           priority, sent)
+            day += timedelta(days=1)
+
+
+def load_dataset(conn, dataset: SyntheticDataset, batch_size: int = 5000, backend=None) -> List:
+    """
+    Load a synthetic dataset in dependency order.
+
+    Args:
+        backend: db_backends backend for conn (default: Postgres)
+
+    Returns:
+        List of LoadStats, one per table
+    """
+    backend = backend or PostgresBackend()
+    results = []
+    staff_ids, stats = backend.insert_returning_ids(conn, 'staff', STAFF_COLUMNS,
+                                                    dataset.staff_rows(), batch_size)
+    results.append(stats)
+    parent_ids, stats = backend.insert_returning_ids(conn, 'parents', PARENT_COLUMNS,
+                                                     dataset.parent_rows(), batch_size)
+    results.append(stats)
+    child_ids, stats = backend.insert_returning_ids(conn, 'children', CHILD_COLUMNS,
+                                                    dataset.child_rows(parent_ids), batch_size)
+    results.append(stats)
+    # Datasets that render COPY text directly (VectorizedDataset) skip per-row formatting
+    if hasattr(dataset, 'attendance_copy_chunks') and backend.supports_copy_text:
+        results.append(backend.copy_text(conn, 'attendance', ATTENDANCE_COLUMNS,
+                                         dataset.attendance_copy_chunks(child_ids, staff_ids, batch_size)))
+        results.append(backend.copy_text(conn, 'billing', BILLING_COLUMNS,
+                                         dataset.billing_copy_chunks(child_ids, batch_size)))
+    else:
+        results.append(backend.bulk_load(conn, 'attendance', ATTENDANCE_COLUMNS,
+                                         dataset.attendance_rows(child_ids, staff_ids), batch_size))
+        results.append(backend.bulk_load(conn, 'billing', BILLING_COLUMNS,
+                                         dataset.billing_rows(child_ids), batch_size))
+    results.append(backend.bulk_load(conn, 'messages', MESSAGE_COLUMNS,
+                                     dataset.message_rows(staff_ids, parent_ids), batch_size))
+    return results
@@ -10,12 +10,26 @@ import json
 from datetime import datetime, timedelta
 import random
 import string
+from pathlib import Path
+
+from check_results import CheckResult, ResultSet
+from optimization_data import DEFAULT_CACHE_DIR, ensure_test_data
+from query_benchmark import BenchmarkConfig, QueryCase, benchmark_query, format_distribution, load_params
 
 class DatabaseOptimizationTester:
-    def __init__(self, db_path):
+    def __init__(self, db_path, bench_config=None, scale=0.01, seed=42, cache_dir=DEFAULT_CACHE_DIR):
         self.db_path = db_path
         self.conn = None
         self.results = {}
+        self.bench_config = bench_config or BenchmarkConfig()
+        # Test data volume (1.0 = 100k users, 500k schedules, 5M attendance rows);
+        # cache_dir=None generates without keeping a cache file
+        self.scale = scale
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self.test_data = {}
+        self.report = ResultSet('optimizations', metadata={'database': db_path, 'scale': scale,
+                                                          'seed': seed})
         
     def connect(self):
         """Connect to the database"""
@@ -34,60 +48,96 @@ class DatabaseOptimizationTester:
             self.conn.close()
             print("✅ Disconnected from database")
     
+    def _record(self, group, name, passed, message, started, plan=None, rows_examined=None,
+                value=None, status=None, **details):
+        """
+        Add one check to the structured report (status defaults from `passed`).
+        
+        SQLite can't report rows scanned, so rows_examined stays None unless a
+        check measures it; rows returned go in details as rows_returned.
+        """
+        return self.report.add(CheckResult(
+            name, status or ('passed' if passed else 'failed'), time.perf_counter() - started,
+            group, message, value=value, rows_examined=rows_examined, plan=plan, details=details))
+    
+    def _table_exists(self, cursor, table):
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
+        return cursor.fetchone() is not None
+    
     def test_schema_consolidation(self):
         """Test that the consolidated schema is working correctly"""
         print("\n🔍 Testing Schema Consolidation...")
+        group = 'schema_consolidation'
         
         try:
             cursor = self.conn.cursor()
             
-            # Test 1: Check if unified users table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
-            if cursor.fetchone():
-                print("✅ Unified users table exists")
-            else:
-                print("❌ Unified users table missing")
-                return False
-            
-            # Test 2: Check if unified schedules table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='schedules'")
-            if cursor.fetchone():
-                print("✅ Unified schedules table exists")
-            else:
-                print("❌ Unified schedules table missing")
-                return False
+            # Test 1 and 2: Check if unified users and schedules tables exist
+            for table in ['users', 'schedules']:
+                started = time.perf_counter()
+                exists = self._table_exists(cursor, table)
+                message = f"Unified {table} table {'exists' if exists else 'missing'}"
+                self._record(group, f"table_exists.{table}", exists, message, started)
+                print(f"{'✅' if exists else '❌'} {message}")
+                if not exists:
+                    return False
             
             # Test 3: Check if redundant tables are gone
             redundant_tables = ['staff', 'staff_schedules', 'child_schedules', 'room_schedules']
             for table in redundant_tables:
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
-                if cursor.fetchone():
-                    print(f"⚠️  Redundant table still exists: {table}")
+                started = time.perf_counter()
+                if self._table_exists(cursor, table):
+                    message = f"Redundant table still exists: {table}"
+                    self._record(group, f"redundant_removed.{table}", False, message, started,
+                                 status='skipped')
+                    print(f"⚠️  {message}")
                 else:
-                    print(f"✅ Redundant table removed: {table}")
+                    message = f"Redundant table removed: {table}"
+                    self._record(group, f"redundant_removed.{table}", True, message, started)
+                    print(f"✅ {message}")
             
             # Test 4: Check foreign key relationships
-            cursor.execute("""
+            started = time.perf_counter()
+            query = """
                 SELECT COUNT(*) as count FROM children c 
                 JOIN users u ON c.parent_id = u.id 
                 LIMIT 1
-            """)
-            if cursor.fetchone()['count'] >= 0:
-                print("✅ Foreign key relationships working")
-            else:
-                print("❌ Foreign key relationships broken")
+            """
+            cursor.execute(query)
+            joined = cursor.fetchone()['count']
+            linked = joined >= 0
+            message = f"Foreign key relationships {'working' if linked else 'broken'}"
+            self._record(group, 'children_parent_join', linked, message, started,
+                         plan=self._query_plan(cursor, query), value=joined)
+            print(f"{'✅' if linked else '❌'} {message}")
+            if not linked:
                 return False
             
             print("✅ Schema consolidation tests passed")
             return True
             
         except Exception as e:
+            self.report.add(CheckResult(f"{group}", 'error', group=group, error=str(e),
+                                        message=f"Schema consolidation test failed: {e}"))
             print(f"❌ Schema consolidation test failed: {e}")
             return False
     
+    def _query_plan(self, cursor, query, params=()):
+        """EXPLAIN QUERY PLAN as indented text"""
+        cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+        rows = cursor.fetchall()
+        depth = {0: -1}
+        lines = []
+        for row in rows:
+            node, parent, detail = row[0], row[1], row[3]
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append('  ' * depth[node] + detail)
+        return '\n'.join(lines)
+    
     def test_performance_indexes(self):
         """Test that performance indexes are working correctly"""
         print("\n🚀 Testing Performance Indexes...")
+        group = 'performance_indexes'
         
         try:
             cursor = self.conn.cursor()
@@ -102,11 +152,13 @@ class DatabaseOptimizationTester:
             ]
             
             for index in critical_indexes:
+                started = time.perf_counter()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name=?", (index,))
-                if cursor.fetchone():
-                    print(f"✅ Index exists: {index}")
-                else:
-                    print(f"❌ Index missing: {index}")
+                exists = cursor.fetchone() is not None
+                message = f"Index {'exists' if exists else 'missing'}: {index}"
+                self._record(group, f"index_exists.{index}", exists, message, started)
+                print(f"{'✅' if exists else '❌'} {message}")
+                if not exists:
                     return False
             
             # Test 2: Check index usage with EXPLAIN QUERY PLAN
@@ -120,25 +172,57 @@ class DatabaseOptimizationTester:
             ]
             
             for query_name, query in test_queries:
+                started = time.perf_counter()
                 try:
-                    cursor.execute(f"EXPLAIN QUERY PLAN {query}")
-                    plan = cursor.fetchall()
+                    plan = self._query_plan(cursor, query)
                     if plan:
-                        print(f"✅ Query plan generated for: {query_name}")
+                        uses_index = 'USING' in plan and 'INDEX' in plan
+                        message = f"Query plan generated for: {query_name}"
+                        self._record(group, f"query_plan.{query_name}", True, message, started,
+                                     plan=plan, uses_index=uses_index)
+                        print(f"✅ {message}")
                     else:
-                        print(f"⚠️  No query plan for: {query_name}")
+                        message = f"No query plan for: {query_name}"
+                        self._record(group, f"query_plan.{query_name}", False, message, started,
+                                     status='skipped')
+                        print(f"⚠️  {message}")
                 except Exception as e:
-                    print(f"⚠️  Query plan test failed for {query_name}: {e}")
+                    message = f"Query plan test failed for {query_name}: {e}"
+                    self._record(group, f"query_plan.{query_name}", False, message, started,
+                                 status='skipped')
+                    print(f"⚠️  {message}")
             
             print("✅ Performance index tests passed")
             return True
             
         except Exception as e:
+            self.report.add(CheckResult(group, 'error', group=group, error=str(e),
+                                        message=f"Performance index test failed: {e}"))
             print(f"❌ Performance index test failed: {e}")
             return False
     
+    # Parameterized benchmark queries; parameter sets are drawn from the data
+    # (param_sql) so iterations spread over many rooms and dates
+    BENCHMARKS = [
+        QueryCase("Schedule lookup",
+                  "SELECT * FROM schedules WHERE room = ? AND date = ?",
+                  params=[('Test Room', '2025-01-27')],
+                  param_sql="SELECT room, date FROM schedules GROUP BY room, date LIMIT 100"),
+        QueryCase("User role search",
+                  "SELECT * FROM users WHERE role = ? AND is_active = 1",
+                  params=[('staff',), ('parent',)]),
+        QueryCase("Attendance by date",
+                  "SELECT * FROM attendance WHERE date = ?",
+                  params=[('2025-01-27',)],
+                  param_sql="SELECT DISTINCT date FROM attendance LIMIT 100"),
+        QueryCase("Children by room",
+                  "SELECT * FROM children WHERE room = ? AND is_active = 1",
+                  params=[('Test Room',)],
+                  param_sql="SELECT DISTINCT room FROM children"),
+    ]
+    
     def benchmark_queries(self):
-        """Benchmark query performance before and after optimization"""
+        """Benchmark query latency distributions (see query_benchmark.py)"""
         print("\n⏱️  Benchmarking Query Performance...")
         
         try:
@@ -147,105 +231,36 @@ class DatabaseOptimizationTester:
             # Create some test data if tables are empty
             self.create_test_data()
             
-            # Benchmark queries
-            benchmarks = [
-                ("Schedule lookup", 
-                 "SELECT * FROM schedules WHERE room = 'Test Room' AND date = '2025-01-27'"),
-                ("User role search", 
-                 "SELECT * FROM users WHERE role = 'staff' AND is_active = 1"),
-                ("Attendance by date", 
-                 "SELECT * FROM attendance WHERE date = '2025-01-27'"),
-                ("Children by room", 
-                 "SELECT * FROM children WHERE room = 'Test Room' AND is_active = 1")
-            ]
-            
-            for test_name, query in benchmarks:
-                # Warm up
-                for _ in range(3):
-                    cursor.execute(query)
-                    cursor.fetchall()
-                
-                # Benchmark
-                start_time = time.time()
-                for _ in range(10):
-                    cursor.execute(query)
-                    cursor.fetchall()
-                end_time = time.time()
-                
-                avg_time = (end_time - start_time) / 10 * 1000  # Convert to milliseconds
-                self.results[test_name] = avg_time
-                print(f"⏱️  {test_name}: {avg_time:.2f}ms average")
+            for case in self.BENCHMARKS:
+                started = time.perf_counter()
+                result = benchmark_query(self.conn, case, self.bench_config)
+                self.results[case.name] = result
+                total = result['total_ms']
+                # seconds is the whole benchmark's wall time; latency lives in value/details
+                self._record('benchmark', f"benchmark.{case.name}", True,
+                             f"{case.name}: {format_distribution(total)}", started,
+                             plan=self._query_plan(cursor, case.sql, load_params(self.conn, case)[0]),
+                             value=total['p50'], p50_ms=total['p50'], p95_ms=total['p95'],
+                             p99_ms=total['p99'], iterations=result['iterations'],
+                             rows_returned=result['rows_mean'])
+                print(f"⏱️  {case.name}: {format_distribution(total)} "
+                      f"({result['iterations']} runs, {result['rows_mean']:.0f} rows)")
+                print(f"     execute p50 {result['execute_ms']['p50']:.3f} ms, "
+                      f"fetch p50 {result['fetch_ms']['p50']:.3f} ms")
             
             print("✅ Benchmark tests completed")
             return True
             
         except Exception as e:
+            self.report.add(CheckResult('benchmark', 'error', group='benchmark', error=str(e),
+                                        message=f"Benchmark test failed: {e}"))
             print(f"❌ Benchmark test failed: {e}")
             return False
     
     def create_test_data(self):
-        """Create test data for benchmarking"""
+        """Load scaled test data for benchmarking (see optimization_data.py)"""
         try:
-            cursor = self.conn.cursor()
-            
-            # Check if test data already exists
-            cursor.execute("SELECT COUNT(*) as count FROM users WHERE email LIKE '%test%'")
-            if cursor.fetchone()['count'] > 0:
-                print("📊 Test data already exists, skipping creation")
-                return
-            
-            print("📊 Creating test data for benchmarking...")
-            
-            # Create test users
-            test_users = [
-                ('test_staff_1', 'staff', 'Test Staff 1'),
-                ('test_staff_2', 'staff', 'Test Staff 2'),
-                ('test_parent_1', 'parent', 'Test Parent 1'),
-                ('test_parent_2', 'parent', 'Test Parent 2')
-            ]
-            
-            for username, role, name in test_users:
-                first_name, last_name = name.split(' ')
-                cursor.execute("""
-                    INSERT INTO users (id, email, password_hash, first_name, last_name, role, tenant_id, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (username, f"{username}@test.com", 'test_hash', first_name, last_name, role, 'test', 1))
-            
-            # Create test children
-            test_children = [
-                ('test_child_1', 'Test Child 1', 'test_parent_1'),
-                ('test_child_2', 'Test Child 2', 'test_parent_2')
-            ]
-            
-            for child_id, name, parent_id in test_children:
-                first_name, last_name = name.split(' ')
-                cursor.execute("""
-                    INSERT INTO children (id, first_name, last_name, date_of_birth, parent_id, enrollment_date, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (child_id, first_name, last_name, '2020-01-01', parent_id, '2024-01-01', 1))
-            
-            # Create test schedules
-            test_schedules = [
-                ('test_schedule_1', 'staff', 'test_staff_1', 'Test Room', '2025-01-27'),
-                ('test_schedule_2', 'child', 'test_child_1', 'Test Room', '2025-01-27'),
-                ('test_schedule_3', 'room', 'Test Room', 'Test Room', '2025-01-27')
-            ]
-            
-            for schedule_id, schedule_type, entity_id, room, date in test_schedules:
-                cursor.execute("""
-                    INSERT INTO schedules (id, schedule_type, entity_id, entity_type, room, date, scheduled_start, scheduled_end)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (schedule_id, schedule_type, entity_id, schedule_type, room, date, '09:00:00', '17:00:00'))
-            
-            # Create test attendance
-            cursor.execute("""
-                INSERT INTO attendance (id, child_id, date, room, checked_in_by)
-                VALUES (?, ?, ?, ?, ?)
-            """, ('test_attendance_1', 'test_child_1', '2025-01-27', 'Test Room', 'test_staff_1'))
-            
-            self.conn.commit()
-            print("✅ Test data created successfully")
-            
+            self.test_data = ensure_test_data(self.conn, self.scale, self.seed, self.cache_dir)
         except Exception as e:
             print(f"⚠️  Failed to create test data: {e}")
     
@@ -256,16 +271,26 @@ class DatabaseOptimizationTester:
         report = {
             "timestamp": datetime.now().isoformat(),
             "database": self.db_path,
+            "benchmark_config": vars(self.bench_config),
+            "test_data": {"scale": self.scale, "seed": self.seed, "rows_loaded": self.test_data},
             "test_results": self.results,
+            "checks": self.report.to_dict(),
             "recommendations": []
         }
         
-        # Analyze results and provide recommendations
         if self.results:
-            avg_time = sum(self.results.values()) / len(self.results)
-            if avg_time < 50:
+            print(f"{'Query':<22}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'runs':>8}")
+            for name, result in self.results.items():
+                total = result['total_ms']
+                print(f"{name:<22}{total['p50']:>10.3f}{total['p95']:>10.3f}{total['p99']:>10.3f}"
+                      f"{result['iterations']:>8}")
+        
+        # Analyze results and provide recommendations (on tail latency, not the average)
+        if self.results:
+            worst_p95 = max(result['total_ms']['p95'] for result in self.results.values())
+            if worst_p95 < 50:
                 report["recommendations"].append("Excellent performance! Database is well optimized.")
-            elif avg_time < 100:
+            elif worst_p95 < 100:
                 report["recommendations"].append("Good performance. Consider additional indexing for complex queries.")
             else:
                 report["recommendations"].append("Performance needs improvement. Review query patterns and add missing indexes.")
@@ -313,17 +338,39 @@ class DatabaseOptimizationTester:
 
 def main():
     """Main function to run the optimization tests"""
+    import argparse
     import sys
     
-    if len(sys.argv) != 2:
-        print("Usage: python test_optimizations.py <database_path>")
-        print("Example: python test_optimizations.py ../tothub.db")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='Verify TotHub database optimizations',
+        epilog='Example: python test_optimizations.py ../tothub.db')
+    parser.add_argument('database_path')
+    parser.add_argument('--json', metavar='PATH', help='Write check results as JSON')
+    parser.add_argument('--junit', metavar='PATH', help='Write check results as JUnit XML')
+    parser.add_argument('--time-budget', type=float, default=1.0,
+                        help='Seconds of measured iterations per benchmark query')
+    parser.add_argument('--min-iterations', type=int, default=30)
+    parser.add_argument('--max-iterations', type=int, default=10000)
+    parser.add_argument('--scale', type=float, default=0.01,
+                        help='Test data scale (1.0 = 100k users, 500k schedules, 5M attendance rows)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                        help='Where generated test data is cached between runs')
+    parser.add_argument('--no-cache', action='store_true', help='Generate test data without caching it')
+    args = parser.parse_args()
     
-    db_path = sys.argv[1]
-    tester = DatabaseOptimizationTester(db_path)
+    bench_config = BenchmarkConfig(min_iterations=args.min_iterations,
+                                   max_iterations=args.max_iterations,
+                                   time_budget=args.time_budget)
+    tester = DatabaseOptimizationTester(args.database_path, bench_config, args.scale, args.seed,
+                                        None if args.no_cache else args.cache_dir)
     success = tester.run_all_tests()
     
+    if args.json:
+        tester.report.write_json(args.json)
+    if args.junit:
+        tester.report.write_junit(args.junit)
+    
     if success:
         print("\n✅ Database optimization verification completed successfully!")
         sys.exit(0)
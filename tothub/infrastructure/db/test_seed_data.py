@@ -7,182 +7,70 @@ import os
 import psycopg2
 from datetime import datetime
 
+from check_results import ResultSet
+from validation import (explain_checks, matching, orphans, print_results, row_count, run_checks,
+                        slowest, violations)
+
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
-def run_tests(conn):
-    """Run comprehensive tests on seeded data"""
-    cur = conn.cursor()
-    
+TESTS = [
+    row_count('settings', '==', 4, group='Row count'),
+    row_count('staff', '==', 5, group='Row count'),
+    row_count('parents', '==', 6, group='Row count'),
+    row_count('children', '==', 8, group='Row count'),
+    row_count('attendance', '>=', 20, group='Row count'),  # At least 20
+    row_count('billing', '>=', 10, group='Row count'),     # At least 10
+    orphans('children', 'parent_id', 'parents', label='children', ref_label='parent',
+            group='Foreign key integrity'),
+    orphans('attendance', 'child_id', 'children', label='attendance records', ref_label='child',
+            group='Foreign key integrity'),
+    orphans('attendance', 'checked_in_by', 'staff', label='check-ins', ref_label='staff',
+            group='Foreign key integrity'),
+    orphans('billing', 'child_id', 'children', label='billing records', ref_label='child',
+            group='Foreign key integrity'),
+    matching('active_staff', 'staff', 'is_active = true', '==', 5,
+             "All staff members are active", "Only {value} staff members are active"),
+    matching('hashed_pins', 'staff', 'pin_hash IS NOT NULL AND LENGTH(pin_hash) > 20', '==', 5,
+             "All staff PINs are properly hashed", "Only {value} staff PINs are properly hashed"),
+    violations('mood_rating_range', 'attendance', 'mood_rating NOT BETWEEN 1 AND 5',
+               "All mood ratings are valid (1-5)",
+               "{value} attendance records have invalid mood ratings"),
+    violations('checkout_after_checkin', 'attendance',
+               'check_out_time IS NOT NULL AND check_out_time <= check_in_time',
+               "All check-out times are after check-in times",
+               "{value} records have check-out before check-in", group='Business logic'),
+    violations('positive_billing_amounts', 'billing', 'amount_due <= 0',
+               "All billing amounts are positive",
+               "{value} billing records have non-positive amounts", group='Business logic'),
+]
+
+def run_tests(conn, report=None, plans=None):
+    """
+    Run comprehensive tests on seeded data (one query for all tests)
+    
+    Args:
+        report: ResultSet to add the results to
+        plans: 'plan' or 'analyze' to record each test's query plan
+    """
     print("=== Database Seed Data Validation Tests ===")
-    print(f"Timestamp: {datetime.now()}\n")
-    
-    tests_passed = 0
-    tests_failed = 0
-    
-    # Test 1: Check row counts
-    print("1. ROW COUNT TESTS")
-    expected_counts = {
-        'settings': 4,
-        'staff': 5,
-        'parents': 6,
-        'children': 8,
-        'attendance': ('>=', 20),  # At least 20
-        'billing': ('>=', 10)      # At least 10
-    }
-    
-    for table, expected in expected_counts.items():
-        cur.execute(f"SELECT COUNT(*) FROM {table}")
-        actual = cur.fetchone()[0]
-        
-        if isinstance(expected, tuple):
-            op, value = expected
-            if op == '>=' and actual >= value:
-                print(f"  ✓ {table}: {actual} records (expected {op} {value})")
-                tests_passed += 1
-            else:
-                print(f"  ✗ {table}: {actual} records (expected {op} {value})")
-                tests_failed += 1
-        else:
-            if actual == expected:
-                print(f"  ✓ {table}: {actual} records")
-                tests_passed += 1
-            else:
-                print(f"  ✗ {table}: {actual} records (expected {expected})")
-                tests_failed += 1
-    
-    # Test 2: Foreign Key Integrity
-    print("\n2. FOREIGN KEY INTEGRITY TESTS")
-    
-    # Children -> Parents
-    cur.execute("""
-        SELECT COUNT(*) FROM children c
-        LEFT JOIN parents p ON c.parent_id = p.id
-        WHERE c.parent_id IS NOT NULL AND p.id IS NULL
-    """)
-    orphan_children = cur.fetchone()[0]
-    
-    if orphan_children == 0:
-        print("  ✓ All children have valid parent references")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {orphan_children} children have invalid parent references")
-        tests_failed += 1
-    
-    # Attendance -> Children
-    cur.execute("""
-        SELECT COUNT(*) FROM attendance a
-        LEFT JOIN children c ON a.child_id = c.id
-        WHERE c.id IS NULL
-    """)
-    orphan_attendance = cur.fetchone()[0]
-    
-    if orphan_attendance == 0:
-        print("  ✓ All attendance records have valid child references")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {orphan_attendance} attendance records have invalid child references")
-        tests_failed += 1
-    
-    # Attendance -> Staff (checked_in_by)
-    cur.execute("""
-        SELECT COUNT(*) FROM attendance a
-        LEFT JOIN staff s ON a.checked_in_by = s.id
-        WHERE a.checked_in_by IS NOT NULL AND s.id IS NULL
-    """)
-    invalid_checkin_staff = cur.fetchone()[0]
-    
-    if invalid_checkin_staff == 0:
-        print("  ✓ All check-ins have valid staff references")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {invalid_checkin_staff} check-ins have invalid staff references")
-        tests_failed += 1
-    
-    # Billing -> Children
-    cur.execute("""
-        SELECT COUNT(*) FROM billing b
-        LEFT JOIN children c ON b.child_id = c.id
-        WHERE c.id IS NULL
-    """)
-    orphan_billing = cur.fetchone()[0]
-    
-    if orphan_billing == 0:
-        print("  ✓ All billing records have valid child references")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {orphan_billing} billing records have invalid child references")
-        tests_failed += 1
-    
-    # Test 3: Data Quality
-    print("\n3. DATA QUALITY TESTS")
-    
-    # Active status
-    cur.execute("SELECT COUNT(*) FROM staff WHERE is_active = true")
-    active_staff = cur.fetchone()[0]
-    
-    if active_staff == 5:
-        print("  ✓ All staff members are active")
-        tests_passed += 1
-    else:
-        print(f"  ✗ Only {active_staff} staff members are active")
-        tests_failed += 1
+    print(f"Timestamp: {datetime.now()}")
     
-    # PIN hashes
-    cur.execute("SELECT COUNT(*) FROM staff WHERE pin_hash IS NOT NULL AND LENGTH(pin_hash) > 20")
-    hashed_pins = cur.fetchone()[0]
-    
-    if hashed_pins == 5:
-        print("  ✓ All staff PINs are properly hashed")
-        tests_passed += 1
-    else:
-        print(f"  ✗ Only {hashed_pins} staff PINs are properly hashed")
-        tests_failed += 1
-    
-    # Mood ratings
-    cur.execute("SELECT COUNT(*) FROM attendance WHERE mood_rating NOT BETWEEN 1 AND 5")
-    invalid_moods = cur.fetchone()[0]
-    
-    if invalid_moods == 0:
-        print("  ✓ All mood ratings are valid (1-5)")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {invalid_moods} attendance records have invalid mood ratings")
-        tests_failed += 1
+    results = run_checks(conn, TESTS)
+    if plans:
+        explain_checks(conn, TESTS, results, analyze=plans == 'analyze')
+    if report is not None:
+        report.extend(results)
+    print_results(results, numbered=True, indent='  ')
     
-    # Test 4: Business Logic
-    print("\n4. BUSINESS LOGIC TESTS")
-    
-    # Check-out times after check-in
-    cur.execute("""
-        SELECT COUNT(*) FROM attendance 
-        WHERE check_out_time IS NOT NULL 
-        AND check_out_time <= check_in_time
-    """)
-    invalid_times = cur.fetchone()[0]
-    
-    if invalid_times == 0:
-        print("  ✓ All check-out times are after check-in times")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {invalid_times} records have check-out before check-in")
-        tests_failed += 1
-    
-    # Billing amounts
-    cur.execute("SELECT COUNT(*) FROM billing WHERE amount_due <= 0")
-    invalid_amounts = cur.fetchone()[0]
-    
-    if invalid_amounts == 0:
-        print("  ✓ All billing amounts are positive")
-        tests_passed += 1
-    else:
-        print(f"  ✗ {invalid_amounts} billing records have non-positive amounts")
-        tests_failed += 1
+    tests_passed = sum(1 for result in results if result.passed)
+    tests_failed = len(results) - tests_passed
     
     # Summary
     print(f"\n=== TEST SUMMARY ===")
     print(f"Total tests: {tests_passed + tests_failed}")
     print(f"Passed: {tests_passed}")
     print(f"Failed: {tests_failed}")
+    print(f"Slowest: {', '.join(f'{r.name} ({r.seconds * 1000:.1f} ms)' for r in slowest(results))}")
     
     if tests_failed == 0:
         print("\n✅ All tests passed! Database is properly seeded.")
@@ -192,11 +80,26 @@ def run_tests(conn):
     return tests_failed == 0
 
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Validate seeded TotHub data')
+    parser.add_argument('--json', metavar='PATH', help='Write results as JSON')
+    parser.add_argument('--junit', metavar='PATH', help='Write results as JUnit XML')
+    parser.add_argument('--plans', choices=['plan', 'analyze'],
+                        help='Record query plans (analyze also counts rows examined)')
+    args = parser.parse_args()
+    
     try:
         conn = psycopg2.connect(DATABASE_URL)
-        success = run_tests(conn)
+        report = ResultSet('test_seed_data')
+        success = run_tests(conn, report, args.plans)
         conn.close()
         
+        if args.json:
+            report.write_json(args.json)
+        if args.junit:
+            report.write_junit(args.junit)
+        
         if not success:
             exit(1)
             
@@ -207,4 +110,4 @@ def main():
         exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Seed data validation for TotHub
+Row-count, orphan and data-quality checks compiled into a single UNION ALL
+query, so a full validation is one round trip instead of one per check.
+Each branch stamps clock_timestamp() as it finishes, which gives per-check
+runtimes from that one query. Row counts can come from the planner's
+pg_class.reltuples estimate instead of a full scan when exact counts are
+not needed.
+
+For hourly runs against production replicas, checks can instead run
+concurrently over a connection pool, and violation checks on large tables
+can scan a TABLESAMPLE; a clean sample reports an upper bound on the
+violation rate at a chosen confidence level.
+
+Usage:
+    python validation.py              # exact counts
+    python validation.py --estimate   # catalog estimates for row counts
+    python validation.py --parallel 4 --sample --estimate
+    python validation.py --incremental [--full-sweep]
+"""
+
+import operator
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from check_results import CheckResult, ResultSet
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+
+OPS: Dict[str, Callable[[float, float], bool]] = {
+    '==': operator.eq, '>=': operator.ge, '>': operator.gt,
+    '<=': operator.le, '<': operator.lt,
+}
+
+
+@dataclass
+class Check:
+    """
+    One validation check: a scalar SQL expression compared with an expectation.
+
+    `sql` must be a SELECT returning one number (a count). When `estimate_sql`
+    is set, it is used instead of `sql` if exact counts are not requested.
+    Messages are format strings with {value} and {expected} fields.
+
+    Checks built from a `table` (aliased t) and a row `predicate` that must
+    match no rows can be answered from a TABLESAMPLE of the table.
+    """
+    name: str
+    sql: str
+    tables: Tuple[str, ...]
+    op: str = '=='
+    expected: float = 0
+    group: str = ''
+    ok_message: str = ''
+    fail_message: str = ''
+    estimate_sql: Optional[str] = None
+    table: Optional[str] = None
+    predicate: Optional[str] = None
+    id_range: Optional[Tuple[int, int]] = None  # (after id, up to id) for incremental runs
+
+    def passes(self, value: float) -> bool:
+        return OPS[self.op](value, self.expected)
+
+    @property
+    def sampleable(self) -> bool:
+        return bool(self.table and self.predicate) and (self.op, self.expected) == ('==', 0)
+
+
+def describe(check: Check, status: str, value: Optional[float], estimated: bool = False,
+             details: Optional[Dict] = None, error: Optional[str] = None) -> str:
+    """Human-readable message for a check outcome"""
+    if error:
+        return f"{check.name}: {error}"
+    details = details or {}
+    template = check.ok_message if status == 'passed' else check.fail_message
+    shown = f"~{value:,.0f}" if estimated else f"{value:,.0f}"
+    message = template.format(value=shown, expected=f"{check.op} {check.expected:g}")
+    if 'sample_percent' in details:
+        message += f" [sampled {details['sampled_rows']:,} rows ({details['sample_percent']:.2g}%)"
+        if status == 'passed':
+            message += f"; rate < {details['rate_bound']:.3%} at {details['confidence']:.0%} confidence"
+        else:
+            message += f"; ~{value * 100 / details['sample_percent']:,.0f} in the whole table"
+        message += "]"
+    if check.id_range:
+        low, high = check.id_range
+        message += f" [ids {low + 1:,}-{high:,}]" if high > low else " [no new rows]"
+    return message
+
+
+def _result(check: Check, value, seconds: float, estimated: bool = False,
+            rows_examined: Optional[int] = None, **details) -> CheckResult:
+    value = float(value) if value is not None else 0.0
+    status = 'passed' if check.passes(value) else 'failed'
+    if estimated:
+        details['estimated'] = True
+    if check.id_range:
+        details['id_range'] = list(check.id_range)
+    return CheckResult(check.name, status, seconds, check.group,
+                       describe(check, status, value, estimated, details), value,
+                       rows_examined=rows_examined, details=details)
+
+
+def _error(check: Check, error: str, seconds: float = 0.0) -> CheckResult:
+    return CheckResult(check.name, 'error', seconds, check.group, describe(check, 'error', None, error=error),
+                       error=error)
+
+
+def row_count(table: str, op: str = '>', expected: float = 0, group: str = 'Row counts') -> Check:
+    """Check a table's row count; may be answered from catalog estimates"""
+    expectation = '' if (op, expected) == ('>', 0) else ' (expected {expected})'
+    return Check(
+        name=f"row_count.{table}",
+        sql=f"SELECT COUNT(*) FROM {table}",
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        estimate_sql=(f"SELECT CASE WHEN c.reltuples >= 0 THEN c.reltuples::bigint "
+                      f"ELSE (SELECT COUNT(*) FROM {table}) END "
+                      f"FROM pg_class c WHERE c.oid = '{table}'::regclass"),
+        tables=(table,), op=op, expected=expected, group=group,
+        ok_message=f"{table}: {{value}} records" + expectation,
+        fail_message=(f"{table}: No records found" if (op, expected) == ('>', 0)
+                      else f"{table}: {{value}} records (expected {{expected}})"),
+    )
+
+
+def orphans(table: str, column: str, ref_table: str, ref_column: str = 'id',
+            label: Optional[str] = None, ref_label: Optional[str] = None,
+            group: str = 'Foreign keys') -> Check:
+    """Count rows whose non-null `column` has no matching `ref_table` row"""
+    label = label or f"{table} records"
+    ref_label = ref_label or ref_table
+    predicate = (f"t.{column} IS NOT NULL AND NOT EXISTS "
+                 f"(SELECT 1 FROM {ref_table} r WHERE r.{ref_column} = t.{column})")
+    return Check(
+        name=f"orphans.{table}.{column}",
+        sql=f"SELECT COUNT(*) FROM {table} t WHERE {predicate}",
+        tables=(table, ref_table), group=group, table=table, predicate=predicate,
+        ok_message=f"All {label} have valid {ref_label} references",
+        fail_message=f"{{value}} {label} have invalid {ref_label} references",
+    )
+
+
+def violations(name: str, table: str, predicate: str, ok_message: str, fail_message: str,
+               group: str = 'Data quality') -> Check:
+    """Count rows matching `predicate`; passes when there are none"""
+    return Check(name=name, sql=f"SELECT COUNT(*) FROM {table} t WHERE {predicate}",
+                 tables=(table,), group=group, ok_message=ok_message, fail_message=fail_message,
+                 table=table, predicate=predicate)
+
+
+def matching(name: str, table: str, predicate: str, op: str, expected: float,
+             ok_message: str, fail_message: str, group: str = 'Data quality') -> Check:
+    """Count rows matching `predicate` and compare the count with `expected`"""
+    return Check(name=name, sql=f"SELECT COUNT(*) FROM {table} t WHERE {predicate}",
+                 tables=(table,), op=op, expected=expected, group=group,
+                 ok_message=ok_message, fail_message=fail_message,
+                 table=table, predicate=predicate)
+
+
+def _check_sql(check: Check, exact: bool) -> Tuple[str, bool]:
+    if not exact and check.estimate_sql:
+        return check.estimate_sql, True
+    return check.sql, False
+
+
+def compile_checks(checks: Sequence[Check], exact: bool = True) -> str:
+    """
+    Build one UNION ALL query over all checks.
+
+    Every branch is a scalar subquery with no FROM clause, so the branches
+    run in order and clock_timestamp() is read as each one finishes. Row 0
+    is the start time; a check's runtime is its timestamp minus the
+    previous row's.
+    """
+    branches = ["SELECT 0 AS ordinal, NULL::numeric AS value, clock_timestamp() AS finished"]
+    for ordinal, check in enumerate(checks, 1):
+        sql, _ = _check_sql(check, exact)
+        branches.append(f"SELECT {ordinal}, ({sql})::numeric, clock_timestamp()")
+    return '\nUNION ALL\n'.join(branches)
+
+
+def existing_tables(conn, tables: Sequence[str]) -> set:
+    cur = conn.cursor()
+    cur.execute("SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass(t) IS NOT NULL",
+                (sorted(set(tables)),))
+    found = {row[0] for row in cur.fetchall()}
+    conn.commit()
+    return found
+
+
+def _run_one(conn, check: Check, exact: bool) -> CheckResult:
+    """Fallback: run a single check on its own so one broken check can't hide the rest"""
+    sql, estimated = _check_sql(check, exact)
+    cur = conn.cursor()
+    start = time.perf_counter()
+    try:
+        cur.execute(sql)
+        value = cur.fetchone()[0]
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        return _error(check, str(e).strip(), time.perf_counter() - start)
+    return _result(check, value, time.perf_counter() - start, estimated)
+
+
+SCAN_NODES = ('Seq Scan', 'Index Scan', 'Index Only Scan', 'Bitmap Heap Scan', 'Sample Scan',
+              'Tid Scan', 'Tid Range Scan')
+
+
+def _rows_examined(node: Dict) -> int:
+    """Rows read by the scan nodes of an EXPLAIN ANALYZE plan, including filtered ones"""
+    rows = 0
+    if node['Node Type'] in SCAN_NODES and 'Actual Rows' in node:
+        read = node['Actual Rows'] + node.get('Rows Removed by Filter', 0)
+        rows += round(read * node.get('Actual Loops', 1))
+    return rows + sum(_rows_examined(child) for child in node.get('Plans', []))
+
+
+def _plan_text(node: Dict, depth: int = 0) -> str:
+    label = node['Node Type']
+    if 'Relation Name' in node:
+        label += f" on {node['Relation Name']}"
+    if 'Index Name' in node:
+        label += f" using {node['Index Name']}"
+    if 'Actual Rows' in node:
+        label += f" (actual rows={node['Actual Rows']} loops={node.get('Actual Loops', 1)})"
+    else:
+        label += f" (rows={node.get('Plan Rows')})"
+    lines = [('  ' * depth) + ('-> ' if depth else '') + label]
+    lines += [_plan_text(child, depth + 1) for child in node.get('Plans', [])]
+    return '\n'.join(lines)
+
+
+def explain_checks(conn, checks: Sequence[Check], results: Sequence[CheckResult],
+                   analyze: bool = True, exact: bool = True) -> None:
+    """
+    Attach each check's query plan to its result.
+
+    With `analyze`, the check runs again under EXPLAIN ANALYZE and the rows
+    its scans read are recorded as rows_examined. Sampled and errored
+    checks are left alone.
+    """
+    option = 'ANALYZE, ' if analyze else ''
+    for check, result in zip(checks, results):
+        if result.status == 'error' or 'sample_percent' in result.details:
+            continue
+        cur = conn.cursor()
+        try:
+            cur.execute(f"EXPLAIN ({option}FORMAT JSON) {_check_sql(check, exact)[0]}")
+            plan = cur.fetchone()[0][0]['Plan']
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            result.details['plan_error'] = str(e).strip()
+            continue
+        result.plan = _plan_text(plan)
+        if analyze and result.rows_examined is None:
+            result.rows_examined = _rows_examined(plan)
+
+
+def run_checks(conn, checks: Sequence[Check], exact: bool = True) -> List[CheckResult]:
+    """
+    Run checks in one round trip and time each one.
+
+    Checks on missing tables are reported as errors. If the combined query
+    fails (e.g. a missing column), the checks are re-run one at a time so
+    the failure is pinned to the check that caused it.
+
+    Args:
+        conn: psycopg2 connection
+        checks: Checks to run
+        exact: False to answer row-count checks from catalog estimates
+
+    Returns:
+        One CheckResult per check, in order
+    """
+    found = existing_tables(conn, [table for check in checks for table in check.tables])
+    runnable = [check for check in checks if all(table in found for table in check.tables)]
+    results: Dict[str, CheckResult] = {}
+    for check in checks:
+        if check not in runnable:
+            missing = ', '.join(table for table in check.tables if table not in found)
+            results[check.name] = _error(check, f"table does not exist: {missing}")
+
+    if runnable:
+        cur = conn.cursor()
+        try:
+            cur.execute(compile_checks(runnable, exact))
+            rows = sorted(cur.fetchall())
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            rows = None
+        if rows is None:
+            for check in runnable:
+                results[check.name] = _run_one(conn, check, exact)
+        else:
+            previous = rows[0][2]
+            for (ordinal, value, finished), check in zip(rows[1:], runnable):
+                results[check.name] = _result(check, value, (finished - previous).total_seconds(),
+                                              _check_sql(check, exact)[1])
+                previous = finished
+    return [results[check.name] for check in checks]
+
+
+def rate_upper_bound(sampled_rows: int, confidence: float = 0.95) -> float:
+    """
+    Upper bound on the violation rate when a sample of `sampled_rows` had none.
+
+    Solves (1 - p)^n = 1 - confidence; at 95% this is the rule of three,
+    p ~ 3/n. Rows are assumed independent, which TABLESAMPLE SYSTEM (whole
+    pages) only approximates when violations cluster by insertion order.
+    """
+    if sampled_rows <= 0:
+        return 1.0
+    return 1 - (1 - confidence) ** (1 / sampled_rows)
+
+
+def table_estimates(conn, tables: Sequence[str]) -> Dict[str, float]:
+    """Planner row estimates from pg_class (-1 for never-analyzed tables)"""
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT t, c.reltuples FROM unnest(%s::text[]) AS t
+        JOIN pg_class c ON c.oid = to_regclass(t)
+    """, (sorted(set(tables)),))
+    estimates = {table: float(rows) for table, rows in cur.fetchall()}
+    conn.commit()
+    return estimates
+
+
+def _run_sampled(conn, check: Check, percent: float, confidence: float,
+                 method: str) -> CheckResult:
+    cur = conn.cursor()
+    start = time.perf_counter()
+    try:
+        cur.execute(f"""
+            SELECT COUNT(*) FILTER (WHERE {check.predicate}), COUNT(*)
+            FROM {check.table} t TABLESAMPLE {method} (%s)
+        """, (percent,))
+        violations_found, examined = cur.fetchone()
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        return _error(check, str(e).strip(), time.perf_counter() - start)
+    return _result(check, violations_found, time.perf_counter() - start, rows_examined=examined,
+                   sampled_rows=examined, sample_percent=percent, confidence=confidence,
+                   rate_bound=rate_upper_bound(examined, confidence))
+
+
+def run_checks_parallel(dsn: str, checks: Sequence[Check], max_workers: int = 4,
+                        exact: bool = True, sample: bool = False, sample_rows: int = 100000,
+                        sample_min_rows: int = 1000000, confidence: float = 0.95,
+                        sample_method: str = 'SYSTEM', statement_timeout_ms: int = 0) -> List[CheckResult]:
+    """
+    Run checks concurrently, one per pooled connection.
+
+    Sessions are read-only so this is safe against a replica. With
+    `sample`, sampleable checks on tables estimated at `sample_min_rows` or
+    more scan roughly `sample_rows` rows via TABLESAMPLE; any violation
+    found still fails the check, and a clean sample reports the violation
+    rate bound at `confidence`.
+
+    Args:
+        dsn: Connection string
+        checks: Checks to run
+        max_workers: Connections in the pool / checks in flight
+        exact: False to answer row-count checks from catalog estimates
+        sample: Sample large tables instead of scanning them
+        sample_method: SYSTEM (whole pages, least I/O) or BERNOULLI (per row)
+        statement_timeout_ms: Per-check timeout, 0 for none
+
+    Returns:
+        One CheckResult per check, in order
+    """
+    from psycopg2.pool import ThreadedConnectionPool
+
+    pool = ThreadedConnectionPool(1, max_workers, dsn)
+    try:
+        conn = pool.getconn()
+        try:
+            found = existing_tables(conn, [table for check in checks for table in check.tables])
+            estimates = table_estimates(conn, [c.table for c in checks if c.table]) if sample else {}
+        finally:
+            pool.putconn(conn)
+
+        def run(check: Check) -> CheckResult:
+            missing = [table for table in check.tables if table not in found]
+            if missing:
+                return _error(check, f"table does not exist: {', '.join(missing)}")
+            conn = pool.getconn()
+            try:
+                conn.set_session(readonly=True)
+                if statement_timeout_ms:
+                    conn.cursor().execute("SET statement_timeout = %s", (statement_timeout_ms,))
+                    conn.commit()
+                rows = estimates.get(check.table, -1)
+                if sample and check.sampleable and rows >= sample_min_rows:
+                    percent = min(100.0, 100.0 * sample_rows / rows)
+                    return _run_sampled(conn, check, percent, confidence, sample_method)
+                return _run_one(conn, check, exact)
+            finally:
+                pool.putconn(conn)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, checks))
+    finally:
+        pool.closeall()
+
+
+def print_results(results: Sequence[CheckResult], numbered: bool = False, indent: str = '') -> None:
+    """Print results grouped under their check group headings"""
+    group = None
+    number = 0
+    for result in results:
+        if result.group != group:
+            group = result.group
+            number += 1
+            heading = f"{number}. {group.upper()} TESTS" if numbered else f"=== {group} ==="
+            print(f"\n{heading}")
+        mark = '✓' if result.passed else '✗'
+        print(f"{indent}{mark} {result.message} ({result.seconds * 1000:.1f} ms)")
+
+
+def slowest(results: Sequence[CheckResult], limit: int = 3) -> List[CheckResult]:
+    return sorted(results, key=lambda r: r.seconds, reverse=True)[:limit]
+
+
+SEED_CHECKS = [
+    *(row_count(table) for table in ('settings', 'staff', 'parents', 'children', 'attendance',
+                                     'billing', 'messages', 'alerts', 'documents', 'room_schedules')),
+    orphans('children', 'parent_id', 'parents', label='children', ref_label='parent'),
+    orphans('attendance', 'child_id', 'children', label='attendance records', ref_label='child'),
+    orphans('attendance', 'checked_in_by', 'staff', label='check-ins', ref_label='staff'),
+    orphans('billing', 'child_id', 'children', label='billing records', ref_label='child'),
+    violations('mood_rating_range', 'attendance', 'mood_rating NOT BETWEEN 1 AND 5',
+               "All mood ratings are valid (1-5)",
+               "{value} attendance records have invalid mood ratings"),
+    violations('checkout_after_checkin', 'attendance',
+               'check_out_time IS NOT NULL AND check_out_time <= check_in_time',
+               "All check-out times are after check-in times",
+               "{value} records have check-out before check-in", group='Business logic'),
+    violations('positive_billing_amounts', 'billing', 'amount_due <= 0',
+               "All billing amounts are positive",
+               "{value} billing records have non-positive amounts", group='Business logic'),
+]
+
+
+def main():
+    import argparse
+    import psycopg2
+
+    parser = argparse.ArgumentParser(description='Validate TotHub seed data')
+    parser.add_argument('--estimate', action='store_true',
+                        help='Use catalog row estimates instead of exact counts')
+    parser.add_argument('--parallel', type=int, metavar='N',
+                        help='Run checks concurrently on N pooled connections')
+    parser.add_argument('--sample', action='store_true',
+                        help='With --parallel, sample large tables with TABLESAMPLE')
+    parser.add_argument('--sample-rows', type=int, default=100000, help='Target rows per sample')
+    parser.add_argument('--sample-min-rows', type=int, default=1000000,
+                        help='Only sample tables estimated at this many rows or more')
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--sample-method', choices=['SYSTEM', 'BERNOULLI'], default='SYSTEM')
+    parser.add_argument('--statement-timeout', type=int, default=0, metavar='MS')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only check rows added since the last run (see watermarks.py)')
+    parser.add_argument('--full-sweep', action='store_true',
+                        help='With --incremental, check every row and reset the watermarks')
+    parser.add_argument('--full-sweep-hours', type=float, default=None,
+                        help='With --incremental, sweep everything when the last sweep is older')
+    parser.add_argument('--watermarks', help='Watermark file (default validation_watermarks.json)')
+    parser.add_argument('--plans', choices=['plan', 'analyze'],
+                        help='Record each check\'s query plan (analyze also counts rows examined)')
+    parser.add_argument('--json', metavar='PATH', help='Write results as JSON')
+    parser.add_argument('--junit', metavar='PATH', help='Write results as JUnit XML')
+    args = parser.parse_args()
+
+    if not DATABASE_URL:
+        print("Error: DATABASE_URL environment variable not set")
+        return 1
+
+    start = time.perf_counter()
+    checks = SEED_CHECKS
+    if args.incremental:
+        from watermarks import (DEFAULT_FULL_SWEEP_HOURS, DEFAULT_PATH, WatermarkStore,
+                                database_key, full_sweep_due, plan_incremental, record_results)
+        store = WatermarkStore(args.watermarks or DEFAULT_PATH)
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            full = args.full_sweep or full_sweep_due(
+                store, database_key(conn), args.full_sweep_hours or DEFAULT_FULL_SWEEP_HOURS)
+            checks, targets = plan_incremental(conn, SEED_CHECKS, store, full)
+        finally:
+            conn.close()
+        print(f"{'Full sweep' if full else 'Incremental run'} (watermarks: {store.path})")
+    if args.parallel:
+        results = run_checks_parallel(
+            DATABASE_URL, checks, args.parallel, exact=not args.estimate, sample=args.sample,
+            sample_rows=args.sample_rows, sample_min_rows=args.sample_min_rows,
+            confidence=args.confidence, sample_method=args.sample_method,
+            statement_timeout_ms=args.statement_timeout)
+    else:
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            results = run_checks(conn, checks, exact=not args.estimate)
+        finally:
+            conn.close()
+    if args.incremental:
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            record_results(conn, store, results, targets, full)
+        finally:
+            conn.close()
+    wall = time.perf_counter() - start
+    if args.plans:
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            explain_checks(conn, checks, results, analyze=args.plans == 'analyze', exact=not args.estimate)
+        finally:
+            conn.close()
+
+    print_results(results)
+    report = ResultSet('validation', list(results), metadata={
+        'mode': 'parallel' if args.parallel else 'single-query',
+        'exact': not args.estimate, 'sampled': bool(args.sample),
+        'incremental': bool(args.incremental), 'wall_seconds': round(wall, 6)})
+    if args.json:
+        report.write_json(args.json)
+    if args.junit:
+        report.write_junit(args.junit)
+    failed = [r for r in results if not r.passed]
+    print(f"\n{len(results) - len(failed)}/{len(results)} checks passed in {wall:.2f}s; slowest: "
+          + ', '.join(f"{r.name} {r.seconds * 1000:.0f} ms" for r in slowest(results)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
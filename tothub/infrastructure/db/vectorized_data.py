@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Vectorized synthetic data for TotHub
+Same dataset model as synthetic_data.py, but names, addresses and phones
+come from pools sampled from Faker once, and attendance and billing columns
+are built with NumPy a whole day (or month) at a time and rendered straight
+into COPY text. Falls back to the per-row generators when NumPy is missing.
+"""
+
+import itertools
+import random
+import zlib
+from datetime import date, timedelta
+from typing import Iterator, List, Sequence
+
+from faker import Faker
+
+from synthetic_data import (ACTIVITIES, CLOSING_MINUTE, MOOD_WEIGHTS, MOODS,
+                            ROOM_ORDER, ROOMS, ScaleConfig, SyntheticDataset, month_starts,
+                            us_holidays)
+
+try:
+    import numpy as np
+except ImportError:  # optional 'seed' extra: make_dataset() falls back to SyntheticDataset
+    np = None
+
+NULL = '\\N'
+MINUTE_TEXT = [f"{m // 60:02d}:{m % 60:02d}:00" for m in range(24 * 60)]
+# Temperatures 95.0 - 102.9 in 0.1 steps
+TEMPERATURE_TEXT = [f"{95 + i / 10:.1f}" for i in range(80)]
+
+
+def _array_text(values: Sequence[str]) -> str:
+    """Postgres array literal as it must appear in COPY text"""
+    return '{' + ','.join(f'"{v}"' for v in values) + '}'
+
+
+class FakePools:
+    """
+    Values sampled once from Faker and reused.
+
+    Offers the handful of Faker methods the generators call, drawing from
+    the pools with a seeded random.Random, so it can stand in for a Faker
+    instance.
+    """
+
+    def __init__(self, seed: str, size: int = 2000):
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.first_names_female = [fake.first_name_female() for _ in range(size // 2)]
+        self.first_names_male = [fake.first_name_male() for _ in range(size // 2)]
+        self.first_names = self.first_names_female + self.first_names_male
+        self.last_names = [fake.last_name() for _ in range(size)]
+        self.addresses = [fake.address() for _ in range(size)]
+        self.phones = [fake.phone_number() for _ in range(size)]
+        self._rng = random.Random(seed)
+
+    def first_name(self) -> str:
+        return self._rng.choice(self.first_names)
+
+    def first_name_female(self) -> str:
+        return self._rng.choice(self.first_names_female)
+
+    def first_name_male(self) -> str:
+        return self._rng.choice(self.first_names_male)
+
+    def last_name(self) -> str:
+        return self._rng.choice(self.last_names)
+
+    def name(self) -> str:
+        return f"{self.first_name()} {self.last_name()}"
+
+    def address(self) -> str:
+        return self._rng.choice(self.addresses)
+
+    def phone_number(self) -> str:
+        return self._rng.choice(self.phones)
+
+    def date_of_birth(self, minimum_age: int = 0, maximum_age: int = 115) -> date:
+        today = date.today()
+        return today - timedelta(days=self._rng.randint(minimum_age * 365, maximum_age * 365 + 364))
+
+
+class VectorizedDataset(SyntheticDataset):
+    """
+    SyntheticDataset with pooled fake values and NumPy-built columns.
+
+    Enrollment planning is shared with SyntheticDataset; attendance and
+    billing are generated per day/month across all children at once.
+    The output is deterministic for a seed, but not identical to the
+    per-row generator's output for the same seed.
+    """
+
+    def __init__(self, config: ScaleConfig):
+        super().__init__(config)
+        self._pools = FakePools(f"{config.seed}-pools")
+
+    def _faker(self, stream: str):
+        self._pools._rng = random.Random(f"{self.config.seed}-{stream}")
+        return self._pools
+
+    def _np_rng(self, stream: str):
+        return np.random.default_rng([self.config.seed, zlib.crc32(stream.encode())])
+
+    def _child_arrays(self, child_ids: Sequence):
+        children = self.children
+        never = date.max.toordinal()
+        return {
+            'id': np.array([str(i) for i in child_ids], dtype=object),
+            'center': np.array([c.center for c in children]),
+            'enrolled': np.array([c.enrollment_date.toordinal() for c in children]),
+            'withdrawn': np.array([c.withdrawal_date.toordinal() if c.withdrawal_date else never
+                                   for c in children]),
+            'weekdays': np.array([sum(1 << d for d in c.weekdays) for c in children]),
+            'arrival': np.array([c.arrival_minute for c in children]),
+            'stay': np.array([c.stay_minutes for c in children]),
+        }
+
+    def _room_codes(self, on: date):
+        return np.array([ROOM_ORDER.index(c.room(on)) for c in self.children], dtype=np.int8)
+
+    def attendance_copy_chunks(self, child_ids: Sequence, staff_ids: Sequence,
+                               rows_per_chunk: int = 50000) -> Iterator[str]:
+        """
+        Attendance as COPY text (ATTENDANCE_COLUMNS order), one chunk per
+        ~rows_per_chunk rows.
+
+        Same model as SyntheticDataset.attendance_rows: holidays, part-time
+        schedules, two vacation weeks a year and winter-heavy sick spells.
+        """
+        rng = self._np_rng('attendance')
+        config = self.config
+        n = len(self.children)
+        arrays = self._child_arrays(child_ids)
+        staff = np.array([str(s) for s in staff_ids], dtype=object).reshape(
+            config.centers, config.staff_per_center)
+        first_year = config.start_date.year
+        years = config.end_date.year - first_year + 1
+        vacation = rng.integers(1, 53, size=(years, n, 2))
+        sick_left = np.zeros(n, dtype=np.int64)
+        sick_lengths = np.array([0, 1, 1, 2, 3])
+        holidays = set()
+        for year in range(first_year, config.end_date.year + 1):
+            holidays |= us_holidays(year)
+
+        mood_text = np.array(MOODS, dtype=object)
+        rating_text = np.array([str(i + 1) for i in range(len(MOODS))], dtype=object)
+        temperature_text = np.array(TEMPERATURE_TEXT, dtype=object)
+        combos = [[_array_text(c) for c in itertools.permutations(ACTIVITIES[room], 3)]
+                  for room in ROOM_ORDER]
+        combo_counts = np.array([len(c) for c in combos])
+        combo_table = np.full((len(ROOM_ORDER), combo_counts.max()), '', dtype=object)
+        for code, room_combos in enumerate(combos):
+            combo_table[code, :len(room_combos)] = room_combos
+
+        parts: List[str] = []
+        pending = 0
+        month, rooms = None, None
+        day = config.start_date
+        while day <= config.end_date:
+            if day.weekday() >= 5 or day in holidays:
+                day += timedelta(days=1)
+                continue
+            if (day.year, day.month) != month:
+                month = (day.year, day.month)
+                rooms = self._room_codes(day.replace(day=1))
+            ordinal = day.toordinal()
+            week = day.isocalendar()[1]
+            sick_rate = 0.02 + 0.025 * (1 + np.cos((day.timetuple().tm_yday - 15) / 365 * 2 * np.pi))
+
+            scheduled = ((arrays['enrolled'] <= ordinal) & (ordinal < arrays['withdrawn'])
+                         & ((arrays['weekdays'] >> day.weekday()) & 1).astype(bool))
+            on_vacation = (vacation[day.year - first_year] == week).any(axis=1)
+            candidates = scheduled & ~on_vacation
+            still_sick = candidates & (sick_left > 0)
+            sick_left[still_sick] -= 1
+            falls_sick = candidates & ~still_sick & (rng.random(n) < sick_rate)
+            sick_left[falls_sick] = rng.choice(sick_lengths, size=int(falls_sick.sum()))
+            present = np.flatnonzero(candidates & ~still_sick & ~falls_sick)
+            m = len(present)
+            if m:
+                arrival = np.clip(arrays['arrival'][present] + np.rint(rng.normal(0, 8, m)).astype(int),
+                                  0, 24 * 60 - 1)
+                departure = np.clip(arrival + arrays['stay'][present]
+                                    + np.rint(rng.normal(0, 15, m)).astype(int), 0, CLOSING_MINUTE)
+                centers = arrays['center'][present]
+                mood = rng.choice(len(MOODS), size=m, p=MOOD_WEIGHTS)
+                room = rooms[present]
+                combo = (rng.random(m) * combo_counts[room]).astype(int)
+                temperature = np.clip(np.rint((rng.normal(98.4, 0.4, m) - 95) * 10).astype(int),
+                                      0, len(TEMPERATURE_TEXT) - 1)
+                checked_in_by = staff[centers, rng.integers(0, config.staff_per_center, m)]
+                checked_out_by = staff[centers, rng.integers(0, config.staff_per_center, m)]
+
+                prefix = f"{day.isoformat()} "
+                today = day == config.end_date
+                columns = [
+                    arrays['id'][present],
+                    itertools.repeat(day.isoformat()),
+                    [prefix + MINUTE_TEXT[a] for a in arrival.tolist()],
+                    itertools.repeat(NULL) if today else [prefix + MINUTE_TEXT[d] for d in departure.tolist()],
+                    checked_in_by,
+                    itertools.repeat(NULL) if today else checked_out_by,
+                    itertools.repeat('present'),
+                    itertools.repeat(NULL),
+                    mood_text[mood],
+                    rating_text[mood],
+                    combo_table[room, combo],
+                    temperature_text[temperature],
+                    itertools.repeat(NULL),
+                ]
+                parts.append('\n'.join(map('\t'.join, zip(*columns))) + '\n')
+                pending += m
+            if pending >= rows_per_chunk:
+                yield ''.join(parts)
+                parts, pending = [], 0
+            day += timedelta(days=1)
+        if parts:
+            yield ''.join(parts)
+
+    def billing_copy_chunks(self, child_ids: Sequence, rows_per_chunk: int = 50000) -> Iterator[str]:
+        """Monthly invoices as COPY text (BILLING_COLUMNS order)"""
+        rng = self._np_rng('billing')
+        config = self.config
+        arrays = self._child_arrays(child_ids)
+        tuition = np.array([ROOMS[room]['tuition'] for room in ROOM_ORDER])
+        factor = np.array([c.tuition_factor for c in self.children])
+        habit = np.array([['on_time', 'late', 'delinquent'].index(self.families[c.family].payment_habit)
+                          for c in self.children])
+        methods = np.array(['credit_card', 'ach', 'check'], dtype=object)
+        padded_ids = np.array([str(i).zfill(6) for i in child_ids], dtype=object)
+
+        parts: List[str] = []
+        pending = 0
+        for billing_date in month_starts(config.start_date, config.end_date):
+            ordinal = billing_date.toordinal()
+            billed = np.flatnonzero((arrays['enrolled'] <= ordinal) & (ordinal < arrays['withdrawn']))
+            m = len(billed)
+            if not m:
+                continue
+            years_in = (billing_date - config.start_date).days // 365
+            rooms = self._room_codes(billing_date)[billed]
+            amount = np.rint(tuition[rooms] * factor[billed] * 1.03 ** years_in).astype(int)
+            current = (billing_date.year, billing_date.month) == (config.end_date.year, config.end_date.month)
+            roll = rng.random(m)
+            pending_now = roll < 0.6 if current else np.zeros(m, dtype=bool)
+            overdue = ~pending_now & (habit[billed] == 2) & (rng.random(m) < 0.4)
+            paid = ~pending_now & ~overdue
+            pay_day = np.where(habit[billed] == 1, rng.integers(6, 21, m), rng.integers(1, 6, m))
+            late_fee = np.where(overdue | (paid & (pay_day > 5)), 50, 0)
+
+            prefix = billing_date.strftime('%Y%m')
+            paid_list = paid.tolist()
+            pay_dates = [(billing_date + timedelta(days=int(d))).isoformat() if p else NULL
+                         for d, p in zip(pay_day.tolist(), paid_list)]
+            method = methods[rng.integers(0, len(methods), m)]
+            columns = [
+                arrays['id'][billed],
+                itertools.repeat(billing_date.isoformat()),
+                itertools.repeat((billing_date + timedelta(days=5)).isoformat()),
+                amount.astype(str),
+                np.where(paid, amount + late_fee, 0).astype(str),
+                pay_dates,
+                [mth if p else NULL for mth, p in zip(method, paid_list)],
+                [f"INV-{prefix}-{pid}" for pid in padded_ids[billed]],
+                np.where(paid, 'paid', np.where(overdue, 'overdue', 'pending')),
+                late_fee.astype(str),
+                itertools.repeat(NULL),
+            ]
+            parts.append('\n'.join(map('\t'.join, zip(*columns))) + '\n')
+            pending += m
+            if pending >= rows_per_chunk:
+                yield ''.join(parts)
+                parts, pending = [], 0
+        if parts:
+            yield ''.join(parts)
+
+    def attendance_rows(self, child_ids: List, staff_ids: List) -> Iterator[tuple]:
+        """Attendance as row tuples of COPY-formatted text (None for NULL)"""
+        for chunk in self.attendance_copy_chunks(child_ids, staff_ids):
+            for line in chunk.splitlines():
+                yield tuple(None if v == NULL else v for v in line.split('\t'))
+
+    def billing_rows(self, child_ids: List) -> Iterator[tuple]:
+        """Billing as row tuples of COPY-formatted text (None for NULL)"""
+        for chunk in self.billing_copy_chunks(child_ids):
+            for line in chunk.splitlines():
+                yield tuple(None if v == NULL else v for v in line.split('\t'))
+
+
+def make_dataset(config: ScaleConfig, vectorized: bool = True) -> SyntheticDataset:
+    """VectorizedDataset when NumPy is available (and wanted), else SyntheticDataset"""
+    if vectorized and np is not None:
+        return VectorizedDataset(config)
+    if vectorized:
+        print("⚠️  NumPy not installed (pip install '.[seed]'), using the per-row generators")
+    return SyntheticDataset(config)
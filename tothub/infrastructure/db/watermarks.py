@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Watermarks for incremental validation
+Remembers, per database and check, the highest row id already validated,
+so repeated runs of the orphan and range checks in validation.py only scan
+rows added since the last run. Watermarks live in a small JSON file.
+
+Ids are used rather than created_at: they are indexed, strictly increasing
+and never back-dated. Old rows that are later updated, and orphans created
+by deleting a referenced row, are not seen by an incremental run; a full
+sweep (forced, or automatic once the last one is older than
+full_sweep_hours) re-checks everything and resets the watermarks.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from validation import Check, CheckResult, existing_tables
+
+DEFAULT_PATH = Path(os.environ.get(
+    'TOTHUB_VALIDATION_WATERMARKS',
+    Path(__file__).resolve().parent / 'validation_watermarks.json'
+))
+DEFAULT_FULL_SWEEP_HOURS = 24 * 7
+
+
+def database_key(conn) -> str:
+    """Identify the database the watermarks belong to (host:port/dbname)"""
+    params = conn.get_dsn_parameters()
+    return f"{params.get('host', '')}:{params.get('port', '')}/{params.get('dbname', '')}"
+
+
+class WatermarkStore:
+    """
+    JSON file of {database: {'last_full_sweep': iso, 'checks': {name: {...}}}}.
+
+    Each check entry records the table, the last id validated and when.
+    Writes go to a temp file that replaces the store, so an interrupted run
+    never leaves a truncated file behind.
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.data: Dict[str, Dict] = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.data = json.load(f)
+
+    def database(self, key: str) -> Dict:
+        return self.data.setdefault(key, {'last_full_sweep': None, 'checks': {}})
+
+    def last_id(self, key: str, check: str) -> int:
+        return self.database(key)['checks'].get(check, {}).get('last_id', 0)
+
+    def advance(self, key: str, check: str, table: str, last_id: int) -> None:
+        self.database(key)['checks'][check] = {
+            'table': table,
+            'last_id': last_id,
+            'checked_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def last_full_sweep(self, key: str) -> Optional[datetime]:
+        value = self.database(key)['last_full_sweep']
+        return datetime.fromisoformat(value) if value else None
+
+    def mark_full_sweep(self, key: str) -> None:
+        self.database(key)['last_full_sweep'] = datetime.now().isoformat(timespec='seconds')
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix='.watermarks-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def max_ids(conn, tables: Sequence[str]) -> Dict[str, int]:
+    """Current max(id) of each table, in one query (index-only lookups)"""
+    tables = sorted(set(tables))
+    if not tables:
+        return {}
+    cur = conn.cursor()
+    cur.execute(' UNION ALL '.join(
+        f"SELECT '{table}', COALESCE(MAX(id), 0) FROM {table}" for table in tables
+    ))
+    highs = {table: int(high) for table, high in cur.fetchall()}
+    conn.commit()
+    return highs
+
+
+def full_sweep_due(store: WatermarkStore, key: str,
+                   full_sweep_hours: float = DEFAULT_FULL_SWEEP_HOURS) -> bool:
+    last = store.last_full_sweep(key)
+    return last is None or datetime.now() - last >= timedelta(hours=full_sweep_hours)
+
+
+def plan_incremental(conn, checks: Sequence[Check], store: WatermarkStore,
+                     full: bool = False) -> Tuple[List[Check], Dict[str, Tuple[str, int]]]:
+    """
+    Restrict row-level checks to rows above their watermark.
+
+    Checks that aren't row-level (row counts, totals) run unchanged. A
+    watermark above the table's current max id means the table was cleared
+    and re-seeded, so that check starts over from zero.
+
+    Args:
+        full: Check every row (a full sweep) but still record new watermarks
+
+    Returns:
+        (checks to run, {check name: (table, max id to record)})
+    """
+    key = database_key(conn)
+    row_level = [check for check in checks if check.sampleable]
+    highs = max_ids(conn, existing_tables(conn, [check.table for check in row_level]))
+    planned, targets = [], {}
+    for check in checks:
+        if check not in row_level or check.table not in highs:
+            planned.append(check)
+            continue
+        high = highs[check.table]
+        low = 0 if full else store.last_id(key, check.name)
+        if low > high:
+            low = 0
+        predicate = f"t.id > {low} AND t.id <= {high} AND ({check.predicate})"
+        # table is cleared so samplers leave the (usually small) increment alone
+        planned.append(replace(check, sql=f"SELECT COUNT(*) FROM {check.table} t WHERE {predicate}",
+                               table=None, predicate=None, id_range=(low, high)))
+        targets[check.name] = (check.table, high)
+    return planned, targets
+
+
+def record_results(conn, store: WatermarkStore, results: Sequence[CheckResult],
+                   targets: Dict[str, Tuple[str, int]], full: bool = False) -> None:
+    """
+    Advance watermarks for checks that passed and save the store.
+
+    Failed checks keep their old watermark, so the violating rows are
+    checked (and reported) again until they are fixed.
+    """
+    key = database_key(conn)
+    for result in results:
+        if result.passed and result.name in targets:
+            table, high = targets[result.name]
+            store.advance(key, result.name, table, high)
+    if full and all(result.status != 'error' for result in results):
+        store.mark_full_sweep(key)
+    store.save()
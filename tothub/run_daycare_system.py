@@ -9,7 +9,8 @@ import time
 import threading
 import signal
 import sys
-from daycare_client import perform_checkin, get_all_checkins, display_checkins, check_server_health
+from daycare_client import get_all_checkins, display_checkins, check_server_health, wait_for_server
+from daycare_bulk_client import bulk_checkin, print_report
 
 def run_server():
     """Run the Flask server in a separate process."""
@@ -21,13 +22,17 @@ def run_server():
         print(f"Failed to start server: {e}")
         return None
 
-def test_system():
+def test_system(server_process=None):
     """Test the complete system with sample data."""
     server_url = "http://localhost:5001"
     
-    # Wait for server to start
+    # Wait for server to start, polling /health instead of sleeping a fixed time
     print("Waiting for server to start...")
-    time.sleep(3)
+    time_to_ready = wait_for_server(server_url, timeout=30, process=server_process)
+    if time_to_ready is None:
+        print("Server failed to start properly")
+        return
+    print(f"Server ready in {time_to_ready:.2f}s")
     
     # Check server health
     if not check_server_health(server_url):
@@ -48,11 +53,10 @@ def test_system():
         "Director Jessica"
     ]
     
-    # Perform check-ins
+    # Perform check-ins concurrently
     print("1. Processing check-ins for daycare clients...")
-    for client in daycare_clients:
-        perform_checkin(server_url, client)
-        time.sleep(0.5)  # Small delay between requests
+    report = bulk_checkin(server_url, daycare_clients, concurrency=4)
+    print_report(report)
     
     print("\n2. Retrieving all check-in records...")
     checkins_data = get_all_checkins(server_url)
@@ -85,7 +89,7 @@ def main():
             return
         
         # Test the system
-        test_system()
+        test_system(server_process)
         
         print("\n=== System Test Complete ===")
         print("The Flask server is still running.")